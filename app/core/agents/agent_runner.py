@@ -16,17 +16,37 @@ FlowHandler는 직접 Agent를 호출하지 않고 항상 Runner를 통한다.
   attempt 1: agent.run() → 성공 → return
              agent.run() → RetryableError → on_retry 콜백 → sleep → attempt 2
   attempt N(=max_retry): 실패 → context.metadata["execution"] 기록 → raise RetryableError
+
+─── Cascade (card.json policy.cascade) ────────────────────────────────────
+  저렴·빠른 모델 tier를 먼저 1회씩 시도하고, 아래 경우에만 다음 tier로 escalate한다.
+    - validator 실패 (slot_ops, intent_scenario 등) / Pydantic 스키마 거부
+    - 결과에 _meta.parse_error (SlotFiller 파싱 실패) 또는 _reason="parse_error"
+    - tier 타임아웃 초과·예외
+  모든 tier가 실패하면 card의 기본 llm으로 기존 재시도 루프를 그대로 실행한다.
+  tier별 호출·escalation·지연 누적치는 tier_stats()로 조회한다.
+
+─── Hedge (card.json policy.hedge) ───────────────────────────────────────
+  멱등 에이전트는 관측 p90 안에 응답이 없으면 중복 요청을 보내 먼저 끝난 결과를 쓴다.
+  재시도 루프의 각 attempt 안에서 동작한다 (app/core/agents/hedging.py).
+
+─── Shadow 평가 ────────────────────────────────────────────────────────────
+  shadow_by_name에 등록된 에이전트는 성공 결과 반환 직전에 샘플링된 호출을
+  대체 설정 에이전트로 백그라운드 재실행해 비교한다 (app/core/agents/shadow.py).
+  운영 결과·지연에는 영향 없음.
 """
 
+import contextvars
+import threading
 import time
 import traceback
-from typing import Any, Callable, Dict, Generator, Optional
+from typing import Any, Callable, Dict, Generator, List, Optional
 
 from pydantic import ValidationError
 
 from app.core.agents.agent_result import AgentResult
 from app.core.context import ExecutionContext
 from app.core.events import EventType
+from app.core.llm.scheduler import current_session
 from app.core.logging import setup_logger
 from app.core.tracing import AgentRecord
 
@@ -52,6 +72,10 @@ class AgentRunner:
         _schema_registry: 스키마 이름 → Pydantic 모델 (결과 검증용)
         _validator_map:   검증 키 → 검증 함수 (lambda result: bool)
         _policy:          name → {schema, validate, max_retry, backoff_sec, timeout_sec}
+        _shadow:          name → ShadowEvaluator (card.json "shadow" 섹션이 있는 에이전트만)
+        _cascade:         name → [{"agent", "tier", "timeout_sec"}] 기본 llm 앞에 시도할 tier 목록
+                          (기본 llm은 마지막 tier로 집계되며, 그 "escalations"는 최종 실패 횟수)
+        _hedge:           name → HedgePolicy (card.json policy.hedge가 있는 에이전트만)
     """
 
     def __init__(
@@ -60,11 +84,19 @@ class AgentRunner:
         schema_registry: Optional[Dict[str, Any]] = None,
         validator_map: Optional[Dict[str, Callable]] = None,
         policy_by_name: Optional[Dict[str, Dict[str, Any]]] = None,
+        shadow_by_name: Optional[Dict[str, Any]] = None,
+        cascade_by_name: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        hedge_by_name: Optional[Dict[str, Any]] = None,
     ):
         self._agents = agents
         self._schema_registry = schema_registry or {}
         self._validator_map = validator_map or {}
         self._policy = policy_by_name or {}
+        self._shadow = shadow_by_name or {}
+        self._cascade = cascade_by_name or {}
+        self._hedge = hedge_by_name or {}
+        self._tier_stats: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._stats_lock = threading.Lock()
         self.logger = setup_logger("AgentRunner")
 
     def has_agent(self, name: str) -> bool:
@@ -108,32 +140,62 @@ class AgentRunner:
         backoff_sec = policy.get("backoff_sec", 1)
         timeout_sec = policy.get("timeout_sec")
 
+        def finalize(result: Any) -> Any:
+            if isinstance(result, AgentResult):
+                result = result.to_dict()
+            # 커스텀 검증 함수 (예: slot_ops, intent_scenario)
+            if validator and not validator(result):
+                raise RetryableError("validation_failed")
+            # Pydantic 스키마 검증 — dict 그대로 반환
+            if schema and schema in self._schema_registry:
+                result = self._schema_registry[schema].model_validate(result).model_dump()
+            return result
+
+        hedge = self._hedge.get(agent_name)
+
+        def invoke(target: Any) -> tuple:
+            # hedge 시 풀 스레드에서 실행되므로 토큰 사용량도 실행 스레드에서 함께 수집
+            if hasattr(target, "reset_usage"):
+                target.reset_usage()
+            # LLM 스케줄러의 세션 공정 큐잉용 — 실행 스레드에서 설정
+            token = current_session.set(context.session_id)
+            try:
+                out = target.run(context, **kwargs)
+            finally:
+                current_session.reset(token)
+            return out, (target.usage() if hasattr(target, "usage") else None)
+
+        cascade = self._cascade.get(agent_name)
+        final_tier = getattr(agent, "model", "default") if cascade else None
+        for tier in cascade or []:
+            result = self._run_tier(agent_name, tier, context, finalize, invoke)
+            if result is not None:
+                return result
+
         for attempt in range(1, max_retry + 1):
             started = time.monotonic()
             try:
-                result = agent.run(context, **kwargs)
-                if isinstance(result, AgentResult):
-                    result = result.to_dict()
+                result, usage = hedge.call(invoke, agent) if hedge else invoke(agent)
                 elapsed = time.monotonic() - started
 
                 # 타임아웃 체크 (실행 후 검사)
                 if timeout_sec and elapsed > timeout_sec:
                     raise RetryableError(f"timeout_exceeded: {elapsed:.2f}s > {timeout_sec}s")
 
-                # 커스텀 검증 함수 (예: slot_ops, intent_scenario)
-                if validator and not validator(result):
-                    raise RetryableError("validation_failed")
-
-                # Pydantic 스키마 검증 — dict 그대로 반환
-                if schema and schema in self._schema_registry:
-                    model = self._schema_registry[schema]
-                    result = model.model_validate(result).model_dump()
+                result = finalize(result)
+                elapsed_ms = round(elapsed * 1000, 1)
 
+                if final_tier:
+                    self._count_tier(agent_name, final_tier, elapsed_ms, escalated=False)
                 if context.tracer:
                     context.tracer.record(AgentRecord(
-                        agent=agent_name, elapsed_ms=round(elapsed * 1000, 1),
-                        success=True, retries=attempt - 1,
+                        agent=agent_name, elapsed_ms=elapsed_ms,
+                        success=True, retries=attempt - 1, tier=final_tier,
                     ))
+
+                shadow = self._shadow.get(agent_name)
+                if shadow:
+                    shadow.maybe_submit(agent_name, context, result, elapsed_ms, usage, finalize, kwargs)
                 return result
 
             except (RetryableError, ValidationError) as e:
@@ -144,11 +206,13 @@ class AgentRunner:
                     context.metadata["execution"] = {
                         "agent": agent_name, "error": str(e), "attempt": attempt,
                     }
+                    elapsed_ms = round((time.monotonic() - started) * 1000, 1)
+                    if final_tier:
+                        self._count_tier(agent_name, final_tier, elapsed_ms, escalated=True)
                     if context.tracer:
                         context.tracer.record(AgentRecord(
-                            agent=agent_name,
-                            elapsed_ms=round((time.monotonic() - started) * 1000, 1),
-                            success=False, retries=attempt, error=str(e),
+                            agent=agent_name, elapsed_ms=elapsed_ms,
+                            success=False, retries=attempt, error=str(e), tier=final_tier,
                         ))
                     raise
 
@@ -173,6 +237,65 @@ class AgentRunner:
                     ))
                 raise FatalExecutionError(str(e))
 
+    # ── Cascade ─────────────────────────────────────────────────────────────
+
+    def _run_tier(
+        self,
+        agent_name: str,
+        tier: Dict[str, Any],
+        context: ExecutionContext,
+        finalize: Callable[[Any], Any],
+        invoke: Callable[[Any], tuple],
+    ) -> Optional[Any]:
+        """cascade tier 1회 실행. 채택 가능한 결과면 반환, escalate해야 하면 None."""
+        name = tier["tier"]
+        timeout_sec = tier.get("timeout_sec")
+        started = time.monotonic()
+        try:
+            raw, _ = invoke(tier["agent"])
+            if isinstance(raw, AgentResult):
+                raw = raw.to_dict()
+            elapsed = time.monotonic() - started
+            if timeout_sec and elapsed > timeout_sec:
+                raise RetryableError(f"timeout_exceeded: {elapsed:.2f}s > {timeout_sec}s")
+            if isinstance(raw, dict) and (
+                (raw.get("_meta") or {}).get("parse_error") or raw.get("_reason") == "parse_error"
+            ):
+                raise RetryableError("parse_error")
+            result = finalize(raw)
+        except Exception as e:
+            elapsed_ms = round((time.monotonic() - started) * 1000, 1)
+            self.logger.info(f"[{agent_name}] cascade tier {name} escalate: {e}")
+            self._count_tier(agent_name, name, elapsed_ms, escalated=True)
+            if context.tracer:
+                context.tracer.record(AgentRecord(
+                    agent=agent_name, elapsed_ms=elapsed_ms,
+                    success=False, error=str(e), tier=name,
+                ))
+            return None
+
+        elapsed_ms = round(elapsed * 1000, 1)
+        self._count_tier(agent_name, name, elapsed_ms, escalated=False)
+        if context.tracer:
+            context.tracer.record(AgentRecord(
+                agent=agent_name, elapsed_ms=elapsed_ms, success=True, tier=name,
+            ))
+        return result
+
+    def _count_tier(self, agent_name: str, tier: str, elapsed_ms: float, *, escalated: bool) -> None:
+        with self._stats_lock:
+            stats = self._tier_stats.setdefault(agent_name, {}).setdefault(
+                tier, {"calls": 0, "escalations": 0, "elapsed_ms_total": 0.0},
+            )
+            stats["calls"] += 1
+            stats["escalations"] += int(escalated)
+            stats["elapsed_ms_total"] += elapsed_ms
+
+    def tier_stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """agent → tier → {calls, escalations, elapsed_ms_total} 누적 스냅샷."""
+        with self._stats_lock:
+            return {a: {t: dict(v) for t, v in tiers.items()} for a, tiers in self._tier_stats.items()}
+
     def run_stream(
         self,
         agent_name: str,
@@ -199,8 +322,12 @@ class AgentRunner:
         policy = self._policy.get(agent_name, {})
         timeout_sec = timeout_sec or policy.get("timeout_sec")
         started = time.monotonic()
+        # 스트림은 next()마다 다른 스레드에서 진행될 수 있어 전용 Context에서 한 단계씩 실행한다
+        run_ctx = contextvars.copy_context()
+        run_ctx.run(current_session.set, context.session_id)
+        stream = run_ctx.run(agent.run_stream, context, **kwargs)
         try:
-            for event in agent.run_stream(context, **kwargs):
+            while (event := run_ctx.run(next, stream, None)) is not None:
                 if timeout_sec and (time.monotonic() - started) > timeout_sec:
                     raise RetryableError("stream_timeout_exceeded")
                 yield event
@@ -41,6 +41,7 @@ BaseAgent: 모든 Agent의 공통 기반 클래스.
 """
 
 import json
+import threading
 from typing import Any, Dict, List, Optional
 
 from app.core.logging import setup_logger
@@ -72,6 +73,8 @@ class BaseAgent:
         Args:
             system_prompt: LLM system 메시지. registry.py가 get_system_prompt()로 주입.
             llm_config:    card.json "llm" 섹션 {"provider": "openai", "model": "...", "temperature": 0}.
+                           provider="router"면 "backends" 목록으로 멀티 프로바이더 라우팅.
+                           "priority"는 registry가 policy.priority(없으면 에이전트 키)로 채운다.
             tools:         BaseTool 인스턴스 목록. build_tools()가 card.json 기반으로 생성.
             retriever:     RAG·MCP 클라이언트. chat() 내부에서 직접 활용하지 않으므로
                            run()에서 self.retriever로 참조해 수동 호출한다.
@@ -84,8 +87,14 @@ class BaseAgent:
         # tools를 이름으로 빠르게 조회하기 위해 dict으로 변환
         self.tools = {t.name: t for t in (tools or [])}
         self.retriever = retriever
-        self.llm = create_llm_client(cfg.get("provider", "openai"))
+        self.llm = create_llm_client(
+            cfg.get("provider", "openai"),
+            backends=cfg.get("backends"),
+            priority=cfg.get("priority"),
+        )
         self.logger = setup_logger(self.__class__.__name__)
+        # 에이전트 인스턴스는 세션·스레드 간 공유되므로 토큰 사용량은 스레드별로 누적
+        self._usage = threading.local()
 
     # ── Tool 확장 포인트 ─────────────────────────────────────────────────────
 
@@ -125,6 +134,27 @@ class BaseAgent:
             return text.strip()
         return text
 
+    # ── 토큰 사용량 ─────────────────────────────────────────────────────────
+
+    def reset_usage(self) -> None:
+        """현재 스레드의 토큰 사용량을 0으로 초기화. AgentRunner가 실행 직전에 호출한다."""
+        self._usage.tokens = {"input_tokens": 0, "output_tokens": 0, "llm_calls": 0}
+
+    def usage(self) -> Dict[str, int]:
+        """
+        reset_usage() 이후 현재 스레드에서 chat()이 소비한 토큰 합계와 LLM 호출 수(llm_calls).
+        llm_calls가 0이면 LLM 없이 끝난 실행(로컬 분류기 등) — hedge 지연 관측에서 제외된다.
+        """
+        return dict(getattr(self._usage, "tokens", None) or {"input_tokens": 0, "output_tokens": 0, "llm_calls": 0})
+
+    def _add_usage(self, usage: Optional[Dict[str, int]]) -> None:
+        tokens = getattr(self._usage, "tokens", None)
+        if tokens is None:
+            return
+        tokens["llm_calls"] += 1
+        for k in ("input_tokens", "output_tokens"):
+            tokens[k] += (usage or {}).get(k) or 0
+
     # ── LLM 호출 ────────────────────────────────────────────────────────────
 
     def chat(self, messages: list) -> str:
@@ -158,6 +188,7 @@ class BaseAgent:
                 timeout=self.timeout,
                 tools=schemas or None,
             )
+            self._add_usage(resp.usage)
 
             # tool_calls가 없으면 최종 텍스트 응답 — 루프 종료
             if not resp.tool_calls:
@@ -183,6 +214,7 @@ class BaseAgent:
         Yields:
             str: LLM이 생성한 토큰 (delta.content)
         """
+        self._add_usage(None)
         return self.llm.chat_stream(
             model=self.model,
             temperature=self.temperature,
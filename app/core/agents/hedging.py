@@ -0,0 +1,169 @@
+# app/core/agents/hedging.py
+"""
+Hedged request: 응답이 관측 p90 지연 안에 오지 않으면 같은 요청을 한 번 더 보내고 먼저 끝난 쪽을 채택한다.
+
+멱등 에이전트(intent, slot)에만 사용한다. 결과가 같아야 하므로 상태를 바꾸는 에이전트에는 쓰지 않는다.
+
+─── card.json policy.hedge ────────────────────────────────────────────────
+  "hedge": {
+    "percentile":  0.9,     // 이 백분위 지연을 넘기면 hedge 발사
+    "budget":      0.1,     // hedge 요청 수 ≤ budget × 전체 호출 수 (추가 비용 상한)
+    "min_samples": 20,      // 관측치가 이보다 적으면 default_delay_ms 사용
+    "default_delay_ms": 2000,
+    "llm": {"provider": "anthropic", "model": "..."}  // (선택) hedge를 다른 프로바이더·모델로
+  }
+
+─── 흐름 ───────────────────────────────────────────────────────────────────
+  hedge 예산이 없으면 primary를 호출 스레드에서 바로 실행 (hedge 없음)
+  예산이 있으면 primary를 전용 스레드로 시작 → delay(p90) 대기
+    └ 완료         → primary 결과 (예외도 그대로 전파 → AgentRunner 재시도 정책)
+    └ 미완료 + 예산 → hedge 제출 → 먼저 성공한 결과 채택, 둘 다 실패면 마지막 예외
+    └ 미완료 + 예산 소진 → primary 대기
+  늦게 끝난 쪽은 취소할 수 없으므로(동기 HTTP) 백그라운드에서 끝까지 실행된 뒤 버려진다.
+  지연 관측 창에는 LLM을 호출한 실행만 넣는다 — 로컬 분류기처럼 LLM 없이 끝난 실행(usage의
+  llm_calls == 0)의 sub-ms 지연이 섞이면 p90이 내려가 hedge가 너무 일찍 발사된다.
+  primary는 공유 풀을 쓰지 않는다 — 풀(_POOL)은 hedge 요청만 실행하므로 프로바이더가 느려져도
+  primary 동시 실행 수가 풀 크기로 묶이지 않는다. 두 요청 모두 호출 스레드의 contextvars를 이어받는다.
+  hedge 요청은 single-flight(coalescing)를 우회한다 — temperature 0이면 primary와 요청 key가 같아
+  primary의 진행 중 호출에 합류해 버리기 때문.
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional, Tuple
+
+from app.core.llm.coalescing import without_coalescing
+from app.core.logging import setup_logger
+
+_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="hedge")
+
+
+def _start_thread(fn: Callable[..., Any], *args: Any) -> Future:
+    """fn(*args)를 전용 데몬 스레드에서 실행 (호출 스레드 contextvars 유지)."""
+    future: Future = Future()
+    ctx = contextvars.copy_context()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(ctx.run(fn, *args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="hedge-primary", daemon=True).start()
+    return future
+
+
+class HedgePolicy:
+    """
+    에이전트 하나의 hedge 정책 + 지연 관측 창. registry.build_runner가 policy.hedge로 생성한다.
+
+    Attributes:
+        hedge_agent: hedge 요청을 보낼 에이전트 (None이면 primary 에이전트 재사용)
+        calls:       hedge 정책을 거친 전체 호출 수
+        hedges:      실제로 발사한 hedge 수
+        hedge_wins:  hedge가 먼저 끝나 채택된 횟수
+    """
+
+    def __init__(
+        self,
+        hedge_agent: Any = None,
+        *,
+        percentile: float = 0.9,
+        budget: float = 0.1,
+        min_samples: int = 20,
+        default_delay_ms: float = 2000,
+        window: int = 200,
+    ):
+        self.hedge_agent = hedge_agent
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.default_delay_ms = default_delay_ms
+        self._latencies: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.logger = setup_logger("Hedge")
+
+    def delay_sec(self) -> float:
+        """hedge 발사까지 기다릴 시간. 관측 지연의 percentile 값."""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if not samples or len(samples) < self.min_samples:
+            return self.default_delay_ms / 1000
+        return samples[min(len(samples) - 1, int(len(samples) * self.percentile))]
+
+    def _record(self, started: float, outcome: Any) -> None:
+        """LLM을 호출한 실행의 지연만 관측 창에 넣는다. outcome은 invoke의 (결과, usage)."""
+        usage = outcome[1] if isinstance(outcome, tuple) and len(outcome) == 2 else None
+        if isinstance(usage, dict) and usage.get("llm_calls", 1) == 0:
+            return
+        with self._lock:
+            self._latencies.append(time.monotonic() - started)
+
+    def _observe(self, started: float) -> Callable[[Future], None]:
+        def done(future: Future) -> None:
+            self._record(started, None if future.exception() else future.result())
+        return done
+
+    def _has_budget(self) -> bool:
+        with self._lock:
+            return self.hedges + 1 <= self.budget * self.calls
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.budget * self.calls:
+                return False
+            self.hedges += 1
+            return True
+
+    def call(self, invoke: Callable[[Any], Tuple[Any, Any]], agent: Any) -> Tuple[Any, Any]:
+        """
+        invoke(agent)를 hedge 정책으로 실행한다.
+
+        Args:
+            invoke: 에이전트 → (결과, 부가정보) 실행 함수. AgentRunner가 context·kwargs를 묶어 전달.
+            agent:  primary 에이전트
+        """
+        with self._lock:
+            self.calls += 1
+        started = time.monotonic()
+        if not self._has_budget():
+            # hedge를 보낼 수 없으면 스레드 전환 없이 호출 스레드에서 실행
+            outcome = None
+            try:
+                outcome = invoke(agent)
+                return outcome
+            finally:
+                self._record(started, outcome)
+        primary = _start_thread(invoke, agent)
+        primary.add_done_callback(self._observe(started))
+
+        done, _ = wait([primary], timeout=self.delay_sec())
+        if done or not self._take_budget():
+            return primary.result()
+
+        self.logger.info(f"hedge fired after {(time.monotonic() - started) * 1000:.0f}ms")
+        hedge = _POOL.submit(contextvars.copy_context().run, without_coalescing, invoke, self.hedge_agent or agent)
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                if f.exception() is None:
+                    if f is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return f.result()
+                error = f.exception()
+        raise error
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"calls": self.calls, "hedges": self.hedges, "hedge_wins": self.hedge_wins}
@@ -9,22 +9,41 @@ Agent 스펙(클래스 + card.json) → AgentRunner 빌드.
   "name": "MyAgent",
   "llm": {
     "model": "gpt-4o-mini",    // 사용할 OpenAI 모델
-    "temperature": 0           // 0=결정론적, 높을수록 창의적
+    "temperature": 0,          // 0=결정론적, 높을수록 창의적
+    "provider": "openai",      // "openai" | "anthropic" | "router"
+    "backends": [...]          // provider="router"일 때 백엔드 목록. llm/routing_client.py 참고.
   },
   "policy": {
     "max_retry":   2,          // 최대 재시도 횟수 (기본 1)
     "backoff_sec": 1,          // 재시도 간격 (attempt * backoff_sec 초)
     "timeout_sec": 10,         // 실행 타임아웃 (초). 없으면 무제한.
     "validate":    "slot_ops", // validator_map 키. 결과 검증 함수 지정.
-    "schema":      "SlotResult"// schema_registry 키. Pydantic 검증 후 dict 반환.
+    "schema":      "SlotResult",// schema_registry 키. Pydantic 검증 후 dict 반환.
+    "cascade": [               // (선택) 기본 llm 앞에 1회씩 시도할 tier. 검증 실패 시 다음 tier로.
+      {"llm": {"model": "gpt-4.1-nano"}, "timeout_sec": 3}
+    ],
+    "hedge": {"percentile": 0.9, "budget": 0.1}, // (선택) 멱등 에이전트 hedged request. hedging.py 참고.
+    "priority": "slot"         // (선택) LLM 한도 대기열 우선순위 클래스. 없으면 에이전트 키.
   },
-  "tools": ["calculator"]      // 사용할 Tool 이름 목록. TOOL_REGISTRY에 등록된 것만.
+  "tools": ["calculator"],     // 사용할 Tool 이름 목록. TOOL_REGISTRY에 등록된 것만.
+  "local_classifier": {        // (선택) LLM 앞단 로컬 분류기. 생성자에서 이 인자를 받는 에이전트만.
+    "model_path": "local_model.npz",
+    "threshold":  0.9,
+    "shadow":     false
+  },
+  "shadow": {                  // (선택) 대체 설정 shadow 평가. app/core/agents/shadow.py 참고.
+    "llm":         {"model": "gpt-4.1-nano"},
+    "sample_rate": 0.1,
+    "compare":     ["operations"]
+  }
 }
 """
 
 from typing import Any, Dict, Optional
 
 from app.core.agents.agent_runner import AgentRunner
+from app.core.agents.hedging import HedgePolicy
+from app.core.agents.shadow import ShadowEvaluator
 from app.core.tools.registry import build_tools
 
 
@@ -49,12 +68,16 @@ def build_runner(
     """
     agents = {}
     policy_by_name = {}
+    shadow_by_name = {}
+    cascade_by_name = {}
+    hedge_by_name = {}
 
     for key, spec in agent_specs.items():
         cls = spec["class"]
         card = spec.get("card", {})
-        llm = card.get("llm", {})
         policy = card.get("policy", {})
+        # LLM 한도 대기열 우선순위 — llm_config로 클라이언트까지 전달 (llm/rate_limiter.py)
+        llm = {**card.get("llm", {}), "priority": policy.get("priority", key)}
         tool_names = card.get("tools", [])
 
         # card.json policy → AgentRunner 정책 변환
@@ -73,16 +96,72 @@ def build_runner(
         else:
             system_prompt = "You are a helpful assistant."
 
+        # 선택 섹션 — 해당 섹션이 있을 때만 생성자 인자로 전달
+        extra = {}
+        if "local_classifier" in card:
+            extra["local_classifier"] = card["local_classifier"]
+
         # 에이전트 인스턴스 생성 (card.json 설정 주입)
         agents[key] = cls(
             system_prompt=system_prompt,
             llm_config=llm,
             tools=build_tools(tool_names) if tool_names else [],
+            **extra,
         )
 
+        # cascade tier 에이전트 — tier 타임아웃은 LLM 호출 타임아웃으로도 적용
+        tiers = []
+        for tier in policy.get("cascade", []):
+            tier_llm = {**llm, **tier.get("llm", {})}
+            if tier.get("timeout_sec"):
+                tier_llm["timeout_sec"] = tier["timeout_sec"]
+            tiers.append({
+                "agent": cls(
+                    system_prompt=system_prompt,
+                    llm_config=tier_llm,
+                    tools=build_tools(tool_names) if tool_names else [],
+                ),
+                "tier": tier_llm.get("model", "default"),
+                "timeout_sec": tier.get("timeout_sec"),
+            })
+        if tiers:
+            cascade_by_name[key] = tiers
+
+        # hedge 정책 — llm이 지정되면 hedge 요청은 별도 프로바이더·모델 인스턴스로
+        hedge = policy.get("hedge")
+        if hedge:
+            hedge_agent = None
+            if hedge.get("llm"):
+                hedge_agent = cls(
+                    system_prompt=system_prompt,
+                    llm_config={**llm, **hedge["llm"]},
+                    tools=build_tools(tool_names) if tool_names else [],
+                )
+            hedge_by_name[key] = HedgePolicy(
+                hedge_agent,
+                **{k: v for k, v in hedge.items() if k != "llm"},
+            )
+
+        # shadow 평가용 대체 에이전트 — 운영 llm 설정 위에 shadow.llm을 덮어쓴다
+        shadow = card.get("shadow")
+        if shadow:
+            shadow_by_name[key] = ShadowEvaluator(
+                cls(
+                    system_prompt=system_prompt,
+                    llm_config={**llm, **shadow.get("llm", {})},
+                    tools=build_tools(tool_names) if tool_names else [],
+                ),
+                sample_rate=shadow.get("sample_rate", 0.1),
+                compare=shadow.get("compare"),
+                log_path=shadow.get("log_path", "shadow.jsonl"),
+            )
+
     return AgentRunner(
         agents=agents,
         schema_registry=schema_registry or {},
         validator_map=validator_map or {},
         policy_by_name=policy_by_name,
+        shadow_by_name=shadow_by_name,
+        cascade_by_name=cascade_by_name,
+        hedge_by_name=hedge_by_name,
     )
@@ -0,0 +1,191 @@
+# app/core/agents/shadow.py
+"""
+Shadow 평가: 운영 호출의 일부를 대체 에이전트 설정(다른 모델 등)으로 재실행해 결과를 비교한다.
+
+운영 응답에는 영향이 없다. AgentRunner.run()이 성공 결과를 반환하기 직전에
+샘플링된 호출만 백그라운드 스레드 풀에 제출하고, 비교 결과는 append-only JSONL에 남긴다.
+
+─── card.json ──────────────────────────────────────────────────────────────
+  "shadow": {
+    "llm":         {"model": "gpt-4.1-nano"},  // 운영 llm 설정 위에 덮어쓸 값
+    "sample_rate": 0.1,                        // 미러링할 호출 비율 (0~1)
+    "compare":     ["operations"],             // 비교할 결과 키. 없으면 결과 전체 비교
+    "log_path":    "shadow.jsonl"              // settings.LOG_DIR 기준
+  }
+
+─── 로그 한 줄 ─────────────────────────────────────────────────────────────
+  {"ts", "agent", "session_id", "model", "match", "error",
+   "primary_ms", "shadow_ms", "latency_delta_ms",
+   "primary_tokens", "shadow_tokens", "token_delta"}
+
+─── 리포트 ─────────────────────────────────────────────────────────────────
+  python -m app.core.agents.shadow [logs/shadow.jsonl]
+"""
+
+import copy
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.core.context import ExecutionContext
+from app.core.logging import setup_logger
+
+_EMPTY_USAGE = {"input_tokens": 0, "output_tokens": 0}
+
+
+class ShadowEvaluator:
+    """
+    에이전트 하나에 대한 shadow 실행기. registry.build_runner가 card.json "shadow" 섹션으로 생성한다.
+
+    Attributes:
+        agent:       대체 설정으로 생성된 에이전트 인스턴스
+        sample_rate: 미러링 비율
+        compare:     비교할 결과 키 목록 (None이면 결과 전체)
+        log_path:    결과 JSONL 경로
+        max_pending: 대기 중 shadow 작업 상한. 초과분은 버린다 (운영 부하가 몰릴 때 보호).
+    """
+
+    def __init__(
+        self,
+        agent: Any,
+        *,
+        sample_rate: float = 0.1,
+        compare: Optional[Sequence[str]] = None,
+        log_path: str = "shadow.jsonl",
+        max_workers: int = 2,
+        max_pending: int = 32,
+    ):
+        self.agent = agent
+        self.sample_rate = sample_rate
+        self.compare = list(compare) if compare else None
+        self.log_path = os.path.join(settings.LOG_DIR, log_path)
+        self.max_pending = max_pending
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="shadow")
+        self._pending = 0
+        self._lock = threading.Lock()
+        self.logger = setup_logger("Shadow")
+
+    def maybe_submit(
+        self,
+        agent_name: str,
+        context: ExecutionContext,
+        primary: Any,
+        primary_ms: float,
+        primary_tokens: Optional[Dict[str, int]],
+        finalize: Callable[[Any], Any],
+        kwargs: Dict[str, Any],
+    ) -> bool:
+        """
+        샘플링에 걸리면 shadow 실행을 백그라운드에 제출하고 True 반환.
+
+        finalize: 운영 결과에 적용한 것과 동일한 검증·스키마 정규화 (AgentRunner가 전달).
+        """
+        if random.random() >= self.sample_rate:
+            return False
+        with self._lock:
+            if self._pending >= self.max_pending:
+                return False
+            self._pending += 1
+
+        # 운영 흐름이 이후 state·memory를 바꾸므로 제출 시점 스냅샷으로 실행
+        snapshot = ExecutionContext(
+            session_id=context.session_id,
+            user_message=context.user_message,
+            state=copy.deepcopy(context.state),
+            memory=copy.deepcopy(context.memory),
+        )
+        self._pool.submit(
+            self._run, agent_name, snapshot, primary, primary_ms,
+            primary_tokens or dict(_EMPTY_USAGE), finalize, kwargs,
+        )
+        return True
+
+    def _run(self, agent_name, context, primary, primary_ms, primary_tokens, finalize, kwargs) -> None:
+        try:
+            if hasattr(self.agent, "reset_usage"):
+                self.agent.reset_usage()
+            started = time.monotonic()
+            shadow, error = None, None
+            try:
+                shadow = finalize(self.agent.run(context, **kwargs))
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            shadow_ms = round((time.monotonic() - started) * 1000, 1)
+            shadow_tokens = self.agent.usage() if hasattr(self.agent, "usage") else dict(_EMPTY_USAGE)
+
+            self._write({
+                "ts": time.time(),
+                "agent": agent_name,
+                "session_id": context.session_id,
+                "model": getattr(self.agent, "model", None),
+                "match": error is None and self._match(primary, shadow),
+                "error": error,
+                "primary_ms": primary_ms,
+                "shadow_ms": shadow_ms,
+                "latency_delta_ms": round(shadow_ms - primary_ms, 1),
+                "primary_tokens": primary_tokens,
+                "shadow_tokens": shadow_tokens,
+                "token_delta": {k: shadow_tokens.get(k, 0) - primary_tokens.get(k, 0) for k in _EMPTY_USAGE},
+            })
+        except Exception as e:
+            self.logger.warning(f"[{agent_name}] shadow evaluation failed: {e}")
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _match(self, primary: Any, shadow: Any) -> bool:
+        if self.compare is None or not isinstance(primary, dict) or not isinstance(shadow, dict):
+            return primary == shadow
+        return all(primary.get(k) == shadow.get(k) for k in self.compare)
+
+    def _write(self, row: Dict[str, Any]) -> None:
+        line = json.dumps(row, ensure_ascii=False, default=str) + "\n"
+        with self._lock, open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+
+# ── 오프라인 리포트 ──────────────────────────────────────────────────────────
+
+def report(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """shadow 로그 행 → 에이전트·모델별 요약 {일치율, 지연 차이 p50/p95, 평균 토큰 차이, 오류 수}."""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for r in rows:
+        groups.setdefault(f"{r['agent']}@{r.get('model')}", []).append(r)
+
+    summary = {}
+    for key, items in groups.items():
+        deltas = sorted(r["latency_delta_ms"] for r in items)
+        n = len(items)
+        summary[key] = {
+            "n": n,
+            "match_rate": round(sum(bool(r["match"]) for r in items) / n, 4),
+            "errors": sum(r.get("error") is not None for r in items),
+            "latency_delta_ms_p50": statistics.median(deltas),
+            "latency_delta_ms_p95": deltas[min(n - 1, int(n * 0.95))],
+            "token_delta_avg": {
+                k: round(sum(r["token_delta"].get(k, 0) for r in items) / n, 1) for k in _EMPTY_USAGE
+            },
+        }
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    path = argv[0] if argv else os.path.join(settings.LOG_DIR, "shadow.jsonl")
+    with open(path, encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f if line.strip()]
+    print(json.dumps(report(rows), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,32 @@
 # app/core/api/router_factory.py
 """단일 orchestrate API 진입점. Request/Response 스키마 기준."""
 
-import json
-from typing import Any
+from typing import Any, Dict
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 
 from app.core.api.schemas import OrchestrateRequest, OrchestrateResponse
+from app.core.api.sse import encode_event
 from app.core.config import settings
 from sse_starlette.sse import EventSourceResponse
+from starlette.concurrency import run_in_threadpool
+
+
+def _session_snapshot(orchestrator: Any, session_id: str) -> Dict[str, Any]:
+    """디버그 스냅샷 — call_in_session으로 세션 소유 프로세스에서 실행."""
+    state, memory = orchestrator.sessions.get_or_create(session_id)
+    raw_history = memory.get("raw_history", [])
+    return {
+        "session_id": session_id,
+        "state": state.model_dump(),
+        "memory": {
+            "summary_text": memory.get("summary_text", ""),
+            "raw_history": raw_history,
+            "raw_history_turns": len(raw_history) // 2,
+            "summarize_threshold": settings.MEMORY_SUMMARIZE_THRESHOLD,
+        },
+        "completed": orchestrator.completed.list_for_session(session_id),
+    }
 
 
 def create_agent_router(orchestrator: Any) -> APIRouter:
@@ -17,20 +35,28 @@ def create_agent_router(orchestrator: Any) -> APIRouter:
     - POST /v1/agent/chat         : 비스트리밍
     - POST /v1/agent/chat/stream  : 스트리밍 SSE
     - GET  /v1/agent/completed    : 세션별 완료 이력
+    - GET  /v1/agent/llm/breakers : LLM circuit breaker 상태·메트릭 + 최근 상태 전이
+    - GET  /v1/agent/llm/limits   : LLM 호출 한도 대기열 + 스케줄러 슬롯 + single-flight 메트릭
+    - GET  /v1/agent/events       : 세션 이벤트 채널 SSE (백그라운드 실행 진행·완료)
+    - GET  /v1/agent/executions/{job_id} : 백그라운드 실행 작업 상태
+    - GET  /v1/agent/sessions/metrics : 세션 저장소 메트릭 (hot/cold·복원 지연 — 지원하는 저장소만)
+    - GET  /v1/agent/sessions/health  : 세션 저장소 상태 (공유 캐시 eviction·overflow — 지원하는 저장소만)
+    - GET  /v1/agent/workers      : 워커 프로세스 상태 (WorkerSupervisor 사용 시만)
     - GET  /v1/agent/debug/{id}   : 개발용 내부 상태 스냅샷 (DEV_MODE=true 시만)
     """
     router = APIRouter(prefix="/v1/agent", tags=["agent"])
 
     def _stream_events(session_id: str, message: str):
+        # 미리 인코딩한 SSE 프레임(bytes) → sse_starlette가 재포맷 없이 그대로 전송
         for event in orchestrator.handle_stream(session_id, message):
-            yield {
-                "event": event.get("event", ""),
-                "data": json.dumps(event.get("payload", {}), ensure_ascii=False),
-            }
+            yield encode_event(event)
 
     @router.post("/chat", response_model=OrchestrateResponse)
     async def orchestrate(req: OrchestrateRequest) -> OrchestrateResponse:
-        result = orchestrator.handle(req.session_id, req.message)
+        # 오케스트레이터 호출은 블로킹(LLM·워커 IPC) — 이벤트 루프 밖에서 실행.
+        # 워커가 재기동 대기(_drain) 중이면 여기서 막히는데, 루프가 멈추면 열린 스트림이
+        # 소비되지 않아 drain이 끝나지 않는다.
+        result = await run_in_threadpool(orchestrator.handle, req.session_id, req.message)
         return OrchestrateResponse(**result)
 
     @router.post("/chat/stream")
@@ -45,9 +71,71 @@ def create_agent_router(orchestrator: Any) -> APIRouter:
     async def list_completed(session_id: str):
         return {
             "session_id": session_id,
-            "completed": orchestrator.completed.list_for_session(session_id),
+            "completed": await run_in_threadpool(orchestrator.completed.list_for_session, session_id),
         }
 
+    @router.get("/sessions/metrics")
+    async def session_metrics():
+        sessions = getattr(orchestrator, "sessions", None)
+        if not hasattr(sessions, "metrics"):
+            raise HTTPException(status_code=501, detail="session store does not report metrics")
+        return await run_in_threadpool(sessions.metrics)
+
+    @router.get("/sessions/health")
+    async def session_health():
+        sessions = getattr(orchestrator, "sessions", None)
+        if not hasattr(sessions, "health"):
+            raise HTTPException(status_code=501, detail="session store does not report health")
+        return await run_in_threadpool(sessions.health)
+
+    @router.get("/workers")
+    async def worker_metrics():
+        if not hasattr(orchestrator, "worker_metrics"):
+            raise HTTPException(status_code=501, detail="orchestrator does not run worker processes")
+        return await run_in_threadpool(orchestrator.worker_metrics)
+
+    @router.get("/llm/breakers")
+    async def llm_breakers():
+        from app.core.llm.circuit_breaker import breaker_metrics, recent_transitions
+        return {"breakers": breaker_metrics(), "transitions": recent_transitions()}
+
+    @router.get("/llm/limits")
+    async def llm_limits():
+        from app.core.llm.rate_limiter import limiter_metrics
+        from app.core.llm.scheduler import get_scheduler
+        from app.core.llm.coalescing import coalescing_metrics
+        return {
+            "limiters": limiter_metrics(),
+            "scheduler": get_scheduler().snapshot(),
+            "coalescing": coalescing_metrics(),
+        }
+
+    async def _channel_events(request: Request, session_id: str, after: int):
+        # 이벤트 루프에서 대기 — 구독자 수만큼 스레드풀 스레드를 붙잡지 않는다
+        from app.core.execution import get_channel
+        channel = get_channel()
+        while not await request.is_disconnected():
+            events = await channel.wait_async(session_id, after, timeout=15)
+            if not events:
+                yield b": keep-alive\r\n\r\n"
+                continue
+            for event in events:
+                after = event["seq"]
+                yield encode_event({"event": event["event"], "payload": {**event["payload"], "seq": after}})
+
+    @router.get("/events")
+    async def session_events(request: Request, session_id: str, after: int = 0):
+        """턴 종료 후 발생하는 세션 이벤트 구독. 재연결 시 마지막으로 받은 seq를 after로 전달."""
+        return EventSourceResponse(_channel_events(request, session_id, after))
+
+    @router.get("/executions/{job_id}")
+    async def execution_status(job_id: str):
+        from app.core.execution import get_executor
+        job = get_executor().get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="job not found")
+        return job.to_dict()
+
     if settings.DEV_MODE:
         @router.get("/debug/{session_id}")
         async def debug_session(session_id: str):
@@ -60,24 +148,8 @@ def create_agent_router(orchestrator: Any) -> APIRouter:
               memory     - raw_history(대화 이력), summary_text(요약)
               completed  - 이 세션에서 완료된 이체 목록
             """
-            sessions = getattr(orchestrator, "sessions", None)
-            if sessions is None:
+            if not hasattr(orchestrator, "call_in_session"):
                 raise HTTPException(status_code=501, detail="sessions not available on this orchestrator")
-
-            state, memory = sessions.get_or_create(session_id)
-            completed = orchestrator.completed.list_for_session(session_id)
-
-            raw_history = memory.get("raw_history", [])
-            return {
-                "session_id": session_id,
-                "state": state.model_dump() if hasattr(state, "model_dump") else state,
-                "memory": {
-                    "summary_text": memory.get("summary_text", ""),
-                    "raw_history": raw_history,
-                    "raw_history_turns": len(raw_history) // 2,
-                    "summarize_threshold": settings.MEMORY_SUMMARIZE_THRESHOLD,
-                },
-                "completed": completed,
-            }
+            return await run_in_threadpool(orchestrator.call_in_session, session_id, _session_snapshot)
 
     return router
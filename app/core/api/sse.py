@@ -0,0 +1,48 @@
+# app/core/api/sse.py
+"""
+이벤트 dict → SSE 프레임(bytes) 직렬화.
+
+sse_starlette는 bytes를 받으면 재포맷 없이 그대로 전송하므로,
+라우터가 이 모듈로 프레임을 미리 인코딩해 넘기면 이벤트당 dict 생성·이중 포맷이 사라진다.
+
+─── 프레임 형식 (sse_starlette 기본 sep="\\r\\n"과 동일) ────────────────────
+  event: LLM_TOKEN\\r\\n
+  data: "안"\\r\\n
+  \\r\\n
+
+─── fast path ──────────────────────────────────────────────────────────────
+  LLM_TOKEN:  payload가 단일 문자열 → 템플릿에 JSON 문자열만 끼워 넣음.
+              ConversationalAgent는 글자 단위로 emit하므로 프레임을 캐시해 재사용한다.
+  그 외:      codec.json_codec() — orjson이 설치돼 있으면 orjson, 없으면 json.dumps(ensure_ascii=False).
+"""
+
+from functools import lru_cache
+from typing import Any, Dict
+
+from app.core.codec import json_codec
+from app.core.events import EventType
+
+_SEP = b"\r\n"
+_TOKEN_PREFIX = b"event: " + EventType.LLM_TOKEN.value.encode() + _SEP + b"data: "
+_FRAME_END = _SEP + _SEP
+
+
+def dumps(payload: Any) -> bytes:
+    """payload → UTF-8 JSON bytes. orjson이 처리하지 못하는 타입은 표준 json으로 폴백."""
+    return json_codec().encode(payload)
+
+
+@lru_cache(maxsize=4096)
+def _token_frame(token: str) -> bytes:
+    return _TOKEN_PREFIX + dumps(token) + _FRAME_END
+
+
+def encode_event(event: Dict[str, Any]) -> bytes:
+    """{"event": EventType, "payload": ...} → SSE 프레임 bytes."""
+    name = event.get("event", "")
+    payload = event.get("payload", {})
+    if name == EventType.LLM_TOKEN and isinstance(payload, str):
+        return _token_frame(payload)
+    name = getattr(name, "value", name)
+    head = b"event: " + name.encode("utf-8") + _SEP if name else b""
+    return head + b"data: " + dumps(payload) + _FRAME_END
@@ -0,0 +1,348 @@
+# app/core/codec.py
+"""
+직렬화 코덱: state·memory·이벤트 payload를 bytes로 (역)직렬화하는 공통 계층.
+
+세션 저장소·완료 이력·스냅샷·SSE/A2A 전송이 각자 model_dump()/json.dumps를 쓰던 것을
+여기로 모은다. 포맷을 바꿔도 호출부는 그대로 두고 STATE_CODEC 설정만 바꾼다.
+
+─── 범용 코덱 (get_codec) ──────────────────────────────────────────────────
+  json     표준 json (ensure_ascii=False)
+  orjson   orjson (선택 의존성). 처리하지 못하는 타입은 표준 json으로 폴백
+  msgpack  msgpack (선택 의존성). 바이너리 — SSE 같은 텍스트 전송에는 쓰지 않는다
+  binary   범용 payload에서는 설치된 것 중 가장 빠른 코덱 (msgpack > orjson > json)
+           — 설치 상태에 따라 바뀌므로 저장하는 데이터에는 resolve_codec()으로 고정한
+           "binary:<내부 코덱>" 이름을 쓴다 (get_codec("binary:msgpack") == msgpack 코덱).
+           저장소는 이 이름을 meta에 기록해, 나중에 msgpack을 설치·제거해도 기존 파일을
+           기록된 내부 코덱으로 읽는다.
+
+─── state 코덱 (encode_state / decode_state) ───────────────────────────────
+  BaseState 하위 클래스 전용. SCHEMA_VERSION 태그를 함께 기록하고, 복원 시 등록된
+  upgrade 훅(register_upgrade)을 버전 순서대로 적용한 뒤 model_validate 한다.
+
+  binary: schema-aware 위치 기반 포맷. 필드 이름 없이 선언 순서대로 값만 기록한다
+          (중첩 BaseModel 필드 — slots 등 — 도 위치 기반). 헤더:
+            MAGIC(1) | 내부 코덱 id(1) | SCHEMA_VERSION(2) | 레이아웃 fingerprint(4)
+          fingerprint는 필드 이름 트리의 crc32. 필드를 추가·삭제·재배치하면서 버전을
+          올리지 않으면 복원 시 CodecError (조용히 잘못 읽지 않는다). 이전 버전 데이터를
+          읽으려면 register_upgrade(cls, 이전버전, fn, layout=이전 필드 목록)로 등록한다.
+          키 구성이 같은 dict 목록(task_queue·bulk_tasks·receipts 등)은 키를 한 번만 쓰는
+          테이블({"\x00t": [keys, row, ...]})로 압축한다.
+  그 외:  {"v": SCHEMA_VERSION, "state": model_dump(mode="json")}를 해당 코덱으로 인코딩.
+
+─── 세션 blob (encode_session / decode_session) ────────────────────────────
+  (state, memory) 한 쌍 → state 길이(4) | encode_state(state) | get_codec(codec).encode(memory)
+  binary 계열이면 memory도 state 헤더의 내부 코덱 id로 인코딩·디코딩한다 → blob 자체로 판별 가능.
+  세션 저장소 cold tier·공유 메모리 캐시가 같은 형식을 쓴다. decode는 memoryview도 받는다.
+"""
+
+import json
+import struct
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성 — 없으면 표준 json 사용
+    orjson = None
+
+
+class CodecError(ValueError):
+    """디코딩할 수 없는 데이터 (알 수 없는 포맷·버전·레이아웃)."""
+
+
+# ─── 범용 코덱 ───────────────────────────────────────────────────────────────
+
+class JsonCodec:
+    name = "json"
+    content_type = "application/json"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def decode(self, data: bytes | str | memoryview) -> Any:
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson이 설치되지 않았어요 (pip install orjson)")
+
+    def encode(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            return super().encode(obj)
+
+    def decode(self, data: bytes | str | memoryview) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec:
+    name = "msgpack"
+    content_type = "application/msgpack"
+
+    def __init__(self):
+        import msgpack   # 선택 의존성 — 사용할 때만 필요
+        self._msgpack = msgpack
+
+    def encode(self, obj: Any) -> bytes:
+        return self._msgpack.packb(obj, use_bin_type=True, default=str)
+
+    def decode(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+_CODEC_CLASSES = {"json": JsonCodec, "orjson": OrjsonCodec, "msgpack": MsgpackCodec}
+_CODECS: Dict[str, Any] = {}
+
+
+def get_codec(name: Optional[str] = None):
+    """이름으로 범용 코덱 인스턴스 조회 (기본 STATE_CODEC). 선택 의존성이 없으면 ImportError."""
+    name = name or settings.STATE_CODEC
+    codec = _CODECS.get(name)
+    if codec is not None:
+        return codec
+    if name.startswith("binary:"):
+        codec = get_codec(name[len("binary:"):])
+    elif name == "binary":
+        for candidate in ("msgpack", "orjson", "json"):
+            try:
+                codec = get_codec(candidate)
+                break
+            except ImportError:
+                continue
+    elif name in _CODEC_CLASSES:
+        codec = _CODEC_CLASSES[name]()
+    else:
+        raise ValueError(f"unknown codec: {name}")
+    _CODECS[name] = codec
+    return codec
+
+
+def _is_binary(codec: str) -> bool:
+    return codec == "binary" or codec.startswith("binary:")
+
+
+def resolve_codec(name: Optional[str] = None, sample: Optional[bytes] = None) -> str:
+    """
+    저장용 코덱 이름. "binary"를 내부 코덱까지 고정한 "binary:<이름>"으로 바꾼다.
+
+    sample(기존 binary state blob)이 있으면 그 헤더의 내부 코덱을, 없으면 현재 설치 기준으로 고른다.
+    """
+    name = name or settings.STATE_CODEC
+    if name != "binary":
+        get_codec(name)   # 알 수 없는 이름·미설치 의존성이면 여기서 실패
+        return name
+    if sample is not None and len(sample) >= _HEADER.size and sample[0] == _MAGIC:
+        return f"binary:{_INNER_NAMES[sample[1]]}"
+    return f"binary:{get_codec('binary').name}"
+
+
+def json_codec():
+    """텍스트 전송(SSE·A2A)용 JSON 코덱 — orjson이 있으면 orjson."""
+    return get_codec("orjson" if orjson is not None else "json")
+
+
+# ─── state 스키마 버전·upgrade 훅 ────────────────────────────────────────────
+
+Layout = Tuple[Tuple[str, Any], ...]   # ((필드명, 중첩 Layout | None), ...)
+
+_UPGRADES: Dict[Tuple[type, int], Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+_OLD_LAYOUTS: Dict[Tuple[type, int], Layout] = {}
+_LAYOUT_CACHE: Dict[type, Tuple[Layout, int]] = {}
+
+
+def _model_layout(cls: Type[BaseModel]) -> Layout:
+    layout = []
+    for name, field in cls.model_fields.items():
+        ann = field.annotation
+        nested = _model_layout(ann) if isinstance(ann, type) and issubclass(ann, BaseModel) else None
+        layout.append((name, nested))
+    return tuple(layout)
+
+
+def _normalize_layout(spec: Any) -> Layout:
+    """["a", ("slots", ["x", "y"]), ...] 형식의 필드 목록 → Layout."""
+    return tuple(
+        (item[0], _normalize_layout(item[1])) if isinstance(item, (tuple, list)) else (item, None)
+        for item in spec
+    )
+
+
+def _fingerprint(layout: Layout) -> int:
+    return zlib.crc32(repr(layout).encode("utf-8"))
+
+
+def _current_layout(cls: type) -> Tuple[Layout, int]:
+    cached = _LAYOUT_CACHE.get(cls)
+    if cached is None:
+        layout = _model_layout(cls)
+        cached = _LAYOUT_CACHE[cls] = (layout, _fingerprint(layout))
+    return cached
+
+
+def register_upgrade(
+    cls: type,
+    from_version: int,
+    fn: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    layout: Optional[list] = None,
+) -> None:
+    """
+    from_version → from_version + 1 변환을 등록한다.
+
+    Args:
+        fn:     state dict를 받아 다음 버전 dict를 반환 (필드 이름 변경·기본값 채우기 등)
+        layout: from_version 시점의 필드 목록 (binary 포맷 복원용, 레이아웃이 달라졌을 때만)
+    """
+    if fn is not None:
+        _UPGRADES[(cls, from_version)] = fn
+    if layout is not None:
+        _OLD_LAYOUTS[(cls, from_version)] = _normalize_layout(layout)
+
+
+def _upgrade(cls: type, version: int, doc: Dict[str, Any]) -> Dict[str, Any]:
+    current = getattr(cls, "SCHEMA_VERSION", 1)
+    if version > current:
+        raise CodecError(f"{cls.__name__} schema v{version} is newer than v{current}")
+    for v in range(version, current):
+        fn = _UPGRADES.get((cls, v))
+        if fn is not None:
+            doc = fn(doc)
+    return doc
+
+
+# ─── binary (위치 기반) ──────────────────────────────────────────────────────
+
+_MAGIC = 0xA7
+_HEADER = struct.Struct(">BBHI")
+_INNER_IDS = {"json": 0, "orjson": 1, "msgpack": 2}
+_INNER_NAMES = {v: k for k, v in _INNER_IDS.items()}
+
+
+_TABLE = "\x00t"
+_CONTAINERS = (dict, list)
+
+
+def _pack(value: Any) -> Any:
+    """키 구성이 같은 dict 목록 → 테이블. dict·list는 재귀 (스칼라는 그대로)."""
+    cls = type(value)
+    if cls is dict:
+        return {k: v if type(v) not in _CONTAINERS else _pack(v) for k, v in value.items()}
+    if cls is list:
+        if len(value) > 1 and type(value[0]) is dict:
+            keys = list(value[0])
+            if all(type(row) is dict and list(row) == keys for row in value):
+                return {_TABLE: [keys, *(
+                    [v if type(v) not in _CONTAINERS else _pack(v) for v in row.values()] for row in value
+                )]}
+        return [v if type(v) not in _CONTAINERS else _pack(v) for v in value]
+    return value
+
+
+def _unpack(value: Any) -> Any:
+    cls = type(value)
+    if cls is dict:
+        table = value.get(_TABLE)
+        if table is not None and len(value) == 1:
+            keys = table[0]
+            return [
+                {k: v if type(v) not in _CONTAINERS else _unpack(v) for k, v in zip(keys, row)}
+                for row in table[1:]
+            ]
+        return {k: v if type(v) not in _CONTAINERS else _unpack(v) for k, v in value.items()}
+    if cls is list:
+        return [v if type(v) not in _CONTAINERS else _unpack(v) for v in value]
+    return value
+
+
+def _to_positional(doc: Dict[str, Any], layout: Layout) -> list:
+    return [
+        _to_positional(doc[name], nested) if nested and doc.get(name) is not None else _pack(doc.get(name))
+        for name, nested in layout
+    ]
+
+
+def _from_positional(values: list, layout: Layout) -> Dict[str, Any]:
+    return {
+        name: _from_positional(value, nested) if nested and value is not None else _unpack(value)
+        for (name, nested), value in zip(layout, values)
+    }
+
+
+def _encode_binary(state: BaseModel, codec: str = "binary") -> bytes:
+    cls = type(state)
+    layout, fingerprint = _current_layout(cls)
+    inner = get_codec(codec)
+    header = _HEADER.pack(_MAGIC, _INNER_IDS[inner.name], getattr(cls, "SCHEMA_VERSION", 1), fingerprint)
+    return header + inner.encode(_to_positional(state.model_dump(mode="json"), layout))
+
+
+def _decode_binary(data: bytes, cls: type) -> Dict[str, Any]:
+    if len(data) < _HEADER.size or data[0] != _MAGIC:
+        raise CodecError("not a binary state payload")
+    _, inner_id, version, fingerprint = _HEADER.unpack_from(data)
+    if version == getattr(cls, "SCHEMA_VERSION", 1):
+        layout, expected = _current_layout(cls)
+    else:
+        layout = _OLD_LAYOUTS.get((cls, version)) or _current_layout(cls)[0]
+        expected = _fingerprint(layout)
+    if fingerprint != expected:
+        raise CodecError(f"{cls.__name__} v{version} layout mismatch (bump SCHEMA_VERSION / register_upgrade)")
+    inner = get_codec(_INNER_NAMES[inner_id])
+    return _upgrade(cls, version, _from_positional(inner.decode(data[_HEADER.size:]), layout))
+
+
+# ─── state 코덱 API ──────────────────────────────────────────────────────────
+
+def encode_state(state: BaseModel, codec: Optional[str] = None) -> bytes:
+    """state → bytes (스키마 버전 포함). codec 기본값은 STATE_CODEC."""
+    codec = codec or settings.STATE_CODEC
+    if _is_binary(codec):
+        return _encode_binary(state, codec)
+    version = getattr(type(state), "SCHEMA_VERSION", 1)
+    return get_codec(codec).encode({"v": version, "state": state.model_dump(mode="json")})
+
+
+def decode_state(data: bytes | str, cls: type, codec: Optional[str] = None) -> Any:
+    """encode_state 결과 → cls 인스턴스. 이전 스키마 버전이면 upgrade 훅을 적용한다."""
+    codec = codec or settings.STATE_CODEC
+    if _is_binary(codec):
+        doc = _decode_binary(data, cls)
+    else:
+        envelope = get_codec(codec).decode(data)
+        doc = _upgrade(cls, envelope["v"], envelope["state"])
+    return cls.model_validate(doc)
+
+
+_SESSION_STATE_LEN = struct.Struct(">I")
+
+
+def encode_session(state: BaseModel, memory: Dict[str, Any], codec: Optional[str] = None) -> bytes:
+    """(state, memory) → 세션 blob."""
+    codec = codec or settings.STATE_CODEC
+    encoded = encode_state(state, codec)
+    return _SESSION_STATE_LEN.pack(len(encoded)) + encoded + _memory_codec(encoded, codec).encode(memory)
+
+
+def decode_session(data: bytes | memoryview, cls: type, codec: Optional[str] = None) -> Tuple[Any, Dict[str, Any]]:
+    """세션 blob → (state, memory)."""
+    codec = codec or settings.STATE_CODEC
+    (n,) = _SESSION_STATE_LEN.unpack_from(data)
+    start = _SESSION_STATE_LEN.size
+    encoded = data[start:start + n]
+    return decode_state(encoded, cls, codec), _memory_codec(encoded, codec).decode(data[start + n:])
+
+
+def _memory_codec(encoded_state: bytes | memoryview, codec: str):
+    """세션 blob의 memory 코덱 — binary 계열이면 state 헤더에 기록된 내부 코덱."""
+    if _is_binary(codec) and len(encoded_state) >= _HEADER.size and encoded_state[0] == _MAGIC:
+        return get_codec(_INNER_NAMES[encoded_state[1]])
+    return get_codec(codec)
+
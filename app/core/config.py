@@ -1,4 +1,5 @@
 # app/core/config.py
+import importlib.util
 import os
 from pathlib import Path
 from pydantic import BaseModel
@@ -27,6 +28,52 @@ class Settings(BaseModel):
     EXECUTION_MAX_RETRY: int = int(os.getenv("EXECUTION_MAX_RETRY", "3"))
     EXECUTION_BACKOFF_SEC: int = int(os.getenv("EXECUTION_BACKOFF_SEC", "1"))
 
+    # 실행 모드: "sync" = 턴 안에서 실행, "async" = 백그라운드 실행 후 세션 이벤트 채널로 결과 전달
+    # app/core/execution 참고
+    EXECUTION_MODE: str = os.getenv("EXECUTION_MODE", "sync")
+    EXECUTION_WORKERS: int = int(os.getenv("EXECUTION_WORKERS", "8"))
+
+    # 로컬 은행 API 대역 (transfer/bank_api.py MockBankAPI) — 지연·실패율로 실연동 조건 재현
+    BANK_API_LATENCY_SEC: float = float(os.getenv("BANK_API_LATENCY_SEC", "0"))
+    BANK_API_FAILURE_RATE: float = float(os.getenv("BANK_API_FAILURE_RATE", "0"))
+
+    # 훅 outbox — hook_handlers·after_turn을 SQLite에 기록 후 워커 풀로 전달 (at-least-once)
+    # app/core/execution/outbox.py 참고. 비활성화하면 턴 종료 시 직접 호출.
+    HOOK_OUTBOX_ENABLED: bool = os.getenv("HOOK_OUTBOX_ENABLED", "true").lower() == "true"
+    HOOK_OUTBOX_PATH: str = os.getenv("HOOK_OUTBOX_PATH", "")           # 비우면 LOG_DIR/hook_outbox.db
+    HOOK_OUTBOX_WORKERS: int = int(os.getenv("HOOK_OUTBOX_WORKERS", "4"))
+    HOOK_OUTBOX_LIMITS: str = os.getenv("HOOK_OUTBOX_LIMITS", "")       # JSON, hook_type → 동시 실행 한도
+    HOOK_OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("HOOK_OUTBOX_MAX_ATTEMPTS", "5"))
+    HOOK_OUTBOX_BACKOFF_SEC: float = float(os.getenv("HOOK_OUTBOX_BACKOFF_SEC", "1"))
+
+    # 세션 저장소: "memory" = InMemorySessionStore, "eventlog" = 이벤트 로그 + 스냅샷 (app/core/state/event_log.py)
+    #              "hibernate" = hot LRU + 압축 cold tier (app/core/state/hibernation.py)
+    #              "shared" = 워커 프로세스 간 공유 메모리 캐시 (app/core/state/shared_cache.py)
+    SESSION_STORE: str = os.getenv("SESSION_STORE", "memory")
+    SESSION_LOG_PATH: str = os.getenv("SESSION_LOG_PATH", "")           # 비우면 LOG_DIR/sessions.db
+    SESSION_SNAPSHOT_EVERY: int = int(os.getenv("SESSION_SNAPSHOT_EVERY", "50"))
+    SESSION_COLD_PATH: str = os.getenv("SESSION_COLD_PATH", "")         # 비우면 LOG_DIR/sessions_cold.db
+    SESSION_IDLE_SEC: float = float(os.getenv("SESSION_IDLE_SEC", "300"))
+    SESSION_HOT_MAX: int = int(os.getenv("SESSION_HOT_MAX", "10000"))
+    SESSION_SWEEP_SEC: float = float(os.getenv("SESSION_SWEEP_SEC", "30"))
+    # "shared" = 노드 내 워커 프로세스 공유 mmap 캐시 (app/core/state/shared_cache.py)
+    SESSION_SHM_PATH: str = os.getenv("SESSION_SHM_PATH", "")           # 비우면 /dev/shm/{APP_NAME}-sessions
+    SESSION_SHM_SLOTS: int = int(os.getenv("SESSION_SHM_SLOTS", "16384"))
+    SESSION_SHM_SLOT_BYTES: int = int(os.getenv("SESSION_SHM_SLOT_BYTES", "8192"))
+    SESSION_SHM_OVERFLOW_PATH: str = os.getenv("SESSION_SHM_OVERFLOW_PATH", "")  # 비우면 LOG_DIR/sessions_overflow.db
+
+    # state 직렬화 코덱: binary(스키마 기반 위치 포맷) | msgpack | orjson | json. app/core/codec.py 참고
+    # 기본은 orjson(미설치면 json) — binary는 blob이 작지만 인코딩·디코딩은 orjson보다 느리다
+    STATE_CODEC: str = os.getenv("STATE_CODEC", "orjson" if importlib.util.find_spec("orjson") else "json")
+
+    # 워커 프로세스 수퍼바이저 — N개 CoreOrchestrator 프로세스 + session_id 일관 해싱 라우팅
+    # app/core/orchestration/supervisor.py 참고. 0이면 기존처럼 단일 프로세스. EXECUTION_MODE=async와 함께 쓸 수 없다.
+    SUPERVISOR_WORKERS: int = int(os.getenv("SUPERVISOR_WORKERS", "0"))
+    SUPERVISOR_VNODES: int = int(os.getenv("SUPERVISOR_VNODES", "64"))           # 워커당 해시 링 가상 노드 수
+    SUPERVISOR_MAX_REQUESTS: int = int(os.getenv("SUPERVISOR_MAX_REQUESTS", "0"))  # 이 요청 수마다 워커 재기동 (0=끔)
+    SUPERVISOR_START_TIMEOUT_SEC: float = float(os.getenv("SUPERVISOR_START_TIMEOUT_SEC", "60"))
+    SUPERVISOR_SOCKET_DIR: str = os.getenv("SUPERVISOR_SOCKET_DIR", "")          # 비우면 임시 디렉터리
+
     MEMORY_MAX_RAW_TURNS: int = int(os.getenv("MEMORY_MAX_RAW_TURNS", "12"))
 
     # 자동 요약: raw_history가 SUMMARIZE_THRESHOLD 턴 이상이면 LLM으로 요약
@@ -36,7 +83,38 @@ class Settings(BaseModel):
 
     MEMORY_SUMMARY_MODEL: str = os.getenv("MEMORY_SUMMARY_MODEL", "gpt-4o-mini")
 
+    # LLM circuit breaker — (provider, model) 단위. app/core/llm/circuit_breaker.py 참고
+    LLM_CB_FAILURE_RATE: float = float(os.getenv("LLM_CB_FAILURE_RATE", "0.5"))
+    LLM_CB_SLOW_CALL_SEC: float = float(os.getenv("LLM_CB_SLOW_CALL_SEC", "10"))
+    LLM_CB_SLOW_RATE: float = float(os.getenv("LLM_CB_SLOW_RATE", "0.8"))
+    LLM_CB_WINDOW: int = int(os.getenv("LLM_CB_WINDOW", "20"))
+    LLM_CB_MIN_CALLS: int = int(os.getenv("LLM_CB_MIN_CALLS", "5"))
+    LLM_CB_OPEN_SEC: float = float(os.getenv("LLM_CB_OPEN_SEC", "30"))
+
+    # LLM 호출 한도 (JSON, "provider:model" → {"rpm", "tpm"}) + 우선순위 대기열. app/core/llm/rate_limiter.py 참고
+    LLM_RATE_LIMITS: str = os.getenv("LLM_RATE_LIMITS", "")
+    LLM_QUEUE_MAX_WAIT_SEC: float = float(os.getenv("LLM_QUEUE_MAX_WAIT_SEC", "2"))
+    LLM_QUEUE_MAX_DEPTH: int = int(os.getenv("LLM_QUEUE_MAX_DEPTH", "32"))
+
+    # LLM 동시 실행 스케줄러 — 우선순위 + 세션 WFQ. app/core/llm/scheduler.py 참고
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+    LLM_BACKGROUND_MAX_CONCURRENCY: int = int(os.getenv("LLM_BACKGROUND_MAX_CONCURRENCY", "4"))
+    MEMORY_SUMMARY_IN_BACKGROUND: bool = os.getenv("MEMORY_SUMMARY_IN_BACKGROUND", "true").lower() == "true"
+
     MAX_FILL_TURNS: int = int(os.getenv("MAX_FILL_TURNS", "5"))
 
+    # 다건 이체 일괄 확인 — 슬롯이 모두 채워진 태스크가 이 건수 이상이면 한 번에 확인·병렬 실행
+    BATCH_CONFIRM_MIN_TASKS: int = int(os.getenv("BATCH_CONFIRM_MIN_TASKS", "3"))
+    BATCH_EXECUTE_CONCURRENCY: int = int(os.getenv("BATCH_EXECUTE_CONCURRENCY", "8"))
+    # 배치 파일 업로드 한도 (POST /v1/agent/batch/upload) — 넘으면 413으로 거절
+    BATCH_UPLOAD_MAX_BYTES: int = int(os.getenv("BATCH_UPLOAD_MAX_BYTES", str(2 * 1024 * 1024)))
+    BATCH_UPLOAD_MAX_ROWS: int = int(os.getenv("BATCH_UPLOAD_MAX_ROWS", "10000"))
+
+    # 항목이 많은 다건 입력은 청크로 나눠 SlotFiller를 병렬 호출 (handlers.py _extract_slots)
+    SLOT_CHUNK_MIN_ITEMS: int = int(os.getenv("SLOT_CHUNK_MIN_ITEMS", "8"))
+    SLOT_CHUNK_SIZE: int = int(os.getenv("SLOT_CHUNK_SIZE", "5"))
+    SLOT_CHUNK_CONCURRENCY: int = int(os.getenv("SLOT_CHUNK_CONCURRENCY", "4"))
+    SLOT_CHUNK_RETRY: int = int(os.getenv("SLOT_CHUNK_RETRY", "1"))
+
 
 settings = Settings()
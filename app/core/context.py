@@ -17,13 +17,16 @@ ExecutionContext: 단일 턴 실행에 필요한 모든 데이터를 담는 컨
       ↓ ctx.state = state_manager.apply(delta)   ← 상태 수정
   Agent
       ↓ context.build_messages()                  ← 읽기 전용
+
+매 턴 생성되므로 slots dataclass로 선언해 인스턴스 __dict__ 할당을 없앤다.
+임의 속성 추가는 불가 — 턴 내 임시 데이터는 metadata에 담는다.
 """
 
 from dataclasses import dataclass, field
 from typing import Any, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """
     단일 턴 실행 컨텍스트. Orchestrator가 생성해 FlowHandler와 Agent에 전달한다.
@@ -90,4 +90,19 @@ class EventType(str, Enum):
       index  int   현재 처리 중인 작업 번호 (1-based)
       total  int   전체 작업 수
       slots  dict  현재 작업의 slot 정보 {"target": "홍길동", "amount": 50000}
+      status str   (선택) 일괄 실행 시 건별 결과 "done" | "failed" — 완료 순서대로 emit
+    """
+
+    # ── 백그라운드 실행 (세션 이벤트 채널) ──────────────────────────────────────
+    EXECUTION_DONE = "EXECUTION_DONE"
+    """
+    백그라운드 실행 작업 완료. 턴 SSE가 아닌 GET /v1/agent/events 채널로 전달된다.
+    같은 채널로 해당 건의 TASK_PROGRESS(status: done|failed)도 함께 전달된다.
+
+    payload 필드:
+      job_id           str   작업 ID (접수 응답의 pending receipt와 같은 값)
+      idempotency_key  str   중복 실행 방지 키
+      status           str   "SUCCEEDED" | "FAILED"
+      result           dict  실행 결과 (성공 시, 예: {"transaction_id": "..."})
+      error            str   실패 사유 (실패 시)
     """
@@ -0,0 +1,13 @@
+from app.core.execution.channel import SessionEventChannel, get_channel
+from app.core.execution.executor import BackgroundExecutor, Job, get_executor
+from app.core.execution.outbox import AFTER_TURN, HookOutbox
+
+__all__ = [
+    "SessionEventChannel",
+    "get_channel",
+    "BackgroundExecutor",
+    "Job",
+    "get_executor",
+    "AFTER_TURN",
+    "HookOutbox",
+]
@@ -0,0 +1,121 @@
+# app/core/execution/channel.py
+"""
+SessionEventChannel: 턴 밖에서 발생한 이벤트(백그라운드 실행 진행·완료)를 세션별로 전달한다.
+
+SSE 턴 스트림은 DONE과 함께 닫히므로, 이후 이벤트는 클라이언트가 별도로 구독한다.
+    GET /v1/agent/events?session_id=...&after=<마지막으로 받은 seq>
+
+─── 동작 ───────────────────────────────────────────────────────────────────
+  publish(session_id, event)      이벤트에 seq(세션 내 단조 증가)를 붙여 버퍼에 추가
+  wait(session_id, after, timeout) seq > after인 이벤트를 반환. 없으면 timeout까지 대기
+  wait_async(...)                  wait의 asyncio 버전 — SSE 구독은 이벤트 루프에서 기다리며
+                                   스레드풀 스레드를 붙잡지 않는다. publish(작업 스레드)가
+                                   call_soon_threadsafe로 대기 중인 future를 깨운다.
+  세션별 최근 buffer_size건만 보관 — 재연결 시 after로 놓친 이벤트를 다시 받는다.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+_IDLE_SEC = 3600   # 이 시간 동안 publish가 없던 세션 버퍼는 정리
+
+
+class _SessionBuffer:
+    __slots__ = ("events", "seq", "updated")
+
+    def __init__(self, size: int):
+        self.events: deque = deque(maxlen=size)
+        self.seq = 0
+        self.updated = time.monotonic()
+
+
+class SessionEventChannel:
+    def __init__(self, buffer_size: int = 200):
+        self._buffers: Dict[str, _SessionBuffer] = {}
+        self._buffer_size = buffer_size
+        self._cond = threading.Condition()
+        self._waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+
+    def publish(self, session_id: str, event: Dict[str, Any]) -> int:
+        """이벤트({"event", "payload"})를 발행하고 부여된 seq를 반환."""
+        with self._cond:
+            buf = self._buffers.get(session_id)
+            if buf is None:
+                buf = self._buffers[session_id] = _SessionBuffer(self._buffer_size)
+                self._gc()
+            buf.seq += 1
+            buf.updated = time.monotonic()
+            buf.events.append({**event, "seq": buf.seq})
+            self._cond.notify_all()
+            for loop, fut in self._waiters.pop(session_id, ()):
+                try:
+                    loop.call_soon_threadsafe(_wake, fut)
+                except RuntimeError:
+                    pass   # 루프가 이미 닫힘 (구독자 종료)
+            return buf.seq
+
+    def wait(self, session_id: str, after: int = 0, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """seq > after 이벤트 목록. timeout 동안 새 이벤트가 없으면 빈 리스트."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                ready = self._ready(session_id, after)
+                if ready is not None:
+                    return ready
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return []
+                self._cond.wait(remaining)
+
+    async def wait_async(self, session_id: str, after: int = 0,
+                         timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """wait와 같지만 이벤트 루프에서 대기한다."""
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            ready = self._ready(session_id, after)
+            if ready is not None:
+                return ready
+            waiter = (loop, loop.create_future())
+            self._waiters.setdefault(session_id, []).append(waiter)
+        try:
+            await asyncio.wait({waiter[1]}, timeout=timeout)
+        finally:
+            with self._cond:
+                waiters = self._waiters.get(session_id)
+                if waiters and waiter in waiters:
+                    waiters.remove(waiter)
+                    if not waiters:
+                        del self._waiters[session_id]
+        with self._cond:
+            return self._ready(session_id, after) or []
+
+    def _ready(self, session_id: str, after: int) -> Optional[List[Dict[str, Any]]]:
+        buf = self._buffers.get(session_id)
+        if buf is not None and buf.seq > after:
+            return [e for e in buf.events if e["seq"] > after]
+        return None
+
+    def _gc(self) -> None:
+        now = time.monotonic()
+        for sid in [s for s, b in self._buffers.items() if now - b.updated > _IDLE_SEC]:
+            del self._buffers[sid]
+
+
+def _wake(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+_CHANNEL: Optional[SessionEventChannel] = None
+_LOCK = threading.Lock()
+
+
+def get_channel() -> SessionEventChannel:
+    global _CHANNEL
+    with _LOCK:
+        if _CHANNEL is None:
+            _CHANNEL = SessionEventChannel()
+        return _CHANNEL
@@ -0,0 +1,140 @@
+# app/core/execution/executor.py
+"""
+BackgroundExecutor: 턴(SSE 스트림) 밖에서 실행하는 작업 풀 + idempotency key 기반 중복 제거.
+
+느린 코어뱅킹 호출과 AgentRunner의 재시도 sleep이 SSE 워커를 붙잡지 않도록,
+FlowHandler는 실행 작업을 submit()으로 넘기고 곧바로 "접수됨" 응답을 보낸다.
+결과는 on_done 콜백이 세션 이벤트 채널(channel.py)로 전달한다.
+
+─── idempotency ───────────────────────────────────────────────────────────
+  같은 key로 다시 submit하면 새 작업을 만들지 않고 기존 Job(진행 중이든 완료든)을 반환한다.
+  → 클라이언트 재전송·중복 확인으로 같은 이체가 두 번 실행되지 않는다.
+  완료된 Job은 최근 max_jobs건까지 보관한다 (GET /v1/agent/executions/{job_id} 조회용).
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.logging import setup_logger
+
+PENDING = "PENDING"
+SUCCEEDED = "SUCCEEDED"
+FAILED = "FAILED"
+
+logger = setup_logger("Execution")
+
+
+@dataclass
+class Job:
+    """백그라운드 작업 1건의 상태."""
+    key: str
+    session_id: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = PENDING
+    result: Any = None
+    error: Optional[str] = None
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    data: Dict[str, Any] = field(default_factory=dict)   # 호출자가 붙이는 메타 (슬롯 등)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "idempotency_key": self.key,
+            "session_id": self.session_id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "submitted_at": self.submitted_at,
+            "finished_at": self.finished_at,
+            **self.data,
+        }
+
+
+class BackgroundExecutor:
+    """
+    Args:
+        max_workers: 동시에 실행할 작업 수
+        max_jobs:    보관할 Job 최대 건수 (초과 시 오래된 완료 Job부터 제거)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_jobs: int = 10_000):
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers or settings.EXECUTION_WORKERS, thread_name_prefix="exec",
+        )
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()   # key → Job
+        self._by_id: Dict[str, Job] = {}
+        self._max_jobs = max_jobs
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        key: str,
+        session_id: str,
+        fn: Callable[[], Any],
+        *,
+        on_done: Optional[Callable[[Job], None]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> tuple[Job, bool]:
+        """
+        작업을 접수한다. Returns: (Job, 새로 접수했는지). 같은 key가 있으면 (기존 Job, False).
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None:
+                return job, False
+            job = Job(key=key, session_id=session_id, data=dict(data or {}))
+            self._jobs[key] = job
+            self._by_id[job.id] = job
+            self._evict()
+        self._pool.submit(self._run, job, fn, on_done)
+        return job, True
+
+    def _run(self, job: Job, fn: Callable[[], Any], on_done: Optional[Callable[[Job], None]]) -> None:
+        try:
+            job.result = fn()
+            job.status = SUCCEEDED
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.status = FAILED
+        job.finished_at = time.time()
+        if on_done:
+            try:
+                on_done(job)
+            except Exception as e:
+                logger.warning(f"[execution] on_done failed for {job.key}: {e}")
+
+    def _evict(self) -> None:
+        while len(self._jobs) > self._max_jobs:
+            oldest_key = next(
+                (k for k, j in self._jobs.items() if j.status != PENDING), None,
+            )
+            if oldest_key is None:
+                return
+            self._by_id.pop(self._jobs.pop(oldest_key).id, None)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._by_id.get(job_id)
+
+    def get_by_key(self, key: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(key)
+
+
+_EXECUTOR: Optional[BackgroundExecutor] = None
+_LOCK = threading.Lock()
+
+
+def get_executor() -> BackgroundExecutor:
+    global _EXECUTOR
+    with _LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = BackgroundExecutor()
+        return _EXECUTOR
@@ -0,0 +1,323 @@
+# app/core/execution/outbox.py
+"""
+HookOutbox: hook_handlers·after_turn 호출을 SQLite outbox에 기록하고 워커 풀이 비동기로 전달한다.
+
+턴 종료(finally) 경로에서 푸시 알림·감사 로그 같은 느린 부수효과를 직접 실행하면 SSE 스트림 종료가
+늦어지고, 실패하면 로그만 남고 유실된다. outbox에 기록(커밋)만 하고 반환하면 지연 경로에서 빠지고,
+프로세스가 죽어도 미전달 건이 남아 재시작 후 다시 전달된다 (at-least-once — 핸들러는 멱등하게 작성).
+
+─── 기록 (group commit) ────────────────────────────────────────────────────
+  enqueue()는 writer 스레드의 대기열에 넣고 커밋될 때까지 기다린다.
+  writer는 쌓인 레코드를 한 트랜잭션으로 묶어 커밋 → 동시 턴들이 fsync 1회를 공유한다.
+  커밋이 실패하면 그 배치의 enqueue()가 모두 예외를 올린다 — 호출자(CoreOrchestrator)가 핸들러를
+  직접 호출하는 경로로 대체해 훅이 조용히 유실되지 않게 한다.
+
+─── 전달 ───────────────────────────────────────────────────────────────────
+  dispatcher 스레드가 due 레코드를 hook 타입별로 남은 한도만큼 id 순으로 꺼내, 타입을 번갈아 워커 풀에 넘긴다.
+    - hook 타입별 동시 실행 한도 (HOOK_OUTBOX_LIMITS, 기본 HOOK_OUTBOX_WORKERS)
+      타입마다 따로 꺼내므로 한 타입의 밀린 레코드가 다른 타입의 전달을 막지 않는다
+    - 실패 시 지수 백오프 재시도 (HOOK_OUTBOX_BACKOFF_SEC × 2^(attempts-1))
+    - HOOK_OUTBOX_MAX_ATTEMPTS 소진 시 status="dead" (dead letter — dead_letters()로 조회, requeue() 가능)
+  시작 시 inflight로 남은 레코드(이전 프로세스 중단)는 pending으로 되돌린다.
+  close()는 dispatcher를 멈추고 진행 중 전달·대기 중 기록을 마친 뒤 writer를 멈추고 DB를 닫는다.
+
+─── 핸들러 호출 ────────────────────────────────────────────────────────────
+  기록 시점의 ctx는 직렬화할 수 없으므로, 전달 시 ExecutionContext를 다시 만든다:
+    session_id·user_message는 원본, state는 기록 시점 model_dump()를 state_model(manifest의
+    state.model)로 model_validate한 객체 — 직접 호출과 같이 ctx.state.stage로 읽을 수 있다
+    (state_model이 없으면 dict). memory는 기록 시점 memory 스냅샷, metadata = {"outbox_id", "attempt"}.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.context import ExecutionContext
+from app.core.logging import setup_logger
+
+AFTER_TURN = "__after_turn__"   # after_turn 콜백 레코드의 hook_type
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    hook_type    TEXT    NOT NULL,
+    session_id   TEXT    NOT NULL,
+    user_message TEXT    NOT NULL,
+    state        TEXT    NOT NULL,
+    data         TEXT    NOT NULL,
+    memory       TEXT    NOT NULL DEFAULT '{}',
+    status       TEXT    NOT NULL DEFAULT 'pending',
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    next_at      REAL    NOT NULL,
+    last_error   TEXT,
+    created_at   REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_at);
+CREATE INDEX IF NOT EXISTS outbox_type_due ON outbox (status, hook_type, next_at);
+"""
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+class _Write:
+    """enqueue 대기자 — writer가 커밋 결과(error=None이면 성공)를 채우고 done을 set."""
+    __slots__ = ("done", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+def _default_path() -> str:
+    """워커 프로세스(WorkerSupervisor)마다 별도 파일 — 같은 id로 재기동한 워커가 미전달 행을 이어받는다."""
+    path = settings.HOOK_OUTBOX_PATH or os.path.join(settings.LOG_DIR, "hook_outbox.db")
+    worker_id = os.getenv("SUPERVISOR_WORKER_ID")
+    if worker_id:
+        root, ext = os.path.splitext(path)
+        path = f"{root}-{worker_id}{ext}"
+    return path
+
+
+class HookOutbox:
+    """
+    Args:
+        handlers:     hook_type → (ctx, data) 핸들러. after_turn은 AFTER_TURN 키로 등록.
+        state_model:  전달 시 ctx.state를 복원할 pydantic 모델 (manifest["state"]["model"])
+        path:         SQLite 파일 경로 (기본 HOOK_OUTBOX_PATH, 비어있으면 LOG_DIR/hook_outbox.db.
+                      WorkerSupervisor 워커 프로세스에서는 파일명에 워커 id를 붙인다)
+        workers:      전달 워커 수
+        limits:       hook_type → 동시 실행 한도
+        max_attempts: 이 횟수만큼 실패하면 dead letter
+        backoff_sec:  첫 재시도 대기 (이후 2배씩)
+    """
+
+    def __init__(
+        self,
+        handlers: Dict[str, Callable[[ExecutionContext, Any], None]],
+        *,
+        state_model: Optional[Any] = None,
+        path: Optional[str] = None,
+        workers: Optional[int] = None,
+        limits: Optional[Dict[str, int]] = None,
+        max_attempts: Optional[int] = None,
+        backoff_sec: Optional[float] = None,
+        poll_sec: float = 0.5,
+    ):
+        self.handlers = handlers
+        self.state_model = state_model
+        self.path = path or _default_path()
+        self.workers = workers or settings.HOOK_OUTBOX_WORKERS
+        self.limits = limits if limits is not None else (
+            json.loads(settings.HOOK_OUTBOX_LIMITS) if settings.HOOK_OUTBOX_LIMITS else {}
+        )
+        self.max_attempts = max_attempts or settings.HOOK_OUTBOX_MAX_ATTEMPTS
+        self.backoff_sec = backoff_sec if backoff_sec is not None else settings.HOOK_OUTBOX_BACKOFF_SEC
+        self.poll_sec = poll_sec
+        self.logger = setup_logger("HookOutbox")
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(outbox)")}
+        if "memory" not in columns:   # memory 컬럼 이전에 만든 파일
+            self._db.execute("ALTER TABLE outbox ADD COLUMN memory TEXT NOT NULL DEFAULT '{}'")
+        self._db.execute("UPDATE outbox SET status='pending' WHERE status='inflight'")
+        self._db_lock = threading.Lock()
+
+        self._pending_writes: List[tuple] = []
+        self._write_cond = threading.Condition()
+        self._dispatch_cond = threading.Condition()
+        self._running: Dict[str, int] = {}
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="outbox")
+        self._stopped = False
+        self._writer = threading.Thread(target=self._writer_loop, name="outbox-writer", daemon=True)
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="outbox-dispatch", daemon=True)
+        self._writer.start()
+        self._dispatcher.start()
+
+    # ── 기록 ─────────────────────────────────────────────────────────────────
+
+    def enqueue(self, hook_type: str, ctx: ExecutionContext, data: Any) -> None:
+        """레코드를 기록하고 커밋될 때까지 기다린다 (group commit). 커밋 실패 시 그 예외를 올린다."""
+        state = ctx.state.model_dump(mode="json") if hasattr(ctx.state, "model_dump") else ctx.state
+        row = (hook_type, ctx.session_id, ctx.user_message, _dumps(state), _dumps(data), _dumps(ctx.memory or {}))
+        waiter = _Write()
+        with self._write_cond:
+            if self._stopped:
+                raise RuntimeError("outbox is closed")
+            self._pending_writes.append((row, waiter))
+            self._write_cond.notify()
+        waiter.done.wait()
+        if waiter.error is not None:
+            raise waiter.error
+
+    def _writer_loop(self) -> None:
+        while True:
+            with self._write_cond:
+                while not self._pending_writes and not self._stopped:
+                    self._write_cond.wait()
+                if not self._pending_writes:
+                    return   # close() — 대기 중인 기록을 모두 커밋한 뒤 종료
+                batch, self._pending_writes = self._pending_writes, []
+            now = time.time()
+            error = None
+            try:
+                with self._db_lock:
+                    self._db.execute("BEGIN")
+                    self._db.executemany(
+                        "INSERT INTO outbox (hook_type, session_id, user_message, state, data, memory, "
+                        "next_at, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        [(*row, now, now) for row, _ in batch],
+                    )
+                    self._db.execute("COMMIT")
+            except Exception as e:
+                self.logger.error(f"[outbox] write failed ({len(batch)} records): {e}")
+                error = e
+                with self._db_lock:
+                    if self._db.in_transaction:
+                        self._db.execute("ROLLBACK")
+            for _, waiter in batch:
+                waiter.error = error
+                waiter.done.set()
+            with self._dispatch_cond:
+                self._dispatch_cond.notify()
+
+    # ── 전달 ─────────────────────────────────────────────────────────────────
+
+    def _limit(self, hook_type: str) -> int:
+        return self.limits.get(hook_type, self.workers)
+
+    def _dispatch_loop(self) -> None:
+        while not self._stopped:
+            try:
+                claimed = self._claim_due()
+            except Exception as e:   # DB 오류로 dispatcher가 죽지 않게 — 다음 폴링에 재시도
+                self.logger.error(f"[outbox] claim failed: {e}")
+                claimed = []
+            if not claimed:
+                with self._dispatch_cond:
+                    self._dispatch_cond.wait(self.poll_sec)
+                continue
+            for record in claimed:
+                self._pool.submit(self._deliver, record)
+
+    def _claim_due(self) -> List[tuple]:
+        """
+        hook 타입마다 남은 동시 실행 한도만큼 due 레코드를 inflight로 전환해 반환.
+        반환 순서는 타입을 번갈아(round-robin) — 풀에 제출되는 순서도 한 타입에 몰리지 않는다.
+        """
+        now = time.time()
+        with self._db_lock:
+            types = [r[0] for r in self._db.execute(
+                "SELECT DISTINCT hook_type FROM outbox WHERE status='pending' AND next_at <= ?", (now,),
+            )]
+            per_type = []
+            with self._dispatch_cond:
+                for hook_type in types:
+                    free = self._limit(hook_type) - self._running.get(hook_type, 0)
+                    if free <= 0:
+                        continue
+                    rows = self._db.execute(
+                        "SELECT id, hook_type, session_id, user_message, state, data, memory, attempts FROM outbox "
+                        "WHERE status='pending' AND hook_type=? AND next_at <= ? ORDER BY id LIMIT ?",
+                        (hook_type, now, free),
+                    ).fetchall()
+                    self._running[hook_type] = self._running.get(hook_type, 0) + len(rows)
+                    per_type.append(rows)
+            claimed = [row for group in zip_longest(*per_type) for row in group if row is not None]
+            if claimed:
+                self._db.executemany(
+                    "UPDATE outbox SET status='inflight' WHERE id=?", [(r[0],) for r in claimed],
+                )
+            return claimed
+
+    def _deliver(self, record: tuple) -> None:
+        outbox_id, hook_type, session_id, user_message, state, data, memory, attempts = record
+        attempt = attempts + 1
+        try:
+            handler = self.handlers.get(hook_type)
+            if handler is None:
+                raise LookupError(f"no handler for hook '{hook_type}'")
+            state = json.loads(state)
+            if self.state_model is not None:
+                state = self.state_model.model_validate(state)
+            ctx = ExecutionContext(
+                session_id=session_id,
+                user_message=user_message,
+                state=state,
+                memory=json.loads(memory),
+                metadata={"outbox_id": outbox_id, "attempt": attempt},
+            )
+            handler(ctx, json.loads(data))
+        except Exception as e:
+            self._fail(outbox_id, hook_type, attempt, f"{type(e).__name__}: {e}")
+        else:
+            with self._db_lock:
+                self._db.execute("DELETE FROM outbox WHERE id=?", (outbox_id,))
+        finally:
+            with self._dispatch_cond:
+                self._running[hook_type] -= 1
+                self._dispatch_cond.notify()
+
+    def _fail(self, outbox_id: int, hook_type: str, attempt: int, error: str) -> None:
+        if attempt >= self.max_attempts:
+            self.logger.error(f"[outbox] '{hook_type}' #{outbox_id} dead after {attempt} attempts: {error}")
+            status, next_at = "dead", time.time()
+        else:
+            self.logger.warning(f"[outbox] '{hook_type}' #{outbox_id} attempt {attempt} failed: {error}")
+            status, next_at = "pending", time.time() + self.backoff_sec * (2 ** (attempt - 1))
+        with self._db_lock:
+            self._db.execute(
+                "UPDATE outbox SET status=?, attempts=?, next_at=?, last_error=? WHERE id=?",
+                (status, attempt, next_at, error, outbox_id),
+            )
+
+    # ── 운영 ─────────────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, int]:
+        with self._db_lock:
+            rows = self._db.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        return {"pending": 0, "inflight": 0, "dead": 0, **dict(rows)}
+
+    def dead_letters(self, limit: int = 100) -> List[Dict[str, Any]]:
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT id, hook_type, session_id, data, attempts, last_error, created_at FROM outbox "
+                "WHERE status='dead' ORDER BY id LIMIT ?", (limit,),
+            ).fetchall()
+        keys = ("id", "hook_type", "session_id", "data", "attempts", "last_error", "created_at")
+        return [{**dict(zip(keys, r)), "data": json.loads(r[3])} for r in rows]
+
+    def requeue(self, outbox_id: int) -> None:
+        """dead letter를 다시 전달 대상으로 (시도 횟수 초기화)."""
+        with self._db_lock:
+            self._db.execute(
+                "UPDATE outbox SET status='pending', attempts=0, next_at=? WHERE id=? AND status='dead'",
+                (time.time(), outbox_id),
+            )
+        with self._dispatch_cond:
+            self._dispatch_cond.notify()
+
+    def close(self) -> None:
+        """dispatcher → 진행 중 전달 → writer 순으로 멈추고 DB를 닫는다. 이후 enqueue는 RuntimeError."""
+        with self._write_cond:
+            self._stopped = True
+            self._write_cond.notify_all()
+        with self._dispatch_cond:
+            self._dispatch_cond.notify_all()
+        self._dispatcher.join()
+        self._pool.shutdown(wait=True)
+        self._writer.join()
+        with self._db_lock:
+            self._db.close()
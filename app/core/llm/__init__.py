@@ -2,15 +2,43 @@
 from app.core.llm.base_client import BaseLLMClient, LLMResponse, ToolCall
 
 
-def create_llm_client(provider: str = "openai") -> BaseLLMClient:
-    """프로바이더 이름으로 LLM 클라이언트 인스턴스를 생성한다."""
+def create_llm_client(
+    provider: str = "openai",
+    backends: list | None = None,
+    priority: str | None = None,
+) -> BaseLLMClient:
+    """
+    프로바이더 이름으로 LLM 클라이언트 인스턴스를 생성한다.
+
+    provider="router"면 backends(card.json llm.backends) 위의 RoutingLLMClient를 반환한다.
+    프로바이더 클라이언트는 single-flight → 호출 한도(rate limiter) → 스케줄러 슬롯 → circuit breaker
+    순으로 감싸서 반환한다. 한도 토큰을 먼저 얻으므로 한도 대기 중에는 스케줄러 슬롯을 잡고 있지 않는다.
+    priority: 한도 대기열 우선순위 클래스 ("execute" | "slot" | "intent" | "summarization" ...).
+    """
+    if provider == "router":
+        from app.core.llm.routing_client import RoutingLLMClient
+        return RoutingLLMClient(backends or [], priority=priority)
     if provider == "openai":
         from app.core.llm.openai_client import OpenAIClient
-        return OpenAIClient()
-    if provider == "anthropic":
+        client = OpenAIClient()
+    elif provider == "anthropic":
         from app.core.llm.anthropic_client import AnthropicClient
-        return AnthropicClient()
-    raise ValueError(f"Unknown LLM provider: {provider}")
+        client = AnthropicClient()
+    else:
+        raise ValueError(f"Unknown LLM provider: {provider}")
+
+    from app.core.llm.circuit_breaker import CircuitBreakerClient
+    from app.core.llm.coalescing import CoalescingClient
+    from app.core.llm.rate_limiter import RateLimitedClient
+    from app.core.llm.scheduler import ScheduledClient
+    return CoalescingClient(
+        RateLimitedClient(
+            ScheduledClient(CircuitBreakerClient(client, provider), priority),
+            provider,
+            priority,
+        ),
+        provider,
+    )
 
 
 __all__ = ["BaseLLMClient", "LLMResponse", "ToolCall", "create_llm_client"]
@@ -70,9 +70,14 @@ class AnthropicClient(BaseLLMClient):
                     arguments=block.input if isinstance(block.input, dict) else json.loads(block.input),
                 ))
 
+        usage = {}
+        if getattr(resp, "usage", None):
+            usage = {"input_tokens": resp.usage.input_tokens, "output_tokens": resp.usage.output_tokens}
+
         return LLMResponse(
             content=content_text.strip() or None,
             tool_calls=tool_calls,
+            usage=usage,
             _raw=resp,
         )
 
@@ -17,7 +17,7 @@ from dataclasses import dataclass, field
 from typing import Any, Generator
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """프로바이더 독립적 tool call 표현."""
     id: str
@@ -25,11 +25,12 @@ class ToolCall:
     arguments: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """프로바이더 독립적 LLM 응답."""
     content: str | None = None
     tool_calls: list[ToolCall] = field(default_factory=list)
+    usage: dict = field(default_factory=dict)  # {"input_tokens": int, "output_tokens": int}
     _raw: Any = None  # 프로바이더별 원본 (tool-call 루프에서 assistant message 구성에 사용)
 
 
@@ -0,0 +1,234 @@
+# app/core/llm/circuit_breaker.py
+"""
+(provider, model) 단위 circuit breaker + BaseLLMClient 래퍼.
+
+프로바이더 장애 중에도 AgentRunner가 매 attempt마다 호출 → 실패 대기 → sleep → 재시도를 반복하면
+부하와 지연만 늘어난다. breaker가 열려 있으면 호출 없이 즉시 CircuitOpenError를 던진다.
+AgentRunner는 이를 재시도하지 않는 오류(FatalExecutionError)로 처리하므로 곧바로 on_error 응답으로 이어진다.
+
+─── 상태 ───────────────────────────────────────────────────────────────────
+  CLOSED    — 정상. 최근 LLM_CB_WINDOW건 중 실패율 또는 느린 호출 비율이 임계값 이상이면 OPEN.
+              (최소 LLM_CB_MIN_CALLS건이 쌓인 뒤부터 판단)
+  OPEN      — 즉시 실패. LLM_CB_OPEN_SEC 경과 후 첫 호출에서 HALF_OPEN.
+  HALF_OPEN — 시험 호출 1건만 통과. 성공 → CLOSED(창 초기화), 실패·느림 → 다시 OPEN.
+
+  느린 호출: chat은 전체 지연, chat_stream은 첫 토큰까지 지연이 LLM_CB_SLOW_CALL_SEC 초과.
+
+─── 이벤트·메트릭 ──────────────────────────────────────────────────────────
+  subscribe(listener)     상태 전이마다 listener({"key", "from", "to", "ts", "reason"}) 호출
+  recent_transitions()    최근 전이 이벤트 (최대 100건)
+  breaker_metrics()       "provider:model" → {state, calls, failures, slow_calls, rejected, window_*}
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Generator, List
+
+from app.core.config import settings
+from app.core.llm.base_client import BaseLLMClient, LLMResponse
+from app.core.logging import setup_logger
+
+CLOSED = "CLOSED"
+OPEN = "OPEN"
+HALF_OPEN = "HALF_OPEN"
+
+logger = setup_logger("LLM.CircuitBreaker")
+
+
+class CircuitOpenError(Exception):
+    """breaker가 열려 있어 호출하지 않고 즉시 실패."""
+
+
+class CircuitBreaker:
+    """(provider, model) 하나의 breaker. get_breaker()로 프로세스 전역 공유 인스턴스를 얻는다."""
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        failure_rate: float | None = None,
+        slow_call_sec: float | None = None,
+        slow_rate: float | None = None,
+        window: int | None = None,
+        min_calls: int | None = None,
+        open_sec: float | None = None,
+    ):
+        self.key = key
+        self.failure_rate = failure_rate if failure_rate is not None else settings.LLM_CB_FAILURE_RATE
+        self.slow_call_sec = slow_call_sec if slow_call_sec is not None else settings.LLM_CB_SLOW_CALL_SEC
+        self.slow_rate = slow_rate if slow_rate is not None else settings.LLM_CB_SLOW_RATE
+        self.min_calls = min_calls if min_calls is not None else settings.LLM_CB_MIN_CALLS
+        self.open_sec = open_sec if open_sec is not None else settings.LLM_CB_OPEN_SEC
+        self.state = CLOSED
+        self._window: deque = deque(maxlen=window or settings.LLM_CB_WINDOW)   # (failed, slow)
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.RLock()   # 전이 리스너가 snapshot()을 호출해도 교착 없도록
+        self.counters = {"calls": 0, "failures": 0, "slow_calls": 0, "rejected": 0}
+
+    # ── 호출 전후 ────────────────────────────────────────────────────────────
+
+    def available(self) -> bool:
+        """호출을 통과시킬 수 있는 상태인지 (상태 변경 없음). 라우터의 백엔드 선택에 사용."""
+        if self.state == OPEN:
+            return time.monotonic() - self._opened_at >= self.open_sec
+        return not (self.state == HALF_OPEN and self._probing)
+
+    def before_call(self) -> None:
+        """호출 허용 여부 판단. 거부 시 CircuitOpenError."""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.open_sec:
+                self._transition(HALF_OPEN, "open_timeout")
+            if self.state == OPEN or (self.state == HALF_OPEN and self._probing):
+                self.counters["rejected"] += 1
+                raise CircuitOpenError(f"circuit_open: {self.key}")
+            if self.state == HALF_OPEN:
+                self._probing = True
+
+    def release(self) -> None:
+        """결과 없이 끝난 호출(스트림 소비 중단 등)의 시험 호출 슬롯 반환."""
+        with self._lock:
+            self._probing = False
+
+    def record(self, *, failed: bool, latency: float) -> None:
+        slow = bool(self.slow_call_sec) and latency > self.slow_call_sec
+        with self._lock:
+            self.counters["calls"] += 1
+            self.counters["failures"] += int(failed)
+            self.counters["slow_calls"] += int(slow)
+
+            if self.state == HALF_OPEN:
+                self._probing = False
+                if failed or slow:
+                    self._open("probe_failed" if failed else "probe_slow")
+                else:
+                    self._window.clear()
+                    self._transition(CLOSED, "probe_succeeded")
+                return
+
+            self._window.append((failed, slow))
+            n = len(self._window)
+            if self.state != CLOSED or n < self.min_calls:
+                return
+            fail_ratio = sum(f for f, _ in self._window) / n
+            slow_ratio = sum(s for _, s in self._window) / n
+            if fail_ratio >= self.failure_rate:
+                self._open(f"failure_rate={fail_ratio:.2f}")
+            elif slow_ratio >= self.slow_rate:
+                self._open(f"slow_rate={slow_ratio:.2f}")
+
+    # ── 내부 ─────────────────────────────────────────────────────────────────
+
+    def _open(self, reason: str) -> None:
+        self._opened_at = time.monotonic()
+        self._transition(OPEN, reason)
+
+    def _transition(self, to: str, reason: str) -> None:
+        event = {"key": self.key, "from": self.state, "to": to, "ts": time.time(), "reason": reason}
+        self.state = to
+        _publish(event)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            n = len(self._window)
+            return {
+                "state": self.state,
+                **self.counters,
+                "window_calls": n,
+                "window_failure_rate": round(sum(f for f, _ in self._window) / n, 3) if n else 0.0,
+                "window_slow_rate": round(sum(s for _, s in self._window) / n, 3) if n else 0.0,
+            }
+
+
+# ── 전역 레지스트리 · 이벤트 ────────────────────────────────────────────────
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_REGISTRY_LOCK = threading.Lock()
+_LISTENERS: List[Callable[[Dict[str, Any]], None]] = []
+_TRANSITIONS: deque = deque(maxlen=100)
+
+
+def get_breaker(provider: str, model: str) -> CircuitBreaker:
+    key = f"{provider}:{model}"
+    with _REGISTRY_LOCK:
+        if key not in _BREAKERS:
+            _BREAKERS[key] = CircuitBreaker(key)
+        return _BREAKERS[key]
+
+
+def subscribe(listener: Callable[[Dict[str, Any]], None]) -> None:
+    """breaker 상태 전이 이벤트 리스너 등록 (알림·메트릭 수집기 연결용)."""
+    _LISTENERS.append(listener)
+
+
+def recent_transitions() -> List[Dict[str, Any]]:
+    return list(_TRANSITIONS)
+
+
+def breaker_metrics() -> Dict[str, Dict[str, Any]]:
+    with _REGISTRY_LOCK:
+        breakers = list(_BREAKERS.values())
+    return {b.key: b.snapshot() for b in breakers}
+
+
+def _publish(event: Dict[str, Any]) -> None:
+    _TRANSITIONS.append(event)
+    logger.warning(f"[breaker] {event['key']} {event['from']} → {event['to']} ({event['reason']})")
+    for listener in list(_LISTENERS):
+        try:
+            listener(event)
+        except Exception as e:
+            logger.warning(f"[breaker] listener error: {e}")
+
+
+# ── BaseLLMClient 래퍼 ──────────────────────────────────────────────────────
+
+class CircuitBreakerClient(BaseLLMClient):
+    """
+    프로바이더 클라이언트를 감싸 (provider, model) breaker를 적용한다.
+    create_llm_client()가 openai·anthropic 클라이언트를 항상 이 래퍼로 반환한다.
+    """
+
+    def __init__(self, client: BaseLLMClient, provider: str):
+        self.client = client
+        self.provider = provider
+
+    def chat(self, *, model: str, **kwargs) -> LLMResponse:
+        breaker = get_breaker(self.provider, model)
+        breaker.before_call()
+        started = time.monotonic()
+        try:
+            resp = self.client.chat(model=model, **kwargs)
+        except Exception:
+            breaker.record(failed=True, latency=time.monotonic() - started)
+            raise
+        breaker.record(failed=False, latency=time.monotonic() - started)
+        return resp
+
+    def chat_stream(self, *, model: str, **kwargs) -> Generator[str, None, None]:
+        breaker = get_breaker(self.provider, model)
+        breaker.before_call()
+        started = time.monotonic()
+        recorded = False
+        try:
+            for token in self.client.chat_stream(model=model, **kwargs):
+                if not recorded:
+                    breaker.record(failed=False, latency=time.monotonic() - started)
+                    recorded = True
+                yield token
+        except Exception:
+            if not recorded:
+                breaker.record(failed=True, latency=time.monotonic() - started)
+                recorded = True
+            raise
+        finally:
+            if not recorded:
+                # 정상 종료(토큰 0개) 또는 소비 중단(GeneratorExit)
+                breaker.release()
+
+    def build_assistant_message(self, response: LLMResponse) -> dict:
+        return self.client.build_assistant_message(response)
+
+    def build_tool_result_message(self, tool_call_id: str, content: str) -> dict:
+        return self.client.build_tool_result_message(tool_call_id, content)
@@ -0,0 +1,177 @@
+# app/core/llm/coalescing.py
+"""
+Single-flight: 동시에 들어온 동일한 결정론적 LLM 요청은 업스트림 호출 1회를 공유한다.
+
+트래픽이 몰릴 때 프론트 버튼 문구("확인", "취소", "계속 진행")가 히스토리 없이 IntentAgent로
+동시에 들어오면 같은 프롬프트가 여러 번 호출된다. 먼저 온 요청(leader)만 호출하고,
+진행 중에 들어온 같은 요청(follower)은 그 결과 — 스트리밍이면 토큰 스트림 — 를 함께 받는다.
+
+─── 대상 ───────────────────────────────────────────────────────────────────
+  temperature == 0 이고 요청 전체(provider·model·system·messages·tools)가 JSON 직렬화 가능한 경우.
+  tool-call 루프 중간 요청(SDK 메시지 객체 포함)은 직렬화되지 않으므로 자동으로 제외된다.
+  캐시가 아니다 — 호출이 끝나면 key가 사라지고, 이후 요청은 새로 호출한다.
+  without_coalescing(fn) 안의 호출은 제외 — hedge 요청(app/core/agents/hedging.py)은 같은 요청의
+  primary에 합류하면 의미가 없으므로 항상 업스트림을 따로 호출한다.
+
+─── 스트리밍 ───────────────────────────────────────────────────────────────
+  업스트림 스트림은 별도 pump 스레드가 버퍼로 읽어 들이고, leader·follower 모두 버퍼를 구독한다.
+  → 어느 소비자가 중간에 끊어도 다른 소비자의 스트림은 계속된다.
+"""
+
+import contextvars
+import dataclasses
+import hashlib
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Generator, List, Optional
+
+from app.core.llm.base_client import BaseLLMClient, LLMResponse
+
+_INFLIGHT: Dict[str, Any] = {}
+_LOCK = threading.Lock()
+_COUNTERS = {"upstream_calls": 0, "coalesced": 0}
+_BYPASS: contextvars.ContextVar[bool] = contextvars.ContextVar("llm_coalescing_bypass", default=False)
+
+
+def without_coalescing(fn: Callable[..., Any], *args: Any) -> Any:
+    """fn(*args) 안의 LLM 호출은 진행 중인 같은 요청에 합류하지 않고 업스트림을 직접 호출한다."""
+    token = _BYPASS.set(True)
+    try:
+        return fn(*args)
+    finally:
+        _BYPASS.reset(token)
+
+
+def request_key(provider: str, model: str, temperature: float, system_prompt: str,
+                messages: list, tools: Optional[list] = None, stream: bool = False) -> Optional[str]:
+    """정규화한 요청 해시. 결정론적이 아니거나 직렬화할 수 없으면 None (coalescing 제외)."""
+    if temperature != 0:
+        return None
+    try:
+        canonical = json.dumps(
+            [provider, model, system_prompt, messages, tools, stream],
+            ensure_ascii=False, sort_keys=True, separators=(",", ":"),
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def coalescing_metrics() -> Dict[str, int]:
+    with _LOCK:
+        return {**_COUNTERS, "inflight": len(_INFLIGHT)}
+
+
+class _StreamFlight:
+    """업스트림 토큰 버퍼. pump 스레드가 채우고 구독자들이 읽는다."""
+
+    def __init__(self):
+        self.tokens: List[str] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.cond = threading.Condition()
+
+    def pump(self, upstream, key: str) -> None:
+        try:
+            for token in upstream:
+                with self.cond:
+                    self.tokens.append(token)
+                    self.cond.notify_all()
+        except BaseException as e:
+            self.error = e
+        finally:
+            with _LOCK:
+                _INFLIGHT.pop(key, None)
+            with self.cond:
+                self.done = True
+                self.cond.notify_all()
+
+    def subscribe(self) -> Generator[str, None, None]:
+        i = 0
+        while True:
+            with self.cond:
+                while i >= len(self.tokens) and not self.done:
+                    self.cond.wait()
+                batch = self.tokens[i:]
+                finished = self.done
+            i += len(batch)
+            yield from batch
+            if finished and i >= len(self.tokens):
+                if self.error is not None:
+                    raise self.error
+                return
+
+
+class CoalescingClient(BaseLLMClient):
+    """create_llm_client()가 가장 바깥에 씌우는 래퍼. follower는 스케줄러 슬롯·호출 한도를 쓰지 않는다."""
+
+    def __init__(self, client: BaseLLMClient, provider: str):
+        self.client = client
+        self.provider = provider
+
+    def chat(self, *, model: str, temperature: float, system_prompt: str, messages: list,
+             timeout: int | None = None, tools: list | None = None) -> LLMResponse:
+        key = request_key(self.provider, model, temperature, system_prompt, messages, tools)
+        call = lambda: self.client.chat(
+            model=model, temperature=temperature, system_prompt=system_prompt,
+            messages=messages, timeout=timeout, tools=tools,
+        )
+        if key is None or _BYPASS.get():
+            return call()
+
+        with _LOCK:
+            flight = _INFLIGHT.get(key)
+            leader = flight is None
+            if leader:
+                flight = _INFLIGHT[key] = Future()
+                _COUNTERS["upstream_calls"] += 1
+            else:
+                _COUNTERS["coalesced"] += 1
+
+        if not leader:
+            # 토큰 사용량은 leader에만 귀속 (follower는 업스트림 비용 없음)
+            return dataclasses.replace(flight.result(), usage={})
+
+        try:
+            resp = call()
+            flight.set_result(resp)
+            return resp
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        finally:
+            with _LOCK:
+                _INFLIGHT.pop(key, None)
+
+    def chat_stream(self, *, model: str, temperature: float, system_prompt: str, messages: list,
+                    timeout: int | None = None) -> Generator[str, None, None]:
+        key = request_key(self.provider, model, temperature, system_prompt, messages, stream=True)
+        upstream = lambda: self.client.chat_stream(
+            model=model, temperature=temperature, system_prompt=system_prompt,
+            messages=messages, timeout=timeout,
+        )
+        if key is None or _BYPASS.get():
+            yield from upstream()
+            return
+
+        with _LOCK:
+            flight = _INFLIGHT.get(key)
+            if flight is None:
+                flight = _INFLIGHT[key] = _StreamFlight()
+                _COUNTERS["upstream_calls"] += 1
+                # 스케줄러 세션 등 contextvar를 pump 스레드로 전달
+                ctx = contextvars.copy_context()
+                threading.Thread(
+                    target=ctx.run, args=(flight.pump, upstream(), key),
+                    name="llm-stream-pump", daemon=True,
+                ).start()
+            else:
+                _COUNTERS["coalesced"] += 1
+        yield from flight.subscribe()
+
+    def build_assistant_message(self, response: LLMResponse) -> dict:
+        return self.client.build_assistant_message(response)
+
+    def build_tool_result_message(self, tool_call_id: str, content: str) -> dict:
+        return self.client.build_tool_result_message(tool_call_id, content)
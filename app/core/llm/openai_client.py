@@ -53,9 +53,14 @@ class OpenAIClient(BaseLLMClient):
                     arguments=json.loads(tc.function.arguments),
                 ))
 
+        usage = {}
+        if getattr(resp, "usage", None):
+            usage = {"input_tokens": resp.usage.prompt_tokens, "output_tokens": resp.usage.completion_tokens}
+
         return LLMResponse(
             content=(choice.message.content or "").strip() or None,
             tool_calls=tool_calls,
+            usage=usage,
             _raw=choice.message,
         )
 
@@ -0,0 +1,219 @@
+# app/core/llm/rate_limiter.py
+"""
+클라이언트 측 LLM 호출 한도(RPM·TPM) 관리 — (provider, model) 단위 토큰 버킷 + 우선순위 대기열.
+
+프로바이더 한도를 모른 채 몰아서 호출하면 429 → 재시도 → 지연 연쇄가 생긴다.
+한도 안에서만 호출을 내보내고, 잠깐 기다려도 안 되면 즉시 RateLimitedError로 부하를 덜어낸다.
+AgentRunner는 이를 재시도하지 않으므로(FatalExecutionError) 사용자에게 곧바로 안내 메시지가 간다.
+
+─── 설정 (.env) ────────────────────────────────────────────────────────────
+  LLM_RATE_LIMITS='{"openai:gpt-4o-mini": {"rpm": 5000, "tpm": 2000000}, "anthropic:*": {"rpm": 1000}}'
+    키: "provider:model" 또는 "provider:*". 설정이 없는 (provider, model)은 제한 없음.
+  LLM_QUEUE_MAX_WAIT_SEC   대기열에서 기다릴 최대 시간 (기본 2초)
+  LLM_QUEUE_MAX_DEPTH      대기열 최대 길이. 초과 시 즉시 거절 (기본 32)
+
+─── 우선순위 (작을수록 먼저) ───────────────────────────────────────────────
+  execute(0) > slot·interaction(1) > intent(2) > summarization(3)
+  에이전트 우선순위는 card.json policy.priority (없으면 에이전트 키)로 정해지고,
+  registry가 llm_config["priority"]로 넘겨 create_llm_client()가 클라이언트에 고정한다.
+
+─── 토큰 추정 ──────────────────────────────────────────────────────────────
+  tokenizer 없이 UTF-8 바이트 / 3 (한글 1자 ≈ 1토큰, 영문은 약간 과대 추정)
+  + 응답 예약분 OUTPUT_TOKEN_RESERVE.
+"""
+
+import heapq
+import itertools
+import json
+import threading
+import time
+from typing import Dict, Generator, Optional
+
+from app.core.config import settings
+from app.core.llm.base_client import BaseLLMClient, LLMResponse
+
+PRIORITY_CLASSES: Dict[str, int] = {
+    "execute": 0,
+    "slot": 1,
+    "interaction": 1,
+    "intent": 2,
+    "summarization": 3,
+}
+DEFAULT_PRIORITY = 1
+OUTPUT_TOKEN_RESERVE = 256
+
+
+class RateLimitedError(Exception):
+    """한도 초과로 대기열에서 거절됨 (대기열 포화 또는 최대 대기 시간 초과)."""
+
+
+def priority_of(name: Optional[str]) -> int:
+    if name is None:
+        return DEFAULT_PRIORITY
+    return PRIORITY_CLASSES.get(name, DEFAULT_PRIORITY)
+
+
+def estimate_tokens(system_prompt: str, messages: list) -> int:
+    """프롬프트 토큰 추정치 + 응답 예약분."""
+    size = len(system_prompt.encode("utf-8"))
+    for m in messages:
+        content = m.get("content") if isinstance(m, dict) else None
+        if isinstance(content, str):
+            size += len(content.encode("utf-8"))
+        elif content is not None:
+            size += len(json.dumps(content, ensure_ascii=False, default=str).encode("utf-8"))
+    return size // 3 + OUTPUT_TOKEN_RESERVE
+
+
+class TokenBucket:
+    """분당 한도를 초당 보충률로 환산한 토큰 버킷. 용량 = 1분치."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        return max(0.0, (min(amount, self.capacity) - self.tokens) / self.rate)
+
+    def take(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """
+    (provider, model) 하나의 RPM·TPM 버킷 + 우선순위 대기열.
+
+    대기열 맨 앞(가장 높은 우선순위, 같은 우선순위는 도착 순)만 버킷에서 토큰을 가져갈 수 있다.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        max_wait_sec: Optional[float] = None,
+        max_queue: Optional[int] = None,
+    ):
+        self.key = key
+        self._buckets = [(TokenBucket(rpm), False)] if rpm else []
+        if tpm:
+            self._buckets.append((TokenBucket(tpm), True))
+        self.max_wait_sec = max_wait_sec if max_wait_sec is not None else settings.LLM_QUEUE_MAX_WAIT_SEC
+        self.max_queue = max_queue if max_queue is not None else settings.LLM_QUEUE_MAX_DEPTH
+        self._waiters: list = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self.counters = {"admitted": 0, "queued": 0, "shed": 0}
+
+    def _wait_time(self, tokens: int) -> float:
+        now = time.monotonic()
+        wait = 0.0
+        for bucket, is_tpm in self._buckets:
+            bucket.refill(now)
+            wait = max(wait, bucket.wait_time(tokens if is_tpm else 1))
+        return wait
+
+    def acquire(self, tokens: int, priority: int = DEFAULT_PRIORITY) -> None:
+        """한도 안에서 호출 허가를 받는다. 대기열 포화·대기 시간 초과 시 RateLimitedError."""
+        deadline = time.monotonic() + self.max_wait_sec
+        with self._cond:
+            if not self._waiters and self._wait_time(tokens) == 0:
+                self._take(tokens)
+                return
+            if len(self._waiters) >= self.max_queue:
+                self.counters["shed"] += 1
+                raise RateLimitedError(f"rate_limited: {self.key} queue full")
+
+            entry = [priority, next(self._seq)]
+            heapq.heappush(self._waiters, entry)
+            self.counters["queued"] += 1
+            try:
+                while True:
+                    wait = self._wait_time(tokens)
+                    if self._waiters[0] is entry and wait == 0:
+                        heapq.heappop(self._waiters)
+                        self._take(tokens)
+                        return
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.counters["shed"] += 1
+                        raise RateLimitedError(f"rate_limited: {self.key} wait>{self.max_wait_sec}s")
+                    self._cond.wait(min(remaining, wait) if self._waiters[0] is entry else remaining)
+            finally:
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def _take(self, tokens: int) -> None:
+        for bucket, is_tpm in self._buckets:
+            bucket.take(tokens if is_tpm else 1)
+        self.counters["admitted"] += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._cond:
+            return {**self.counters, "queue_depth": len(self._waiters)}
+
+
+# ── 전역 레지스트리 ─────────────────────────────────────────────────────────
+
+_LIMITERS: Dict[str, Optional[RateLimiter]] = {}
+_LOCK = threading.Lock()
+
+
+def _limits_config() -> Dict[str, dict]:
+    return json.loads(settings.LLM_RATE_LIMITS) if settings.LLM_RATE_LIMITS else {}
+
+
+def get_limiter(provider: str, model: str) -> Optional[RateLimiter]:
+    """설정된 한도가 없으면 None. 모든 에이전트가 같은 인스턴스를 공유한다."""
+    key = f"{provider}:{model}"
+    with _LOCK:
+        if key not in _LIMITERS:
+            cfg = _limits_config()
+            limits = cfg.get(key) or cfg.get(f"{provider}:*")
+            _LIMITERS[key] = RateLimiter(key, rpm=limits.get("rpm"), tpm=limits.get("tpm")) if limits else None
+        return _LIMITERS[key]
+
+
+def limiter_metrics() -> Dict[str, Dict[str, object]]:
+    with _LOCK:
+        limiters = [l for l in _LIMITERS.values() if l is not None]
+    return {l.key: l.snapshot() for l in limiters}
+
+
+class RateLimitedClient(BaseLLMClient):
+    """프로바이더 클라이언트 앞에서 (provider, model) 한도를 적용한다. create_llm_client()가 감싼다."""
+
+    def __init__(self, client: BaseLLMClient, provider: str, priority: Optional[str] = None):
+        self.client = client
+        self.provider = provider
+        self.priority = priority_of(priority)
+
+    def _acquire(self, model: str, system_prompt: str, messages: list) -> None:
+        limiter = get_limiter(self.provider, model)
+        if limiter is not None:
+            limiter.acquire(estimate_tokens(system_prompt, messages), self.priority)
+
+    def chat(self, *, model: str, system_prompt: str, messages: list, **kwargs) -> LLMResponse:
+        self._acquire(model, system_prompt, messages)
+        return self.client.chat(model=model, system_prompt=system_prompt, messages=messages, **kwargs)
+
+    def chat_stream(self, *, model: str, system_prompt: str, messages: list, **kwargs) -> Generator[str, None, None]:
+        self._acquire(model, system_prompt, messages)
+        yield from self.client.chat_stream(model=model, system_prompt=system_prompt, messages=messages, **kwargs)
+
+    def build_assistant_message(self, response: LLMResponse) -> dict:
+        return self.client.build_assistant_message(response)
+
+    def build_tool_result_message(self, tool_call_id: str, content: str) -> dict:
+        return self.client.build_tool_result_message(tool_call_id, content)
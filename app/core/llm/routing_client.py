@@ -0,0 +1,236 @@
+# app/core/llm/routing_client.py
+"""
+RoutingLLMClient: 여러 프로바이더 백엔드 위의 BaseLLMClient 구현 (failover + 지연 가중 분산).
+
+─── card.json ──────────────────────────────────────────────────────────────
+  "llm": {
+    "provider": "router",
+    "model": "gpt-4o-mini",          // 백엔드에 model이 없을 때 사용
+    "temperature": 0,
+    "backends": [
+      {"provider": "openai",    "model": "gpt-4o-mini",               "weight": 1.0},
+      {"provider": "anthropic", "model": "claude-3-5-haiku-latest",   "weight": 0.5}
+    ]
+  }
+
+─── 선택 ───────────────────────────────────────────────────────────────────
+  score = weight × health / ewma_latency
+    health:       성공(1)/실패(0)의 EWMA. 실패가 이어지면 0으로 수렴.
+    ewma_latency: 성공 호출 지연(초)의 EWMA.
+  score 비례 확률로 순서를 뽑고(가중 랜덤), 실패하면 다음 백엔드로 failover.
+  (provider, model) circuit breaker가 OPEN인 백엔드는 후보에서 제외한다 (llm/circuit_breaker.py).
+
+  백엔드 통계는 (provider, model) 단위로 프로세스 전역 공유 → 모든 에이전트가 같은 건강 상태를 본다.
+
+─── tool-call 루프 ─────────────────────────────────────────────────────────
+  build_assistant_message/build_tool_result_message는 프로바이더별 포맷이므로,
+  tool_calls를 반환한 백엔드를 스레드별로 고정(pin)하고 루프가 끝날 때까지 그 백엔드만 사용한다.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Dict, Generator, List, Optional
+
+from app.core.llm.base_client import BaseLLMClient, LLMResponse
+from app.core.llm.circuit_breaker import get_breaker
+from app.core.logging import setup_logger
+
+EWMA_ALPHA = 0.2
+_INITIAL_LATENCY_SEC = 1.0
+
+
+class BackendStats:
+    """(provider, model) 단위 건강·지연 통계."""
+
+    __slots__ = ("health", "ewma_latency", "_lock")
+
+    def __init__(self):
+        self.health = 1.0
+        self.ewma_latency = _INITIAL_LATENCY_SEC
+        self._lock = threading.Lock()
+
+    def record_success(self, latency: float) -> None:
+        with self._lock:
+            self.health += EWMA_ALPHA * (1.0 - self.health)
+            self.ewma_latency += EWMA_ALPHA * (latency - self.ewma_latency)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.health -= EWMA_ALPHA * self.health
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "health": round(self.health, 3),
+            "ewma_latency_ms": round(self.ewma_latency * 1000, 1),
+        }
+
+
+_STATS: Dict[tuple, BackendStats] = {}
+_STATS_LOCK = threading.Lock()
+
+
+def backend_stats(provider: str, model: str) -> BackendStats:
+    key = (provider, model)
+    with _STATS_LOCK:
+        if key not in _STATS:
+            _STATS[key] = BackendStats()
+        return _STATS[key]
+
+
+class _Backend:
+    __slots__ = ("provider", "model", "weight", "client")
+
+    def __init__(self, provider: str, model: Optional[str], weight: float, client: BaseLLMClient):
+        self.provider = provider
+        self.model = model
+        self.weight = weight
+        self.client = client
+
+
+class RoutingLLMClient(BaseLLMClient):
+    """
+    여러 BaseLLMClient를 하나로 묶는 라우터. create_llm_client("router", backends=[...])로 생성.
+
+    Args:
+        backends: [{"provider": "openai", "model": "...", "weight": 1.0}, ...]
+                  또는 테스트용으로 "client" 키에 BaseLLMClient 인스턴스를 직접 지정.
+    """
+
+    def __init__(self, backends: List[Dict[str, Any]], priority: Optional[str] = None):
+        if not backends:
+            raise ValueError("RoutingLLMClient requires at least one backend")
+        from app.core.llm import create_llm_client
+
+        self.backends = [
+            _Backend(
+                provider=b["provider"],
+                model=b.get("model"),
+                weight=b.get("weight", 1.0),
+                client=b.get("client") or create_llm_client(b["provider"], priority=priority),
+            )
+            for b in backends
+        ]
+        self._pinned = threading.local()
+        self.logger = setup_logger("LLM.Router")
+
+    # ── 선택 ─────────────────────────────────────────────────────────────────
+
+    def _model_for(self, backend: _Backend, model: str) -> str:
+        return backend.model or model
+
+    def _stats_for(self, backend: _Backend, model: str) -> BackendStats:
+        return backend_stats(backend.provider, self._model_for(backend, model))
+
+    def _ordered(self, model: str) -> List[_Backend]:
+        """가용 백엔드를 score 비례 가중 랜덤 순서로. 전부 open이면 전체를 시도 (breaker가 즉시 거부)."""
+        pool = [
+            b for b in self.backends if get_breaker(b.provider, self._model_for(b, model)).available()
+        ] or list(self.backends)
+        ordered = []
+        while pool:
+            scores = []
+            for b in pool:
+                st = self._stats_for(b, model)
+                scores.append(b.weight * max(st.health, 1e-3) / max(st.ewma_latency, 1e-3))
+            pick = random.choices(range(len(pool)), weights=scores)[0]
+            ordered.append(pool.pop(pick))
+        return ordered
+
+    # ── BaseLLMClient ────────────────────────────────────────────────────────
+
+    def chat(
+        self,
+        *,
+        model: str,
+        temperature: float,
+        system_prompt: str,
+        messages: list,
+        timeout: int | None = None,
+        tools: list | None = None,
+    ) -> LLMResponse:
+        pinned = getattr(self._pinned, "backend", None)
+        candidates = [pinned] if pinned else self._ordered(model)
+        error: Optional[Exception] = None
+
+        for backend in candidates:
+            stats = self._stats_for(backend, model)
+            started = time.monotonic()
+            try:
+                resp = backend.client.chat(
+                    model=self._model_for(backend, model),
+                    temperature=temperature,
+                    system_prompt=system_prompt,
+                    messages=messages,
+                    timeout=timeout,
+                    tools=tools,
+                )
+            except Exception as e:
+                stats.record_failure()
+                self.logger.warning(f"[router] {backend.provider} failed, failover: {type(e).__name__}: {e}")
+                error = e
+                continue
+            stats.record_success(time.monotonic() - started)
+            # tool-call 루프 중이면 같은 백엔드로 고정, 최종 응답이면 해제
+            self._pinned.backend = backend if resp.tool_calls else None
+            return resp
+
+        self._pinned.backend = None
+        raise error
+
+    def chat_stream(
+        self,
+        *,
+        model: str,
+        temperature: float,
+        system_prompt: str,
+        messages: list,
+        timeout: int | None = None,
+    ) -> Generator[str, None, None]:
+        """첫 토큰 이전 실패만 failover한다. 토큰이 나간 뒤의 실패는 그대로 전파."""
+        error: Optional[Exception] = None
+        for backend in self._ordered(model):
+            stats = self._stats_for(backend, model)
+            started = time.monotonic()
+            emitted = False
+            try:
+                for token in backend.client.chat_stream(
+                    model=self._model_for(backend, model),
+                    temperature=temperature,
+                    system_prompt=system_prompt,
+                    messages=messages,
+                    timeout=timeout,
+                ):
+                    if not emitted:
+                        # 스트리밍은 첫 토큰까지의 지연(TTFT)을 latency로 사용
+                        stats.record_success(time.monotonic() - started)
+                        emitted = True
+                    yield token
+                if not emitted:
+                    stats.record_success(time.monotonic() - started)
+                return
+            except Exception as e:
+                stats.record_failure()
+                if emitted:
+                    raise
+                self.logger.warning(f"[router] {backend.provider} stream failed, failover: {type(e).__name__}: {e}")
+                error = e
+        raise error
+
+    def build_assistant_message(self, response: LLMResponse) -> dict:
+        return self._pinned_client().build_assistant_message(response)
+
+    def build_tool_result_message(self, tool_call_id: str, content: str) -> dict:
+        return self._pinned_client().build_tool_result_message(tool_call_id, content)
+
+    def _pinned_client(self) -> BaseLLMClient:
+        backend = getattr(self._pinned, "backend", None) or self.backends[0]
+        return backend.client
+
+    def stats(self, model: str = "") -> Dict[str, Dict[str, float]]:
+        """백엔드별 건강 상태 스냅샷. key = "provider:model"."""
+        out = {}
+        for b in self.backends:
+            key = f"{b.provider}:{self._model_for(b, model)}"
+            out[key] = {**self._stats_for(b, model).snapshot(), "state": get_breaker(b.provider, self._model_for(b, model)).state}
+        return out
@@ -0,0 +1,174 @@
+# app/core/llm/scheduler.py
+"""
+LLMScheduler: 프로세스 전역 LLM 동시 실행 슬롯 스케줄러 (우선순위 클래스 + 세션 간 가중 공정 큐잉).
+
+요약(summarization) 같은 백그라운드 작업과 사용자가 DONE을 기다리는 대화형 호출이
+같은 프로바이더 용량을 두고 경쟁하지 않도록, 모든 LLM 호출은 슬롯을 얻은 뒤에만 실행된다.
+
+─── 선택 순서 ──────────────────────────────────────────────────────────────
+  1. 우선순위 클래스 (rate_limiter.PRIORITY_CLASSES — execute < slot·interaction < intent < summarization)
+  2. 같은 클래스 안에서는 WFQ 가상 완료 시각이 빠른 요청
+       finish = max(전역 가상시각, 해당 세션의 마지막 finish) + 비용(추정 토큰) / 세션 가중치
+     → 배치 이체로 호출을 몰아 보내는 세션이 있어도 다른 세션 요청이 사이사이 끼어든다.
+  3. 백그라운드 클래스(BACKGROUND_PRIORITY 이상)는 LLM_BACKGROUND_MAX_CONCURRENCY 슬롯까지만 사용
+     → 대화형 요청을 위한 슬롯이 항상 남는다 (실행 중인 호출은 선점할 수 없으므로).
+
+─── 세션 식별 ──────────────────────────────────────────────────────────────
+  AgentRunner가 에이전트 실행 구간에서 current_session을 설정한다.
+  세션 밖 호출(요약 등)은 "_background" 가상 세션으로 취급한다.
+
+─── 백그라운드 작업 ────────────────────────────────────────────────────────
+  run_background(fn, ...)로 턴 밖 스레드에서 실행한다 (MemoryManager 요약).
+"""
+
+import contextvars
+import heapq
+import itertools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generator, Optional
+
+from app.core.config import settings
+from app.core.llm.base_client import BaseLLMClient, LLMResponse
+from app.core.llm.rate_limiter import estimate_tokens, priority_of
+from app.core.logging import setup_logger
+
+BACKGROUND_PRIORITY = 3
+
+current_session: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("llm_session", default=None)
+
+_BACKGROUND_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="llm-bg")
+logger = setup_logger("LLM.Scheduler")
+
+
+class LLMScheduler:
+    """
+    동시 실행 슬롯을 우선순위·WFQ 순서로 배분한다.
+
+    Args:
+        max_concurrency:    전체 동시 LLM 호출 수
+        background_max:     백그라운드 클래스가 동시에 쓸 수 있는 최대 슬롯
+        session_weights:    세션별 가중치 (기본 1.0)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        background_max: Optional[int] = None,
+        session_weights: Optional[Dict[str, float]] = None,
+    ):
+        self.max_concurrency = max_concurrency or settings.LLM_MAX_CONCURRENCY
+        self.background_max = background_max if background_max is not None else settings.LLM_BACKGROUND_MAX_CONCURRENCY
+        self.session_weights = session_weights or {}
+        self._cond = threading.Condition()
+        self._waiters: list = []          # [priority, finish, seq, background]
+        self._seq = itertools.count()
+        self._vtime = 0.0
+        self._last_finish: Dict[str, float] = {}
+        self.running = 0
+        self.running_background = 0
+
+    def _can_run(self, background: bool) -> bool:
+        if self.running >= self.max_concurrency:
+            return False
+        return not background or self.running_background < self.background_max
+
+    def _next_runnable(self) -> Optional[list]:
+        """대기열에서 지금 실행 가능한 가장 앞선 요청. 백그라운드 한도로 막힌 요청은 건너뛴다."""
+        for entry in sorted(self._waiters):
+            if self._can_run(entry[3]):
+                return entry
+        return None
+
+    @contextmanager
+    def slot(self, priority: int, session_id: Optional[str], cost: float):
+        """슬롯을 얻어 with 블록을 실행하고 반환한다."""
+        background = priority >= BACKGROUND_PRIORITY
+        session = session_id or "_background"
+        with self._cond:
+            start = max(self._vtime, self._last_finish.get(session, 0.0))
+            finish = start + cost / self.session_weights.get(session, 1.0)
+            self._last_finish[session] = finish
+            entry = [priority, finish, next(self._seq), background]
+            heapq.heappush(self._waiters, entry)
+            try:
+                while self._next_runnable() is not entry:
+                    self._cond.wait()
+            except BaseException:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+                raise
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+            self._vtime = max(self._vtime, start)
+            self.running += 1
+            self.running_background += int(background)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self.running -= 1
+                self.running_background -= int(background)
+                if not self._waiters and not self.running:
+                    # 유휴 상태 → 세션별 가상시각 기록 정리 (세션 수만큼 자라지 않도록)
+                    self._last_finish.clear()
+                self._cond.notify_all()
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "running": self.running,
+                "running_background": self.running_background,
+                "queued": len(self._waiters),
+                "max_concurrency": self.max_concurrency,
+                "background_max": self.background_max,
+            }
+
+
+_SCHEDULER: Optional[LLMScheduler] = None
+_LOCK = threading.Lock()
+
+
+def get_scheduler() -> LLMScheduler:
+    global _SCHEDULER
+    with _LOCK:
+        if _SCHEDULER is None:
+            _SCHEDULER = LLMScheduler()
+        return _SCHEDULER
+
+
+def run_background(fn: Callable[..., Any], *args, **kwargs) -> Future:
+    """턴 처리 스레드 밖에서 fn 실행 (백그라운드 우선순위 LLM 작업용)."""
+    def _run():
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            logger.warning(f"[background] {getattr(fn, '__name__', fn)} failed: {e}")
+            raise
+    return _BACKGROUND_POOL.submit(_run)
+
+
+class ScheduledClient(BaseLLMClient):
+    """create_llm_client()가 호출 한도 안쪽에 씌우는 래퍼. 호출 전 스케줄러 슬롯을 얻는다."""
+
+    def __init__(self, client: BaseLLMClient, priority: Optional[str] = None):
+        self.client = client
+        self.priority = priority_of(priority)
+
+    def chat(self, *, system_prompt: str, messages: list, **kwargs) -> LLMResponse:
+        cost = estimate_tokens(system_prompt, messages)
+        with get_scheduler().slot(self.priority, current_session.get(), cost):
+            return self.client.chat(system_prompt=system_prompt, messages=messages, **kwargs)
+
+    def chat_stream(self, *, system_prompt: str, messages: list, **kwargs) -> Generator[str, None, None]:
+        cost = estimate_tokens(system_prompt, messages)
+        with get_scheduler().slot(self.priority, current_session.get(), cost):
+            yield from self.client.chat_stream(system_prompt=system_prompt, messages=messages, **kwargs)
+
+    def build_assistant_message(self, response: LLMResponse) -> dict:
+        return self.client.build_assistant_message(response)
+
+    def build_tool_result_message(self, tool_call_id: str, content: str) -> dict:
+        return self.client.build_tool_result_message(tool_call_id, content)
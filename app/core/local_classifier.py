@@ -0,0 +1,111 @@
+# app/core/local_classifier.py
+"""
+LocalTextClassifier: LLM 호출 전에 쓰는 로컬 텍스트 분류기 (문자 n-gram 선형 모델).
+
+HashedNgramVectorizer 피처 위에 softmax 선형 모델을 얹은 구조로,
+학습 결과(가중치·라벨·피처 설정)를 NumPy .npz 파일 하나로 저장·로드한다.
+
+─── 사용 흐름 ───────────────────────────────────────────────────────────────
+  1. 학습 (오프라인): 로깅된 턴 (발화, LLM 라벨) → train() → save("model.npz")
+  2. 추론 (온라인):   load("model.npz") → predict(text) → (label, prob)
+                      prob가 임계값 이상이면 LLM 없이 결과 사용, 미만이면 LLM으로 escalate.
+"""
+
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from app.core.ngram import HashedNgramVectorizer
+
+
+class LocalTextClassifier:
+    """
+    문자 n-gram 해시 피처 + softmax 선형 분류기.
+
+    Attributes:
+        labels:     클래스 라벨 목록 (가중치 열 순서와 동일)
+        weights:    (n_features, n_labels) float32
+        bias:       (n_labels,) float32
+        vectorizer: HashedNgramVectorizer (학습 시와 동일 설정)
+    """
+
+    def __init__(
+        self,
+        weights: np.ndarray,
+        bias: np.ndarray,
+        labels: Sequence[str],
+        vectorizer: HashedNgramVectorizer,
+    ):
+        self.weights = weights
+        self.bias = bias
+        self.labels: List[str] = list(labels)
+        self.vectorizer = vectorizer
+
+    # ── 저장·로드 ────────────────────────────────────────────────────────────
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LocalTextClassifier":
+        data = np.load(path, allow_pickle=False)
+        vectorizer = HashedNgramVectorizer(
+            n_features=int(data["n_features"]),
+            ngram_range=tuple(int(n) for n in data["ngram_range"]),
+        )
+        return cls(data["weights"], data["bias"], [str(l) for l in data["labels"]], vectorizer)
+
+    def save(self, path: str | Path) -> None:
+        np.savez_compressed(
+            path,
+            weights=self.weights,
+            bias=self.bias,
+            labels=np.array(self.labels),
+            n_features=np.int64(self.vectorizer.n_features),
+            ngram_range=np.array(self.vectorizer.ngram_range, dtype=np.int64),
+        )
+
+    # ── 학습 ─────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def train(
+        cls,
+        texts: Sequence[str],
+        labels: Sequence[str],
+        n_features: int = 4096,
+        ngram_range: Tuple[int, int] = (1, 3),
+        epochs: int = 300,
+        lr: float = 1.0,
+        l2: float = 1e-4,
+    ) -> "LocalTextClassifier":
+        """전체 배치 경사하강법으로 softmax 회귀를 학습한다. 수천 건 규모면 수 초 이내."""
+        vectorizer = HashedNgramVectorizer(n_features=n_features, ngram_range=ngram_range)
+        classes = sorted(set(labels))
+        X = vectorizer.transform(texts)
+        y = np.array([classes.index(l) for l in labels])
+        Y = np.eye(len(classes), dtype=np.float32)[y]
+
+        W = np.zeros((n_features, len(classes)), dtype=np.float32)
+        b = np.zeros(len(classes), dtype=np.float32)
+        for _ in range(epochs):
+            P = _softmax(X @ W + b)
+            G = (P - Y) / len(texts)
+            W -= lr * (X.T @ G + l2 * W)
+            b -= lr * G.sum(axis=0)
+        return cls(W, b, classes, vectorizer)
+
+    # ── 추론 ─────────────────────────────────────────────────────────────────
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """texts → (len(texts), n_labels) 클래스 확률."""
+        return _softmax(self.vectorizer.transform(texts) @ self.weights + self.bias)
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """단일 발화 → (라벨, 확률)."""
+        proba = self.predict_proba([text])[0]
+        i = int(proba.argmax())
+        return self.labels[i], float(proba[i])
+
+
+def _softmax(z: np.ndarray) -> np.ndarray:
+    z = z - z.max(axis=1, keepdims=True)
+    e = np.exp(z)
+    return e / e.sum(axis=1, keepdims=True)
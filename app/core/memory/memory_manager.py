@@ -19,6 +19,13 @@
       ↓
   raw_history = 최근 keep_recent 턴만 유지
 
+  MEMORY_SUMMARY_IN_BACKGROUND=true(기본)면 요약은 턴 밖 백그라운드 스레드에서
+  가장 낮은 LLM 우선순위로 실행된다 → 사용자의 DONE 응답을 늦추지 않는다.
+  pending(memory)로 진행 중인 요약 Future를 조회한다 (세션 저장소 pin 해제 시점 결정용).
+  요약이 끝나면 압축 대상이었던 앞부분만 잘라내므로 그 사이 추가된 턴은 보존된다.
+  요약은 턴의 save_state 이후에 memory를 바꾸므로, update(on_summarized=...) 콜백으로
+  세션을 다시 저장한다 (공유·영속 저장소에 요약 결과가 반영되도록).
+
   summary_text는 이체 완료·취소 후 세션 리셋 시에도 유지된다.
   사용자의 장기 맥락(선호하는 수신인, 금액 패턴 등)이 보존된다.
 
@@ -28,8 +35,13 @@
   MEMORY_SUMMARY_MODEL:       요약 LLM 모델 (기본 "gpt-4o-mini")
   MEMORY_ENABLE_SUMMARY:      요약 활성화 여부 (기본 True)
   MEMORY_MAX_RAW_TURNS:       요약 실패 시 trim 상한 (기본 10)
+  MEMORY_SUMMARY_IN_BACKGROUND: 요약 백그라운드 실행 여부 (기본 True)
 """
 
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
 from app.core.config import settings
 from app.core.logging import setup_logger
 
@@ -106,6 +118,8 @@ class MemoryManager:
         self.summary_system_prompt  = summary_system_prompt  or _DEFAULT_SUMMARY_SYSTEM
         self.summary_user_template  = summary_user_template  or _DEFAULT_SUMMARY_TEMPLATE
         self.logger = setup_logger("MemoryManager")
+        self._in_flight: Dict[int, Any] = {}   # 요약 진행 중인 memory dict id → Future (중복 요약 방지)
+        self._lock = threading.Lock()
         self._llm = None   # lazy init — LLM은 요약이 필요할 때만 초기화
 
     @property
@@ -113,12 +127,14 @@ class MemoryManager:
         """LLM 클라이언트를 지연 초기화. 요약이 필요없으면 클라이언트를 생성하지 않는다."""
         if self._llm is None:
             from app.core.llm import create_llm_client
-            self._llm = create_llm_client(self.summary_provider)
+            # 요약은 백그라운드 성격 → 한도 대기열에서 가장 낮은 우선순위
+            self._llm = create_llm_client(self.summary_provider, priority="summarization")
         return self._llm
 
     # ── Public API ─────────────────────────────────────────────────────────────
 
-    def update(self, memory: dict, user_msg: str, assistant_msg: str) -> None:
+    def update(self, memory: dict, user_msg: str, assistant_msg: str,
+               on_summarized: Optional[Callable[[], None]] = None) -> None:
         """
         대화 한 턴을 memory에 추가하고, 필요 시 자동 요약을 실행한다.
 
@@ -126,6 +142,7 @@ class MemoryManager:
             memory:         sessions.get_or_create()가 반환한 memory dict (in-place 수정됨)
             user_msg:       사용자 발화 원문
             assistant_msg:  LLM 응답 텍스트 (payload["message"])
+            on_summarized:  백그라운드 요약이 memory를 바꾼 뒤 호출 (세션 재저장용)
 
         Notes:
             memory dict는 참조로 전달되므로 갱신이 세션에 즉시 반영된다.
@@ -140,37 +157,57 @@ class MemoryManager:
 
         # 턴 수(= 메시지 수 // 2) 가 threshold에 도달하면 자동 요약
         if self.enable_summary and len(history) // 2 >= self.summarize_threshold:
-            self._summarize(memory)
+            if not settings.MEMORY_SUMMARY_IN_BACKGROUND:
+                self._summarize(memory)
+                return
+            with self._lock:
+                if id(memory) in self._in_flight:
+                    return
+                from app.core.llm.scheduler import run_background
+                # _summarize의 finally가 같은 락을 잡으므로 등록 전에 끝나도 누락되지 않는다
+                self._in_flight[id(memory)] = run_background(self._summarize, memory, on_summarized)
+
+    def pending(self, memory: dict) -> Optional[Future]:
+        """이 memory dict에 진행 중인 백그라운드 요약 Future (없으면 None)."""
+        with self._lock:
+            return self._in_flight.get(id(memory))
 
     # ── Internal ───────────────────────────────────────────────────────────────
 
-    def _summarize(self, memory: dict) -> None:
+    def _summarize(self, memory: dict, on_summarized: Optional[Callable[[], None]] = None) -> None:
         """
-        오래된 턴을 LLM으로 요약하고 raw_history를 압축한다.
+        오래된 턴을 LLM으로 요약하고 raw_history를 압축한다. memory를 바꿨으면 on_summarized 호출.
 
         처리:
           - 앞부분 (to_compress): 요약 대상 — keep_recent_turns 이전 메시지들
           - 뒷부분 (keep_msgs):   유지 대상 — 최근 keep_recent_turns 턴
         """
-        history  = memory["raw_history"]
-        keep_msgs = self.keep_recent_turns * 2  # 1턴 = user + assistant 2개 메시지
-
-        to_compress = history[:-keep_msgs]
-        if not to_compress:
-            return   # keep_recent_turns 이전에 압축할 내용 없음
-
         try:
-            new_summary = self._call_llm(to_compress, memory.get("summary_text", ""))
-            memory["summary_text"] = new_summary
-            memory["raw_history"]  = history[-keep_msgs:]
-            self.logger.info(
-                f"[MemoryManager] summarized {len(to_compress) // 2} turns → "
-                f"raw_history {len(memory['raw_history']) // 2} turns retained"
-            )
-        except Exception as e:
-            # 요약 실패 시 summary는 건드리지 않고 단순 trim으로 fallback
-            self.logger.warning(f"[MemoryManager] summarization failed, fallback trim: {e}")
-            memory["raw_history"] = history[-(settings.MEMORY_MAX_RAW_TURNS * 2):]
+            history  = memory["raw_history"]
+            keep_msgs = self.keep_recent_turns * 2  # 1턴 = user + assistant 2개 메시지
+
+            to_compress = history[:-keep_msgs]
+            if not to_compress:
+                return   # keep_recent_turns 이전에 압축할 내용 없음
+
+            try:
+                new_summary = self._call_llm(to_compress, memory.get("summary_text", ""))
+                memory["summary_text"] = new_summary
+                # 요약 중 추가된 턴을 보존하도록 압축한 앞부분만 제거 (in-place)
+                del memory["raw_history"][:len(to_compress)]
+                self.logger.info(
+                    f"[MemoryManager] summarized {len(to_compress) // 2} turns → "
+                    f"raw_history {len(memory['raw_history']) // 2} turns retained"
+                )
+            except Exception as e:
+                # 요약 실패 시 summary는 건드리지 않고 단순 trim으로 fallback
+                self.logger.warning(f"[MemoryManager] summarization failed, fallback trim: {e}")
+                del memory["raw_history"][:-(settings.MEMORY_MAX_RAW_TURNS * 2)]
+            if on_summarized is not None:
+                on_summarized()
+        finally:
+            with self._lock:
+                self._in_flight.pop(id(memory), None)
 
     def _call_llm(self, messages: list, prev_summary: str) -> str:
         """
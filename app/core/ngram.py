@@ -0,0 +1,58 @@
+# app/core/ngram.py
+"""
+HashedNgramVectorizer: 문자 n-gram → 고정 차원 해시 벡터 (LLM·외부 모델 없음).
+
+로컬 라우팅·분류처럼 LLM 왕복 없이 빠르게 판단해야 하는 곳에서 사용한다.
+  - SemanticServiceRouter: 서비스 exemplar 중심 벡터와 코사인 유사도 비교
+  - (프로젝트별) 로컬 분류기: 선형 모델 입력 피처
+
+─── 설계 ────────────────────────────────────────────────────────────────────
+  - 한국어는 띄어쓰기·조사 변형이 많아 단어 단위보다 문자 n-gram이 견고하다.
+  - 어휘 사전 없이 crc32 해시로 차원을 고정 → 학습·추론 간 피처 인덱스가 항상 일치.
+    (Python hash()는 프로세스마다 달라지므로 사용하지 않는다)
+  - 출력은 L2 정규화된 float32 행렬. 내적 = 코사인 유사도.
+"""
+
+import zlib
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+class HashedNgramVectorizer:
+    """
+    문자 n-gram 해시 벡터라이저. 상태(어휘)가 없으므로 fit 없이 바로 transform한다.
+
+    사용 예시:
+        vec = HashedNgramVectorizer(n_features=4096, ngram_range=(1, 3))
+        X = vec.transform(["엄마한테 5만원 보내줘", "잔액 알려줘"])   # (2, 4096)
+    """
+
+    def __init__(self, n_features: int = 4096, ngram_range: Tuple[int, int] = (1, 3)):
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+        self._index = lru_cache(maxsize=65536)(self._hash_index)
+
+    def _hash_index(self, gram: str) -> int:
+        return zlib.crc32(gram.encode("utf-8")) % self.n_features
+
+    def _grams(self, text: str):
+        text = f" {' '.join(text.lower().split())} "
+        lo, hi = self.ngram_range
+        for n in range(lo, hi + 1):
+            for i in range(len(text) - n + 1):
+                gram = text[i:i + n]
+                if not gram.isspace():   # 공백만으로 된 gram은 모든 문장에 공통 → 유사도 노이즈
+                    yield gram
+
+    def transform(self, texts: Sequence[str]) -> np.ndarray:
+        """texts → (len(texts), n_features) L2 정규화 float32 행렬."""
+        X = np.zeros((len(texts), self.n_features), dtype=np.float32)
+        index = self._index
+        for row, text in enumerate(texts):
+            for gram in self._grams(text):
+                X[row, index(gram)] += 1.0
+        norms = np.linalg.norm(X, axis=1, keepdims=True)
+        np.divide(X, norms, out=X, where=norms > 0)
+        return X
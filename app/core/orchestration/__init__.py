@@ -13,8 +13,10 @@ from app.core.orchestration.super_orchestrator import (
     SuperOrchestrator,
     BaseServiceRouter,
     KeywordServiceRouter,
+    SemanticServiceRouter,
     A2AServiceProxy,
 )
+from app.core.orchestration.supervisor import HashRing, WorkerError, WorkerSupervisor
 
 __all__ = [
     "CoreOrchestrator",
@@ -28,5 +30,9 @@ __all__ = [
     "SuperOrchestrator",
     "BaseServiceRouter",
     "KeywordServiceRouter",
+    "SemanticServiceRouter",
     "A2AServiceProxy",
+    "HashRing",
+    "WorkerError",
+    "WorkerSupervisor",
 ]
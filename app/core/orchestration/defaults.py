@@ -33,6 +33,15 @@ def _user_message(exc: Exception | None) -> str:
 
     # 지연 임포트 (순환 참조 방지)
     from app.core.agents.agent_runner import FatalExecutionError, RetryableError
+    from app.core.llm.circuit_breaker import CircuitOpenError
+
+    # 클라이언트 측 호출 한도 초과 — 대기열 포화로 즉시 거절된 경우
+    if "rate_limited" in str(exc):
+        return "지금 요청이 많아 처리하지 못했어요. 잠시 후 다시 시도해주세요."
+
+    # LLM 프로바이더 장애로 breaker가 열린 상태 — 호출 없이 즉시 실패한 경우
+    if isinstance(exc, CircuitOpenError) or "circuit_open" in str(exc):
+        return "지금 응답이 지연되고 있어요. 잠시 후 다시 시도해주세요."
 
     if isinstance(exc, RetryableError):
         msg = str(exc)
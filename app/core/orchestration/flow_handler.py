@@ -86,17 +86,22 @@ class BaseFlowHandler:
         호출 시점: DONE 이벤트 yield 직전.
         1. memory_manager.update() — raw_history 추가, 필요 시 자동 요약
         2. sessions.save_state()  — 갱신된 state + memory 영속화
+        백그라운드 요약은 2 이후에 memory를 바꾸므로, 끝나면 세션을 다시 저장한다.
         """
-        self.memory_manager.update(ctx.memory, ctx.user_message, assistant_message)
+        self.memory_manager.update(ctx.memory, ctx.user_message, assistant_message,
+                                   on_summarized=lambda: self._resave_session(ctx.session_id))
         self.sessions.save_state(ctx.session_id, ctx.state)
 
+    def _resave_session(self, session_id: str) -> None:
+        # 그 사이 다음 턴이 state를 바꿨을 수 있으므로 턴 시점 state가 아니라 저장소의 현재 state로
+        state, _ = self.sessions.get_or_create(session_id)
+        self.sessions.save_state(session_id, state)
+
     # ── DONE payload 빌드 ──────────────────────────────────────────────────────
 
     def _build_done_payload(self, ctx: ExecutionContext, payload: dict) -> dict:
         """DONE payload에 state_snapshot을 추가한다. 수동 DONE yield 전에 호출."""
-        payload["state_snapshot"] = (
-            ctx.state.model_dump() if hasattr(ctx.state, "model_dump") else {}
-        )
+        payload["state_snapshot"] = ctx.state.model_dump()
         return payload
 
     # ── state 리셋 ───────────────────────────────────────────────────────────
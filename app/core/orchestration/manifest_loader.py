@@ -188,8 +188,10 @@ class ManifestBuilder:
 
         data = load_yaml(self._project_root)
 
-        # State Manager
+        # State Manager + State 모델 (outbox가 훅 전달 시 ctx.state 복원에 사용)
         state_manager_class = resolve_class(data["state"]["manager"], self._project_module)
+        state_model_path = data.get("state", {}).get("model")
+        state_class = resolve_class(state_model_path, self._project_module) if state_model_path else None
 
         # Memory Manager
         memory_manager = MemoryManager(enable_memory=True, **self._memory_kwargs)
@@ -214,10 +216,7 @@ class ManifestBuilder:
         # Sessions factory — 미지정이면 project.yaml의 state.model로 자동 구성
         sessions_factory = self._sessions_factory
         if sessions_factory is None:
-            state_model_path = data.get("state", {}).get("model")
-            if state_model_path:
-                state_class = resolve_class(state_model_path, self._project_module)
-            else:
+            if state_class is None:
                 raise ValueError(
                     "sessions_factory가 미지정이고 project.yaml에 state.model도 없습니다. "
                     "둘 중 하나를 제공해주세요."
@@ -237,7 +236,7 @@ class ManifestBuilder:
             "completed_factory":      completed_factory,
             "memory_manager_factory": lambda: memory_manager,
             "runner":                 runner,
-            "state":                  {"manager": state_manager_class},
+            "state":                  {"manager": state_manager_class, "model": state_class},
             "flows":                  {"router": router_class, "handlers": handlers},
             "default_flow":           default_flow,
             "on_error":               self._on_error or (lambda e: make_error_event(e)),
@@ -16,6 +16,7 @@ CoreOrchestrator: 단일 턴(one-turn) 실행 파이프라인.
   6. FlowHandler.run()  에이전트 파이프라인 실행 → 이벤트 스트리밍
   7. 세션 저장 (finally) ctx.state → sessions.save_state()
   8. 훅 실행 (finally)   _fire_hooks() — manifest["hook_handlers"] 등록 함수 호출
+                        (HOOK_OUTBOX_ENABLED면 outbox에 기록만 하고 워커가 전달)
 
 ─── manifest 구조 ──────────────────────────────────────────────────────────
   {
@@ -29,6 +30,7 @@ CoreOrchestrator: 단일 턴(one-turn) 실행 파이프라인.
       },
       "state": {
           "manager": (state) → StateManager,                  # 상태 전이 팩토리
+          "model":   BaseModel 클래스 | None,                  # outbox 훅 전달 시 state 복원
       },
       "default_flow":  "chat",                                # 없으면 첫 번째 handler
       "on_error":      (exc) → dict | None,                   # 에러 이벤트 생성
@@ -43,12 +45,20 @@ CoreOrchestrator: 단일 턴(one-turn) 실행 파이프라인.
   CoreOrchestrator 처리:
       1. DONE 이벤트 payload의 hooks → 프론트엔드는 SSE/REST 응답에서 수신
       2. _fire_hooks() → manifest["hook_handlers"][type](ctx, data) 서버사이드 실행
+
+─── hook outbox (HOOK_OUTBOX_ENABLED, 기본) ────────────────────────────────
+  hooks·after_turn 호출을 HookOutbox(SQLite)에 커밋하고 바로 반환 → 턴 지연에서 제외.
+  워커 풀이 재시도·dead letter·훅 타입별 동시 실행 한도를 적용해 at-least-once로 전달한다.
+  이때 핸들러가 받는 ctx는 재구성된 것 — ctx.state는 기록 시점 state를 manifest["state"]["model"]로
+  복원한 객체, memory는 기록 시점 스냅샷. outbox 기록(커밋)이 실패하면 핸들러를 직접 호출한다.
 """
 
-from typing import Any, Dict, Generator
+from typing import Any, Callable, Dict, Generator
 
+from app.core.config import settings
 from app.core.context import ExecutionContext
 from app.core.events import EventType
+from app.core.execution.outbox import AFTER_TURN, HookOutbox
 from app.core.logging import setup_logger
 from app.core.orchestration.defaults import make_error_event
 from app.core.tracing import TurnTracer
@@ -107,6 +117,14 @@ class CoreOrchestrator:
         # 훅 타입 → 핸들러 함수. DONE payload의 hooks 목록과 매핑
         self._hook_handlers: Dict[str, Any] = manifest.get("hook_handlers") or {}
 
+        # 훅 outbox — 등록된 훅·after_turn이 있을 때만 생성
+        self._outbox = None
+        if settings.HOOK_OUTBOX_ENABLED and (self._hook_handlers or self._after_turn):
+            outbox_handlers = dict(self._hook_handlers)
+            if self._after_turn:
+                outbox_handlers[AFTER_TURN] = self._after_turn
+            self._outbox = HookOutbox(outbox_handlers, state_model=manifest["state"].get("model"))
+
         self.logger = setup_logger("CoreOrchestrator")
 
     # ── 퍼블릭 API ────────────────────────────────────────────────────────────
@@ -117,9 +135,34 @@ class CoreOrchestrator:
 
         실행 순서:
           세션 로드 → (IntentAgent) → FlowRouter → FlowHandler → 저장·훅
+
+        세션 저장소가 pin/unpin을 지원하면(HibernatingSessionStore) 로드 전에 pin해 턴 도중
+        동면되지 않게 하고, 턴과 그 턴이 시작한 백그라운드 요약이 끝난 뒤 unpin한다.
         """
-        # 1. 세션에서 state·memory 로드 (없으면 새로 생성)
-        state, memory = self.sessions.get_or_create(session_id)
+        pin = getattr(self.sessions, "pin", None)
+        if pin is None:
+            yield from self._run_turn(session_id, user_message, *self.sessions.get_or_create(session_id))
+            return
+        pin(session_id)
+        memory = None
+        try:
+            # 1. 세션에서 state·memory 로드 (없으면 새로 생성)
+            state, memory = self.sessions.get_or_create(session_id)
+            yield from self._run_turn(session_id, user_message, state, memory)
+        finally:
+            self._release_session(session_id, memory)
+
+    def _release_session(self, session_id: str, memory: Any) -> None:
+        """pin 해제 — 이 memory에 백그라운드 요약이 진행 중이면 끝난 뒤에."""
+        pending = getattr(self.memory_manager, "pending", None)
+        future = pending(memory) if pending and memory is not None else None
+        if future is None:
+            self.sessions.unpin(session_id)
+        else:
+            future.add_done_callback(lambda _: self.sessions.unpin(session_id))
+
+    def _run_turn(self, session_id: str, user_message: str, state: Any,
+                  memory: Dict[str, Any]) -> Generator[Dict[str, Any], None, None]:
         tracer = TurnTracer(session_id=session_id)
         ctx = ExecutionContext(
             session_id=session_id,
@@ -216,7 +259,10 @@ class CoreOrchestrator:
             if final_payload:
                 self._fire_hooks(ctx, final_payload)
             if final_payload and self._after_turn:
-                self._after_turn(ctx, final_payload)
+                if self._outbox:
+                    self._enqueue_hook(AFTER_TURN, self._after_turn, ctx, final_payload)
+                else:
+                    self._after_turn(ctx, final_payload)
 
     def _fire_hooks(self, ctx: ExecutionContext, final_payload: dict) -> None:
         """
@@ -237,16 +283,31 @@ class CoreOrchestrator:
             }
 
         훅 실행 중 예외가 발생해도 무시 (로그만 남김). 메인 응답에는 영향 없음.
+        outbox 사용 시 기록만 하고, 실패한 훅은 outbox가 재시도한다.
         """
         for hook in final_payload.get("hooks", []):
             hook_type = hook.get("type")
             hook_fn = self._hook_handlers.get(hook_type)
-            if hook_fn:
+            if hook_fn and self._outbox:
+                self._enqueue_hook(hook_type, hook_fn, ctx, hook.get("data", {}))
+            elif hook_fn:
                 try:
                     hook_fn(ctx, hook.get("data", {}))
                 except Exception as e:
                     self.logger.warning(f"hook_handler '{hook_type}' error: {e}")
 
+    def _enqueue_hook(self, hook_type: str, hook_fn: Callable, ctx: ExecutionContext, data: Any) -> None:
+        """outbox에 기록. 커밋이 실패하면 유실 대신 핸들러를 직접 호출 (재시도 없음)."""
+        try:
+            self._outbox.enqueue(hook_type, ctx, data)
+            return
+        except Exception as e:
+            self.logger.error(f"[outbox] enqueue '{hook_type}' failed, calling handler directly: {e}")
+        try:
+            hook_fn(ctx, data)
+        except Exception as e:
+            self.logger.warning(f"hook_handler '{hook_type}' error: {e}")
+
     def handle_stream(self, session_id: str, user_message: str) -> Generator[Dict[str, Any], None, None]:
         """
         SSE 스트리밍 엔드포인트용 래퍼.
@@ -260,9 +321,7 @@ class CoreOrchestrator:
             # 에러 이벤트에 state_snapshot 보강 (프론트 상태 패널용)
             try:
                 state, _ = self.sessions.get_or_create(session_id)
-                error_event.get("payload", {})["state_snapshot"] = (
-                    state.model_dump() if hasattr(state, "model_dump") else {}
-                )
+                error_event.get("payload", {})["state_snapshot"] = state.model_dump()
             except Exception:
                 pass
             yield error_event
@@ -283,6 +342,27 @@ class CoreOrchestrator:
         payload = final or {}
         return {"interaction": payload, "hooks": payload.get("hooks", [])}
 
+    def call_in_session(self, session_id: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        fn(orchestrator, session_id, *args)를 이 세션을 가진 프로세스에서 실행한다.
+        단일 프로세스에서는 바로 호출 — WorkerSupervisor와 같은 인터페이스라 API 코드가 배치 방식을 몰라도 된다.
+        fn은 모듈 최상위 함수여야 한다 (워커 프로세스로 pickle 전달).
+        세션 저장소가 pin을 지원하면 fn 실행 중에는 동면되지 않게 고정한다.
+        """
+        pin = getattr(self.sessions, "pin", None)
+        if pin is None:
+            return fn(self, session_id, *args)
+        pin(session_id)
+        try:
+            return fn(self, session_id, *args)
+        finally:
+            self.sessions.unpin(session_id)
+
+    def close(self) -> None:
+        """백그라운드 자원 정리 (훅 outbox). 워커 프로세스 종료 시 호출."""
+        if self._outbox:
+            self._outbox.close()
+
 
 class _NoopCompleted:
     """CompletedStore가 없을 때 사용하는 무동작 구현체."""
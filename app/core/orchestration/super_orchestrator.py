@@ -16,16 +16,78 @@ SuperOrchestrator: 여러 서비스(CoreOrchestrator 또는 A2A 원격 서비스
       새 서비스 추가 = services dict에 한 줄 + ServiceRouter 규칙 등록
 """
 
-from typing import Any, Dict, Generator
+from collections import deque
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 
 class BaseServiceRouter:
-    """어느 서비스로 라우팅할지 결정. 규칙 기반 or LLM 기반으로 구현."""
+    """어느 서비스로 라우팅할지 결정. 규칙 기반 or 임베딩 기반 or LLM 기반으로 구현."""
 
     def route(self, user_message: str, session_context: dict) -> str:
         raise NotImplementedError
 
 
+class _KeywordAutomaton:
+    """
+    Aho-Corasick 다중 패턴 매처. 생성 시 1회 빌드하고, find()는 메시지 길이에 선형이다.
+    키워드·서비스 수가 늘어도 메시지 1회 순회로 모든 키워드 매치를 찾는다.
+    """
+
+    __slots__ = ("_goto", "_fail", "_out", "_link")
+
+    def __init__(self, patterns: Dict[str, Any]):
+        """patterns: keyword → value (매치 시 그대로 반환)."""
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Optional[Tuple[str, Any]]] = [None]
+        for kw, value in patterns.items():
+            node = 0
+            for ch in kw:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    out.append(None)
+                node = nxt
+            out[node] = (kw, value)
+
+        # BFS로 failure link와 dictionary suffix link 구성. link[n]은 fail 사슬에서 자체 출력이 있는
+        # 가장 가까운 노드 — 한 끝 위치에서 끝나는 키워드("zab"·"ab")를 모두 따라간다.
+        fail = [0] * len(goto)
+        link = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                link[nxt] = fail[nxt] if out[fail[nxt]] is not None else link[fail[nxt]]
+                queue.append(nxt)
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._link = link
+
+    def find(self, text: str) -> List[Tuple[int, str, Any]]:
+        """text의 모든 키워드 매치를 [(start, keyword, value), ...]로 반환 (겹치는 매치 포함)."""
+        goto, fail, out, link = self._goto, self._fail, self._out, self._link
+        node = 0
+        hits = []
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            match = node if out[node] is not None else link[node]
+            while match:
+                kw, value = out[match]
+                hits.append((i - len(kw) + 1, kw, value))
+                match = link[match]
+        return hits
+
+
 class KeywordServiceRouter(BaseServiceRouter):
     """
     키워드 기반 서비스 라우터. 빠르고 예측 가능.
@@ -35,22 +97,132 @@ class KeywordServiceRouter(BaseServiceRouter):
         router = KeywordServiceRouter(
             rules={
                 "transfer": ["이체", "송금", "보내"],
-                "balance":  ["잔액", "얼마", "조회"],
+                "balance":  {"잔액": 2.0, "얼마": 0.5, "조회": 1.0},   # 키워드별 가중치
                 "card":     ["카드", "신청", "발급"],
             },
             default="transfer",
         )
+
+    라우팅 규칙:
+      - 생성 시 모든 키워드로 Aho-Corasick 오토마톤을 1회 빌드 → 메시지 1회 순회로 매칭.
+      - 겹치는 매치는 가장 긴 키워드만 인정, 길이가 같으면 앞선 매치 ("이체내역"이 있으면 그 안의
+        "이체"는 무시, "이체크카드 발급"은 "체크카드 발급"이 "이체"를 이긴다).
+      - 서비스 점수 = 인정된 매치의 가중치 합 (리스트 규칙은 키워드당 1.0).
+      - session_context["current_service"]에 affinity 만큼 가산 → 진행 중 서비스 유지 경향.
+        키워드가 하나도 없으면 현재 서비스에 머문다 (affinity=0이면 default).
+      - 동점이면 rules에 먼저 등록된 서비스가 이긴다.
     """
 
-    def __init__(self, rules: Dict[str, list], default: str):
+    def __init__(
+        self,
+        rules: Dict[str, Union[List[str], Dict[str, float]]],
+        default: str,
+        affinity: float = 0.5,
+    ):
         self.rules = rules
         self.default = default
+        self.affinity = affinity
+        self._order = {service: i for i, service in enumerate(rules)}
+
+        # keyword → [(service, weight), ...]  (같은 키워드를 여러 서비스가 공유 가능)
+        patterns: Dict[str, List[Tuple[str, float]]] = {}
+        for service, keywords in rules.items():
+            weighted = keywords.items() if isinstance(keywords, dict) else ((kw, 1.0) for kw in keywords)
+            for kw, weight in weighted:
+                if kw:
+                    patterns.setdefault(kw, []).append((service, float(weight)))
+        self._automaton = _KeywordAutomaton(patterns)
+
+    def route(self, user_message: str, session_context: dict) -> str:
+        scores: Dict[str, float] = {}
+
+        # 긴 키워드 우선 + 같은 길이면 앞선 위치 우선 → 이미 채택된 매치와 겹치지 않는 것만 채택
+        hits = self._automaton.find(user_message)
+        if len(hits) > 1:
+            hits.sort(key=lambda h: (-len(h[1]), h[0]))
+        covered = [False] * len(user_message)
+        for start, kw, targets in hits:
+            end = start + len(kw)
+            if any(covered[start:end]):
+                continue
+            covered[start:end] = [True] * len(kw)
+            for service, weight in targets:
+                scores[service] = scores.get(service, 0.0) + weight
+
+        current = session_context.get("current_service")
+        if current in self._order and self.affinity:
+            scores[current] = scores.get(current, 0.0) + self.affinity
+
+        if not scores:
+            return self.default
+        return max(scores, key=lambda svc: (scores[svc], -self._order.get(svc, len(self._order))))
+
+
+class SemanticServiceRouter(BaseServiceRouter):
+    """
+    로컬 임베딩 기반 서비스 라우터. LLM 호출 없이 CPU에서 수 ms 이내로 라우팅.
+
+    서비스별 예시 발화(exemplar)를 문자 n-gram 해시 벡터로 임베딩해 중심 벡터(centroid)를
+    생성 시 1회 계산하고, 사용자 발화와의 코사인 유사도(행렬 곱)로 서비스를 고른다.
+    최고 유사도가 threshold 미만이면 fallback 라우터(보통 KeywordServiceRouter)에 위임한다.
+
+    예시:
+        router = SemanticServiceRouter(
+            exemplars={
+                "transfer": ["엄마한테 5만원 보내줘", "홍길동에게 이체해줘", "송금하고 싶어"],
+                "balance":  ["잔액 얼마야", "통장에 돈 얼마 남았어", "계좌 조회"],
+            },
+            default="transfer",
+            fallback=KeywordServiceRouter(rules={...}, default="transfer"),
+        )
+
+    numpy가 필요하다 (생성 시 지연 임포트).
+    """
+
+    def __init__(
+        self,
+        exemplars: Dict[str, List[str]],
+        default: str,
+        threshold: float = 0.2,
+        fallback: Optional[BaseServiceRouter] = None,
+        vectorizer: Any = None,
+    ):
+        import numpy as np
+        from app.core.ngram import HashedNgramVectorizer
+
+        self.default = default
+        self.threshold = threshold
+        self.fallback = fallback
+        self._vectorizer = vectorizer or HashedNgramVectorizer()
+        self._services = [svc for svc, texts in exemplars.items() if texts]
+
+        # 서비스별 exemplar 평균 → L2 정규화 centroid 행렬 (S, F)
+        centroids = np.stack([
+            self._vectorizer.transform(exemplars[svc]).mean(axis=0) for svc in self._services
+        ])
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        self._centroids = centroids / np.where(norms > 0, norms, 1.0)
+
+    def scores(self, messages: List[str]) -> Any:
+        """messages → (len(messages), 서비스 수) 코사인 유사도 행렬."""
+        return self._vectorizer.transform(messages) @ self._centroids.T
 
     def route(self, user_message: str, session_context: dict) -> str:
-        for service, keywords in self.rules.items():
-            if any(kw in user_message for kw in keywords):
-                return service
-        return self.default
+        return self.route_batch([user_message], [session_context])[0]
+
+    def route_batch(self, user_messages: List[str], session_contexts: List[dict]) -> List[str]:
+        """여러 발화를 행렬 연산 1회로 라우팅. 신뢰도 미달 발화만 fallback으로 개별 처리."""
+        sims = self.scores(user_messages)
+        best = sims.argmax(axis=1)
+        routed = []
+        for i, (msg, ctx) in enumerate(zip(user_messages, session_contexts)):
+            if sims[i, best[i]] >= self.threshold:
+                routed.append(self._services[best[i]])
+            elif self.fallback is not None:
+                routed.append(self.fallback.route(msg, ctx))
+            else:
+                routed.append(self.default)
+        return routed
 
 
 class SuperOrchestrator:
@@ -121,10 +293,11 @@ class A2AServiceProxy:
         self.endpoint = endpoint.rstrip("/")
 
     def handle_stream(self, session_id: str, user_message: str) -> Generator:
-        import json
         import requests
         import sseclient
 
+        from app.core.codec import json_codec
+
         url = f"{self.endpoint}/chat/stream"
         resp = requests.post(
             url,
@@ -134,7 +307,7 @@ class A2AServiceProxy:
             timeout=60,
         )
         for event in sseclient.SSEClient(resp).events():
-            yield json.loads(event.data)
+            yield json_codec().decode(event.data)
 
     def handle(self, session_id: str, user_message: str) -> dict:
         import requests
@@ -0,0 +1,635 @@
+# app/core/orchestration/supervisor.py
+"""
+WorkerSupervisor: CoreOrchestrator를 N개 워커 프로세스로 띄우고 session_id 일관 해싱으로 요청을 분배한다.
+
+uvicorn 단일 프로세스는 턴의 CPU 구간(검증·state 전이·직렬화)을 코어 하나로 처리한다.
+수퍼바이저는 같은 manifest로 워커마다 CoreOrchestrator를 만들고, 한 세션의 요청은 항상
+같은 워커로 보내 세션의 인메모리 state·memory가 그 워커에만 있도록 한다.
+
+CoreOrchestrator와 같은 handle_stream() / handle() 인터페이스 → create_agent_router에 그대로 꽂는다.
+
+    orchestrator = WorkerSupervisor("app.projects.transfer.manifest:load_manifest", workers=4)
+
+─── 구조 ───────────────────────────────────────────────────────────────────
+  프론트(uvicorn) 프로세스   WorkerSupervisor — HashRing.owner(session_id) → 워커
+  워커 프로세스 (spawn)      CoreOrchestrator + AF_UNIX Listener. 연결마다 스레드 1개, 연결은 프론트가
+                             워커별로 풀링해 재사용 (연결·인증 핸드셰이크는 연결당 한 번)
+  메시지 (pickle)            ("turn", sid, message, stream) → ("event", ev)… ("end", None) | ("result", r)
+                             ("call", sid, fn, args)       → ("result", fn(orchestrator, sid, *args))
+                             ("export", nodes|None, vnodes) / ("import", items) / ("stats",) / ("stop",)
+
+─── 해시 링 ────────────────────────────────────────────────────────────────
+  워커마다 SUPERVISOR_VNODES개 가상 노드(blake2b). 워커가 추가·제거되면 그 워커 몫의
+  세션(약 1/N)만 소유자가 바뀐다. 재기동한 워커는 같은 id를 쓰므로 링 위치가 그대로다.
+
+─── 재기동·재배치 ──────────────────────────────────────────────────────────
+  recycle(id)       새 프로세스를 띄워 준비되면 → 기존 워커로 가는 요청을 멈추고 진행 중 요청이
+                    끝나길 기다린 뒤(drain) → 세션을 넘기고(export → import) → 새 워커로 전환 → 기존 종료.
+                    SUPERVISOR_MAX_REQUESTS 요청마다 자동 실행.
+  add_worker()      새 워커를 띄우고 기존 워커 전체를 drain → 새 링 기준으로 옮겨갈 세션만 이관.
+  remove_worker(id) 해당 워커만 drain → 모든 세션을 새 링의 소유자에게 이관 → 종료.
+  이관 대상은 워커가 처리한 세션의 (state, memory, 완료 이력). 재배치 중 이동 대상 워커로 가는
+  요청은 잠시 대기했다가 새 링으로 다시 라우팅된다.
+  워커가 비정상 종료하면 같은 id로 다시 띄운다 — 그 워커의 인메모리 세션은 잃는다.
+  세션 저장소별 복원 범위:
+    shared     state·memory 모두 공유 메모리에서 복원
+    hibernate  cold 계층(유휴로 내려간 세션)만 복원 — hot 세션과, 복원 시 cold 행을 지운 뒤
+               다시 내려가기 전의 세션은 잃는다
+    eventlog   state만 저널에서 재생 — memory(대화 이력·요약)는 저장하지 않으므로 잃는다
+
+─── 범위 ───────────────────────────────────────────────────────────────────
+  턴 밖에서 세션에 접근하는 API는 call_in_session(session_id, fn, *args)로 소유 워커에서 실행한다.
+  프로세스 전역 상태(LLM breaker·limiter 메트릭)는 워커별로 따로 존재하며 프론트 프로세스의
+  /llm 엔드포인트는 이를 보지 못한다.
+  EXECUTION_MODE=async는 지원하지 않는다 — 결과가 워커의 이벤트 채널에 발행되어 프론트의
+  /events·/executions가 영영 받지 못하므로, 생성 시 ValueError로 거절한다.
+"""
+
+import atexit
+import bisect
+import hashlib
+import importlib
+import multiprocessing as mp
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from multiprocessing.connection import AuthenticationError, Client, Listener
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional
+
+from app.core.config import settings
+from app.core.logging import setup_logger
+from app.core.orchestration.defaults import make_error_event
+
+
+class WorkerError(RuntimeError):
+    """워커 프로세스에서 요청 처리 중 예외가 발생함."""
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    일관 해싱 링. owner(key)는 key 해시 이후 처음 만나는 가상 노드의 워커.
+
+    Args:
+        nodes:   워커 id 목록
+        vnodes:  워커당 가상 노드 수 (기본 SUPERVISOR_VNODES)
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), vnodes: Optional[int] = None):
+        self.vnodes = vnodes or settings.SUPERVISOR_VNODES
+        self.nodes: List[str] = []
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: str) -> None:
+        if node in self.nodes:
+            return
+        self.nodes.append(node)
+        for v in range(self.vnodes):
+            point = _hash(f"{node}#{v}")
+            i = bisect.bisect(self._points, point)
+            self._points.insert(i, point)
+            self._owners.insert(i, node)
+
+    def remove(self, node: str) -> None:
+        if node not in self.nodes:
+            return
+        self.nodes.remove(node)
+        kept = [(p, o) for p, o in zip(self._points, self._owners) if o != node]
+        self._points = [p for p, _ in kept]
+        self._owners = [o for _, o in kept]
+
+    def owner(self, key: str) -> str:
+        if not self._points:
+            raise LookupError("해시 링에 워커가 없어요")
+        i = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._owners[i]
+
+    def copy(self) -> "HashRing":
+        return HashRing(self.nodes, self.vnodes)
+
+
+def _resolve(path: str) -> Callable[[], Dict[str, Any]]:
+    """'package.module:function' → manifest 로더."""
+    module, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+def _list_completed(orchestrator: Any, session_id: str) -> List[Dict[str, Any]]:
+    return orchestrator.completed.list_for_session(session_id)
+
+
+# ─── 워커 프로세스 ────────────────────────────────────────────────────────────
+
+def _worker_main(worker_id: str, address: str, authkey: bytes, manifest_loader: str, ready: Any) -> None:
+    """워커 프로세스 진입점 (spawn). manifest를 워커 안에서 조립한다."""
+    os.environ["SUPERVISOR_WORKER_ID"] = worker_id
+    from app.core.orchestration.orchestrator import CoreOrchestrator
+
+    orchestrator = CoreOrchestrator(_resolve(manifest_loader)())
+    _Worker(worker_id, orchestrator).serve(address, authkey, ready)
+
+
+class _Worker:
+    """워커 프로세스 안의 요청 서버. 연결마다 스레드 하나 (uvicorn 스레드풀과 같은 동시성 모델)."""
+
+    def __init__(self, worker_id: str, orchestrator: Any):
+        self.worker_id = worker_id
+        self.orchestrator = orchestrator
+        self._seen: set = set()          # 이 워커가 처리한 세션 — 이관 대상
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._served = 0
+
+    def serve(self, address: str, authkey: bytes, ready: Any) -> None:
+        listener = Listener(address, family="AF_UNIX", backlog=128, authkey=authkey)
+        self._wake = lambda: Client(address, family="AF_UNIX", authkey=authkey).close()
+        ready.set()
+        try:
+            while not self._stopping.is_set():
+                try:
+                    conn = listener.accept()
+                except (OSError, AuthenticationError):
+                    continue
+                if self._stopping.is_set():
+                    conn.close()
+                    break
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+        finally:
+            listener.close()
+            self.orchestrator.close()
+
+    def _note(self, session_id: str) -> None:
+        with self._lock:
+            self._seen.add(session_id)
+            self._served += 1
+
+    def _handle(self, conn: Any) -> None:
+        """연결 하나에서 요청을 차례로 처리. 프론트가 연결을 닫으면(EOF) 끝."""
+        with conn:
+            while not self._stopping.is_set():
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    self._dispatch(conn, *message)
+                except (EOFError, BrokenPipeError, ConnectionResetError):
+                    return  # 프론트가 연결을 끊음 (SSE 클라이언트 이탈 등)
+                except Exception as e:
+                    try:
+                        conn.send(("error", f"{type(e).__name__}: {e}"))
+                    except OSError:
+                        return
+
+    def _dispatch(self, conn: Any, op: str, *args: Any) -> None:
+        if op == "turn":
+            session_id, message, stream = args
+            self._note(session_id)
+            if stream:
+                events = self.orchestrator.handle_stream(session_id, message)
+                try:
+                    while True:
+                        try:
+                            event = next(events)
+                        except StopIteration:
+                            break
+                        except Exception:
+                            # handle_stream은 에러 DONE 이벤트를 이미 보낸 뒤 re-raise한다 —
+                            # ("error")까지 보내면 프론트가 에러 이벤트를 한 번 더 만든다
+                            break
+                        conn.send(("event", event))
+                finally:
+                    events.close()
+                conn.send(("end", None))
+            else:
+                conn.send(("result", self.orchestrator.handle(session_id, message)))
+        elif op == "call":
+            session_id, fn, fn_args = args
+            self._note(session_id)
+            conn.send(("result", fn(self.orchestrator, session_id, *fn_args)))
+        elif op == "export":
+            conn.send(("result", self._export(*args)))
+        elif op == "import":
+            conn.send(("result", self._import(*args)))
+        elif op == "stats":
+            with self._lock:
+                conn.send(("result", {"pid": os.getpid(), "sessions": len(self._seen), "handled": self._served}))
+        elif op == "stop":
+            self._stopping.set()
+            conn.send(("result", None))
+            self._wake()
+        else:
+            conn.send(("error", f"unknown op: {op}"))
+
+    def _export(self, nodes: Optional[List[str]], vnodes: int) -> List[tuple]:
+        """nodes 링에서 이 워커 소유가 아닌 세션(nodes=None이면 전부)을 꺼내고 로컬에서 지운다."""
+        ring = HashRing(nodes, vnodes) if nodes is not None else None
+        sessions, completed = self.orchestrator.sessions, self.orchestrator.completed
+        items = []
+        with self._lock:
+            moving = [sid for sid in self._seen if ring is None or ring.owner(sid) != self.worker_id]
+            self._seen.difference_update(moving)
+        for sid in moving:
+            state, memory = sessions.get_or_create(sid)
+            rows = completed.drop(sid) if hasattr(completed, "drop") else []
+            if hasattr(sessions, "drop"):
+                sessions.drop(sid)
+            items.append((sid, state, memory, rows))
+        return items
+
+    def _import(self, items: List[tuple]) -> int:
+        sessions, completed = self.orchestrator.sessions, self.orchestrator.completed
+        for sid, state, memory, rows in items:
+            _, local = sessions.get_or_create(sid)
+            local.clear()
+            local.update(memory)
+            sessions.save_state(sid, state)
+            if rows and hasattr(completed, "restore"):
+                completed.restore(sid, rows)
+        with self._lock:
+            self._seen.update(sid for sid, *_ in items)
+        return len(items)
+
+
+# ─── 프론트 프로세스 ──────────────────────────────────────────────────────────
+
+class _WorkerHandle:
+    __slots__ = ("worker_id", "process", "address", "ready", "inflight", "served", "started_at", "idle")
+
+    def __init__(self, worker_id: str, process: Any, address: str, ready: Any):
+        self.worker_id = worker_id
+        self.process = process
+        self.address = address
+        self.ready = ready
+        self.inflight = 0
+        self.served = 0
+        self.started_at = time.time()
+        self.idle: List[Any] = []   # 재사용 대기 중인 연결
+
+
+class _RoutedCompleted:
+    """orchestrator.completed 자리에 두는 프록시 — 조회를 세션 소유 워커에서 실행."""
+
+    def __init__(self, supervisor: "WorkerSupervisor"):
+        self._supervisor = supervisor
+
+    def list_for_session(self, session_id: str) -> List[Dict[str, Any]]:
+        return self._supervisor.call_in_session(session_id, _list_completed)
+
+
+class WorkerSupervisor:
+    """
+    CoreOrchestrator 워커 프로세스 풀 + 세션 affinity 라우터.
+
+    사용 예시 (app/main.py):
+        orchestrator = WorkerSupervisor("app.projects.transfer.manifest:load_manifest")
+        agent_router = create_agent_router(orchestrator)  # 기존 코드 그대로
+
+    Args:
+        manifest_loader:  워커에서 manifest를 만들 함수의 'module:function' 경로
+        workers:          워커 수 (기본 SUPERVISOR_WORKERS, 최소 1)
+        vnodes:           워커당 가상 노드 수 (기본 SUPERVISOR_VNODES)
+        max_requests:     워커당 이 요청 수마다 재기동 (기본 SUPERVISOR_MAX_REQUESTS, 0=끔)
+        socket_dir:       워커 AF_UNIX 소켓 디렉터리 (기본 SUPERVISOR_SOCKET_DIR, 비어있으면 임시 디렉터리)
+    """
+
+    def __init__(
+        self,
+        manifest_loader: str,
+        workers: Optional[int] = None,
+        vnodes: Optional[int] = None,
+        max_requests: Optional[int] = None,
+        socket_dir: Optional[str] = None,
+    ):
+        if settings.EXECUTION_MODE == "async":
+            raise ValueError(
+                "EXECUTION_MODE=async는 SUPERVISOR_WORKERS와 함께 쓸 수 없어요 — 백그라운드 실행 결과가 "
+                "워커 프로세스에만 발행되어 /events·/executions로 전달되지 않습니다. "
+                "EXECUTION_MODE=sync로 두거나 SUPERVISOR_WORKERS=0으로 실행하세요."
+            )
+        self.manifest_loader = manifest_loader
+        self.max_requests = max_requests if max_requests is not None else settings.SUPERVISOR_MAX_REQUESTS
+        self.logger = setup_logger("Supervisor")
+        self.completed = _RoutedCompleted(self)
+
+        self._ctx = mp.get_context("spawn")
+        self._authkey = os.urandom(16)
+        self._own_dir = not (socket_dir or settings.SUPERVISOR_SOCKET_DIR)
+        self._dir = socket_dir or settings.SUPERVISOR_SOCKET_DIR or tempfile.mkdtemp(prefix="supervisor-")
+        os.makedirs(self._dir, exist_ok=True)
+
+        self._ring = HashRing(vnodes=vnodes)
+        self._workers: Dict[str, _WorkerHandle] = {}
+        self._paused: set = set()
+        self._cond = threading.Condition()
+        self._admin = threading.RLock()      # 워커 구성 변경(추가·제거·재기동) 직렬화
+        self._next_id = 0
+        self._closed = False
+        self._counters = {"recycled": 0, "respawned": 0, "moved_sessions": 0}
+
+        handles = [self._spawn(self._new_id()) for _ in range(max(1, workers or settings.SUPERVISOR_WORKERS))]
+        for handle in handles:
+            self._wait_ready(handle)
+            self._workers[handle.worker_id] = handle
+            self._ring.add(handle.worker_id)
+        self.logger.info(f"[Supervisor] workers={list(self._workers)} vnodes={self._ring.vnodes}")
+
+        threading.Thread(target=self._watch, name="supervisor-watch", daemon=True).start()
+        atexit.register(self.close)
+
+    # ── orchestrator 인터페이스 ───────────────────────────────────────────────
+
+    def handle_stream(self, session_id: str, user_message: str) -> Generator[Dict[str, Any], None, None]:
+        """CoreOrchestrator와 동일한 인터페이스. 세션 소유 워커의 이벤트를 그대로 전달."""
+        handle = self._acquire(session_id)
+        conn = None
+        try:
+            conn = self._connect(handle, ("turn", session_id, user_message, True))
+            while True:
+                kind, value = conn.recv()
+                if kind == "event":
+                    yield value
+                elif kind == "end":
+                    self._checkin(handle, conn)
+                    conn = None
+                    return
+                else:
+                    raise WorkerError(value)
+        except (EOFError, OSError, WorkerError) as e:
+            self.logger.error(f"[Supervisor] {handle.worker_id} stream failed: {e}")
+            yield make_error_event(e)
+        finally:
+            if conn is not None:
+                conn.close()  # 중간에 끊긴 스트림 — 워커는 다음 send에서 이탈을 감지
+            self._release(handle)
+
+    def handle(self, session_id: str, user_message: str) -> Dict[str, Any]:
+        """비스트리밍 버전."""
+        handle = self._acquire(session_id)
+        try:
+            return self._request(handle, ("turn", session_id, user_message, False))
+        except (EOFError, OSError, WorkerError) as e:
+            self.logger.error(f"[Supervisor] {handle.worker_id} turn failed: {e}")
+            return {"interaction": make_error_event(e)["payload"], "hooks": []}
+        finally:
+            self._release(handle)
+
+    def call_in_session(self, session_id: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """fn(orchestrator, session_id, *args)를 세션 소유 워커에서 실행. fn은 모듈 최상위 함수."""
+        handle = self._acquire(session_id)
+        try:
+            return self._request(handle, ("call", session_id, fn, args))
+        finally:
+            self._release(handle)
+
+    # ── 워커 구성 변경 ────────────────────────────────────────────────────────
+
+    def add_worker(self) -> str:
+        """워커를 추가하고 새 링에서 그 워커 소유가 된 세션을 옮긴다."""
+        with self._admin:
+            handle = self._spawn(self._new_id())
+            self._wait_ready(handle)
+            ring = self._ring.copy()
+            ring.add(handle.worker_id)
+            sources = list(self._workers)
+            self._drain(sources)
+            try:
+                moved = 0
+                targets = {**self._workers, handle.worker_id: handle}
+                for wid in sources:
+                    items = self._request(self._workers[wid], ("export", ring.nodes, ring.vnodes))
+                    moved += self._handoff(items, ring, targets)
+                with self._cond:
+                    self._workers[handle.worker_id] = handle
+                    self._ring = ring
+            finally:
+                self._resume(sources)
+            self._counters["moved_sessions"] += moved
+            self.logger.info(f"[Supervisor] +{handle.worker_id} moved={moved} workers={ring.nodes}")
+            return handle.worker_id
+
+    def remove_worker(self, worker_id: str) -> None:
+        """워커를 빼고 그 워커의 세션을 새 링의 소유자에게 옮긴 뒤 종료한다."""
+        with self._admin:
+            if worker_id not in self._workers:
+                raise KeyError(worker_id)
+            if len(self._workers) == 1:
+                raise ValueError("마지막 워커는 제거할 수 없어요")
+            ring = self._ring.copy()
+            ring.remove(worker_id)
+            self._drain([worker_id])
+            try:
+                items = self._request(self._workers[worker_id], ("export", None, ring.vnodes))
+                moved = self._handoff(items, ring, self._workers)
+                with self._cond:
+                    handle = self._workers.pop(worker_id)
+                    self._ring = ring
+            finally:
+                self._resume([worker_id])
+            self._stop(handle)
+            self._counters["moved_sessions"] += moved
+            self.logger.info(f"[Supervisor] -{worker_id} moved={moved} workers={ring.nodes}")
+
+    def recycle(self, worker_id: str) -> None:
+        """같은 id로 새 프로세스를 띄워 세션을 넘기고 기존 프로세스를 종료한다 (무중단)."""
+        with self._admin:
+            old = self._workers.get(worker_id)
+            if old is None:
+                return
+            new = self._spawn(worker_id)
+            self._wait_ready(new)
+            self._drain([worker_id])
+            try:
+                items = self._request(old, ("export", None, self._ring.vnodes))
+                if items:
+                    self._request(new, ("import", items))
+                with self._cond:
+                    self._workers[worker_id] = new
+            finally:
+                self._resume([worker_id])
+            self._stop(old)
+            self._counters["recycled"] += 1
+            self.logger.info(f"[Supervisor] recycled {worker_id} pid {old.process.pid}→{new.process.pid} "
+                             f"sessions={len(items)}")
+
+    def worker_metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            handles = list(self._workers.values())
+            paused = sorted(self._paused)
+        workers = []
+        for handle in handles:
+            row = {
+                "id": handle.worker_id,
+                "pid": handle.process.pid,
+                "alive": handle.process.is_alive(),
+                "inflight": handle.inflight,
+                "served": handle.served,
+                "started_at": handle.started_at,
+            }
+            try:
+                row.update(self._request(handle, ("stats",)))
+            except (EOFError, OSError, WorkerError):
+                pass
+            workers.append(row)
+        return {"workers": workers, "vnodes": self._ring.vnodes, "paused": paused, **self._counters}
+
+    def close(self) -> None:
+        """모든 워커를 종료한다. 여러 번 호출해도 안전."""
+        with self._admin:
+            if self._closed:
+                return
+            self._closed = True
+            for handle in list(self._workers.values()):
+                self._stop(handle)
+            self._workers.clear()
+            if self._own_dir:
+                shutil.rmtree(self._dir, ignore_errors=True)
+
+    # ── 라우팅 ───────────────────────────────────────────────────────────────
+
+    def _acquire(self, session_id: str) -> _WorkerHandle:
+        """세션 소유 워커의 in-flight를 올린다. 재배치 중인 워커면 끝날 때까지 기다렸다가 새 링으로 다시 찾는다."""
+        with self._cond:
+            while True:
+                worker_id = self._ring.owner(session_id)
+                if worker_id not in self._paused:
+                    break
+                self._cond.wait()
+            handle = self._workers[worker_id]
+            handle.inflight += 1
+            handle.served += 1
+            recycle = self.max_requests > 0 and handle.served == self.max_requests
+        if recycle:
+            threading.Thread(target=self.recycle, args=(worker_id,), daemon=True).start()
+        return handle
+
+    def _release(self, handle: _WorkerHandle) -> None:
+        with self._cond:
+            handle.inflight -= 1
+            self._cond.notify_all()
+
+    def _drain(self, worker_ids: List[str]) -> None:
+        """worker_ids로 가는 새 요청을 멈추고 진행 중 요청이 끝날 때까지 기다린다."""
+        with self._cond:
+            self._paused.update(worker_ids)
+            self._cond.wait_for(
+                lambda: all(self._workers[w].inflight == 0 for w in worker_ids if w in self._workers)
+            )
+
+    def _resume(self, worker_ids: List[str]) -> None:
+        with self._cond:
+            self._paused.difference_update(worker_ids)
+            self._cond.notify_all()
+
+    def _handoff(self, items: List[tuple], ring: HashRing, targets: Dict[str, _WorkerHandle]) -> int:
+        """export한 세션을 ring 기준 새 소유자에게 import."""
+        groups: Dict[str, List[tuple]] = {}
+        for item in items:
+            groups.setdefault(ring.owner(item[0]), []).append(item)
+        for worker_id, group in groups.items():
+            self._request(targets[worker_id], ("import", group))
+        return len(items)
+
+    # ── 워커 프로세스 관리 ────────────────────────────────────────────────────
+
+    def _new_id(self) -> str:
+        worker_id = f"w{self._next_id}"
+        self._next_id += 1
+        return worker_id
+
+    def _spawn(self, worker_id: str) -> _WorkerHandle:
+        address = os.path.join(self._dir, f"{worker_id}-{uuid.uuid4().hex[:8]}.sock")
+        ready = self._ctx.Event()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker_id, address, self._authkey, self.manifest_loader, ready),
+            name=f"orchestrator-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        return _WorkerHandle(worker_id, process, address, ready)
+
+    def _wait_ready(self, handle: _WorkerHandle) -> None:
+        deadline = time.monotonic() + settings.SUPERVISOR_START_TIMEOUT_SEC
+        while not handle.ready.wait(0.1):
+            if not handle.process.is_alive() or time.monotonic() > deadline:
+                handle.process.kill()
+                raise WorkerError(f"{handle.worker_id} 워커가 시작되지 않았어요 (exitcode={handle.process.exitcode})")
+
+    def _stop(self, handle: _WorkerHandle) -> None:
+        try:
+            self._request(handle, ("stop",))
+        except (EOFError, OSError, WorkerError):
+            pass
+        while handle.idle:
+            handle.idle.pop().close()
+        handle.process.join(10)
+        if handle.process.is_alive():
+            handle.process.terminate()
+            handle.process.join(5)
+
+    def _watch(self) -> None:
+        """비정상 종료한 워커를 같은 id로 다시 띄운다 (링은 그대로)."""
+        while not self._closed:
+            time.sleep(1.0)
+            for worker_id, handle in list(self._workers.items()):
+                if handle.process.is_alive() or self._closed:
+                    continue
+                with self._admin:
+                    if self._closed or self._workers.get(worker_id) is not handle:
+                        continue
+                    self.logger.warning(f"[Supervisor] {worker_id} exited ({handle.process.exitcode}) — respawning")
+                    new = self._spawn(worker_id)
+                    try:
+                        self._wait_ready(new)
+                    except WorkerError as e:
+                        self.logger.error(f"[Supervisor] respawn failed: {e}")
+                        continue
+                    with self._cond:
+                        self._workers[worker_id] = new
+                    self._counters["respawned"] += 1
+
+    _POOL_MAX = 32
+
+    def _connect(self, handle: _WorkerHandle, message: tuple) -> Any:
+        """풀의 연결(없으면 새 연결)로 message를 보낸다."""
+        try:
+            conn = handle.idle.pop()
+        except IndexError:
+            conn = None
+        if conn is not None:
+            try:
+                conn.send(message)
+                return conn
+            except OSError:
+                conn.close()
+        conn = Client(handle.address, family="AF_UNIX", authkey=self._authkey)
+        conn.send(message)
+        return conn
+
+    def _checkin(self, handle: _WorkerHandle, conn: Any) -> None:
+        if len(handle.idle) < self._POOL_MAX:
+            handle.idle.append(conn)
+        else:
+            conn.close()
+
+    def _request(self, handle: _WorkerHandle, message: tuple) -> Any:
+        conn = self._connect(handle, message)
+        try:
+            kind, value = conn.recv()
+        except BaseException:
+            conn.close()
+            raise
+        self._checkin(handle, conn)
+        if kind == "error":
+            raise WorkerError(value)
+        return value
@@ -2,5 +2,18 @@
 from app.core.state.base_state import BaseState
 from app.core.state.base_state_manager import BaseStateManager
 from app.core.state.stores import InMemorySessionStore, InMemoryCompletedStore
+from app.core.state.event_log import EventSourcedSessionStore
+from app.core.state.hibernation import HibernatingSessionStore
+from app.core.state.shared_cache import SessionOverflow, SharedMemorySessionStore, SharedSessionCache
 
-__all__ = ["BaseState", "BaseStateManager", "InMemorySessionStore", "InMemoryCompletedStore"]
+__all__ = [
+    "BaseState",
+    "BaseStateManager",
+    "InMemorySessionStore",
+    "InMemoryCompletedStore",
+    "EventSourcedSessionStore",
+    "HibernatingSessionStore",
+    "SharedMemorySessionStore",
+    "SharedSessionCache",
+    "SessionOverflow",
+]
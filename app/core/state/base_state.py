@@ -15,10 +15,12 @@
   - stage: 상태 머신의 현재 단계. 단순 서비스면 "INIT" 하나만 써도 된다.
   - meta: 런타임 중간 데이터 (오류 정보, 배치 진행 상황 등). 직렬화 가능한 값만 넣는다.
   - task_queue: 순차 처리할 작업 목록 (배치/다건 처리용).
+  - SCHEMA_VERSION: 저장 포맷 버전. 필드를 추가·삭제·변경하면 올리고, 이전 버전 복원이
+    필요하면 app.core.codec.register_upgrade로 변환 훅을 등록한다.
 """
 
-from typing import Any, Dict, List
-from pydantic import BaseModel, Field
+from typing import Any, ClassVar, Dict, List, Optional
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class BaseState(BaseModel):
@@ -36,7 +38,8 @@ class BaseState(BaseModel):
     meta       런타임 중간 데이터 (dict). 타입 정의 없이 자유롭게 사용.
                주요 사용처:
                  - slot_errors:   {"슬롯명": "오류 메시지"}  ← StateManager가 기록
-                 - slot_meta:     [{"parse_error": True}]   ← SlotFiller 파싱 실패 신호
+                 - slot_meta:     [{"parse_error": True}]   ← SlotFiller 파싱 실패 신호 (최근 N건)
+                 - meta_counts:   {"slot_meta": 3, ...}     ← 진단 로그 누적 횟수
                  - batch_total:   int  배치 전체 건수
                  - batch_progress: int 배치 완료 건수
                  - execution:     {"agent": ..., "error": ...}  ← 실행 오류 기록
@@ -48,9 +51,29 @@ class BaseState(BaseModel):
                   {"target": "엄마",   "amount": None}]   ← amount는 FILLING 단계에서 수집
                FlowHandler가 pop()으로 꺼내 slots에 적용한다.
                단건 서비스면 사용할 필요 없다.
+
+    _journal   (비직렬화) StateManager.apply가 남기는 delta·stage 전이 기록.
+               기본 꺼짐(None) — 소비하는 저장소(EventSourcedSessionStore)가 enable_journal()로
+               켠 state에만 쌓이고, save_state 시 꺼내 이벤트 로그에 함께 기록한다.
+               다른 저장소의 장수 세션에서 기록이 무한히 쌓이지 않게 하기 위함.
     """
 
+    SCHEMA_VERSION: ClassVar[int] = 1
+
     scenario:   str = "DEFAULT"
     stage:      str = "INIT"
     meta:       Dict[str, Any] = Field(default_factory=dict)
     task_queue: List[Dict[str, Any]] = Field(default_factory=list)
+    _journal:   Optional[List[Dict[str, Any]]] = PrivateAttr(default=None)
+
+    def enable_journal(self) -> None:
+        """apply 기록을 켠다 (이미 켜져 있으면 그대로)."""
+        if self._journal is None:
+            self._journal = []
+
+    def drain_journal(self) -> List[Dict[str, Any]]:
+        """쌓인 apply 기록을 반환하고 비운다. 기록이 꺼져 있으면 빈 리스트."""
+        if self._journal is None:
+            return []
+        journal, self._journal = self._journal, []
+        return journal
@@ -32,6 +32,18 @@ transfer 서비스 예시:
             self._validate()
             self._transition()
             return self.state
+
+─── meta 진단 로그 ─────────────────────────────────────────────────────────
+  검증 실패 op 등 진단용 기록은 _record_meta(key, item)으로 남긴다.
+  meta[key]에는 최근 META_LOG_MAX건만 유지되고(ring buffer),
+  전체 발생 횟수는 meta["meta_counts"][key]에 누적된다.
+  → 세션이 길어져도 state 크기(state_snapshot·세션 저장·완료 이력)가 일정하게 유지된다.
+
+─── apply 기록 (journal) ───────────────────────────────────────────────────
+  apply 끝에 _journal_delta(delta, stage_before)를 호출하면 state._journal에
+  {"ops": [...], "stage": [before, after]}가 쌓인다. 이벤트 로그 세션 저장소
+  (app/core/state/event_log.py)가 이를 슬롯 조작 감사 이력으로 기록한다.
+  journal은 그 저장소가 enable_journal()로 켠 state에서만 쌓인다 (그 외에는 아무것도 하지 않음).
 """
 
 from typing import Any, Dict
@@ -40,9 +52,35 @@ from typing import Any, Dict
 class BaseStateManager:
     """프로젝트별 State 전이 로직. Core는 인터페이스만 정의한다."""
 
+    # meta 진단 로그의 key별 최대 보관 건수. 초과분은 오래된 것부터 버린다.
+    META_LOG_MAX: int = 5
+
     def __init__(self, state: Any):
         self.state = state
 
+    def _record_meta(self, key: str, item: Any) -> None:
+        """
+        meta[key] 진단 로그에 item을 추가한다.
+
+        최근 META_LOG_MAX건만 유지하고, 전체 횟수는 meta["meta_counts"][key]에 누적한다.
+        """
+        log = self.state.meta.setdefault(key, [])
+        log.append(item)
+        if len(log) > self.META_LOG_MAX:
+            del log[:-self.META_LOG_MAX]
+        counts = self.state.meta.setdefault("meta_counts", {})
+        counts[key] = counts.get(key, 0) + 1
+
+    def _journal_delta(self, delta: Dict[str, Any], stage_before: Any) -> None:
+        """적용한 ops와 stage 전이를 state journal에 남긴다 (변화가 없으면 생략)."""
+        journal = getattr(self.state, "_journal", None)
+        if journal is None:   # 소비하는 저장소가 없음
+            return
+        ops = delta.get("operations") or []
+        if not ops and self.state.stage == stage_before:
+            return
+        journal.append({"ops": ops, "stage": [stage_before, self.state.stage]})
+
     def apply(self, delta: Dict[str, Any]) -> Any:
         """
         LLM delta를 state에 반영한 뒤 갱신된 state를 반환한다.
@@ -0,0 +1,242 @@
+# app/core/state/event_log.py
+"""
+EventSourcedSessionStore: 세션 state를 이벤트 로그(append-only) + 주기적 스냅샷으로 영속화한다.
+
+InMemorySessionStore와 같은 인터페이스(get_or_create / save_state / reset)를 제공한다.
+save_state마다 state 전체를 다시 쓰는 대신 직전 저장본과의 차이만 이벤트 한 줄로 추가하고,
+StateManager.apply가 남긴 journal(ops·stage 전이)을 같은 이벤트에 담아 슬롯 조작 감사 이력을 남긴다.
+
+─── 저장 형식 (SQLite) ─────────────────────────────────────────────────────
+  events(session_id, seq, at, body)     body = {"diff": {"set": [[path, value]], "unset": [path]},
+                                                "journal": [{"ops": [...], "stage": [from, to]}]}
+  snapshots(session_id, seq, at, body)  body = codec.encode_state(state)
+  meta(key, value)                      "codec" — 파일 생성 시점의 STATE_CODEC을 resolve_codec으로
+                                        고정한 이름 (binary → "binary:msgpack" 등). 이후 설정이나
+                                        설치된 의존성이 바뀌어도 이 파일은 기록된 코덱으로 읽고 쓴다.
+  path는 필드 경로 목록 (["slots", "amount"]) — dict 필드는 2단계까지 키 단위로 diff.
+  event body는 get_codec(codec)으로 인코딩한다.
+
+─── 스냅샷·복원 ────────────────────────────────────────────────────────────
+  SESSION_SNAPSHOT_EVERY개 이벤트마다 스냅샷을 추가한다 (이벤트는 감사 이력으로 유지).
+  캐시에 없는 세션(재시작 후 등)은 최신 스냅샷 + 이후 이벤트 replay로 복원한다.
+
+─── 범위 ───────────────────────────────────────────────────────────────────
+  영속화 대상은 state뿐. memory(raw_history·summary_text)는 InMemorySessionStore와 같이
+  프로세스 메모리에만 둔다.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.codec import decode_state, encode_state, get_codec, resolve_codec
+from app.core.config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    session_id TEXT    NOT NULL,
+    seq        INTEGER NOT NULL,
+    at         REAL    NOT NULL,
+    body       BLOB    NOT NULL,
+    PRIMARY KEY (session_id, seq)
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    session_id TEXT    NOT NULL,
+    seq        INTEGER NOT NULL,
+    at         REAL    NOT NULL,
+    body       BLOB    NOT NULL,
+    PRIMARY KEY (session_id, seq)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_MISSING = object()
+
+
+def _empty_memory() -> dict:
+    return {"raw_history": [], "summary_text": ""}
+
+
+def _enable_journal(state: Any) -> None:
+    """이 저장소가 journal을 소비하므로 apply 기록을 켠다 (BaseState가 아니면 무시)."""
+    if hasattr(state, "enable_journal"):
+        state.enable_journal()
+
+
+def diff_docs(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, list]:
+    """두 state dict의 차이. dict 필드(slots·meta)는 하위 키 단위, 그 외는 값 전체 교체."""
+    set_, unset = [], []
+    for key, value in new.items():
+        prev = old.get(key, _MISSING)
+        if prev == value:
+            continue
+        if isinstance(prev, dict) and isinstance(value, dict):
+            for sub, sub_value in value.items():
+                if prev.get(sub, _MISSING) != sub_value:
+                    set_.append([[key, sub], sub_value])
+            unset.extend([key, sub] for sub in prev if sub not in value)
+        else:
+            set_.append([[key], value])
+    unset.extend([key] for key in old if key not in new)
+    return {k: v for k, v in (("set", set_), ("unset", unset)) if v}
+
+
+def apply_diff(doc: Dict[str, Any], diff: Dict[str, list]) -> None:
+    """diff_docs 결과를 doc에 in-place 적용."""
+    for path, value in diff.get("set", []):
+        target = doc
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        target[path[-1]] = value
+    for path in diff.get("unset", []):
+        target = doc
+        for key in path[:-1]:
+            target = target.get(key, {})
+        target.pop(path[-1], None)
+
+
+class EventSourcedSessionStore:
+    """
+    세션별 (state, memory) 저장소. 활성 세션은 메모리에 두고, state 변경은 이벤트 로그에 추가한다.
+
+    사용법 (manifest.py):
+        from app.core.state.event_log import EventSourcedSessionStore
+        "sessions_factory": lambda: EventSourcedSessionStore(state_factory=MyState),
+
+    Args:
+        state_factory:   새 state 생성 (BaseState 하위 클래스 — model_validate로 복원)
+        path:            SQLite 파일 경로 (기본 SESSION_LOG_PATH, 비어있으면 LOG_DIR/sessions.db)
+        snapshot_every:  스냅샷 간격 (이벤트 수)
+    """
+
+    def __init__(
+        self,
+        state_factory: Callable,
+        path: Optional[str] = None,
+        snapshot_every: Optional[int] = None,
+    ):
+        self._state_factory = state_factory
+        self.path = path or settings.SESSION_LOG_PATH or os.path.join(settings.LOG_DIR, "sessions.db")
+        self.snapshot_every = snapshot_every or settings.SESSION_SNAPSHOT_EVERY
+        self._store: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.execute(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES ('codec', ?)", (resolve_codec(settings.STATE_CODEC),),
+        )
+        self.codec_name = self._db.execute("SELECT value FROM meta WHERE key='codec'").fetchone()[0]
+        if self.codec_name == "binary":
+            # 내부 코덱을 기록하지 않던 파일 — 스냅샷 헤더(없으면 현재 설치 기준)로 고정
+            sample = self._db.execute("SELECT body FROM snapshots LIMIT 1").fetchone()
+            self.codec_name = resolve_codec("binary", sample[0] if sample else None)
+            self._db.execute("UPDATE meta SET value=? WHERE key='codec'", (self.codec_name,))
+        self._codec = get_codec(self.codec_name)
+
+    # ── SessionStore 인터페이스 ───────────────────────────────────────────────
+
+    def get_or_create(self, session_id: str) -> Tuple[Any, Dict[str, Any]]:
+        with self._lock:
+            s = self._store.get(session_id)
+            if s is None:
+                s = self._store[session_id] = self._rehydrate(session_id)
+            _enable_journal(s["state"])
+            return s["state"], s["memory"]
+
+    def save_state(self, session_id: str, state: Any) -> None:
+        with self._lock:
+            s = self._store.get(session_id)
+            if s is None:
+                return
+            doc = state.model_dump(mode="json")
+            diff = diff_docs(s["doc"], doc)
+            journal = state.drain_journal() if hasattr(state, "drain_journal") else []
+            _enable_journal(state)
+            s["state"] = state
+            if not diff and not journal:
+                return
+            self._append(s, session_id, state, doc, {"diff": diff, "journal": journal} if journal else {"diff": diff})
+
+    def reset(self, session_id: str) -> None:
+        """세션 완전 초기화 (state + memory). 초기 state를 이벤트로 남긴다."""
+        with self._lock:
+            s = self._store.get(session_id) or self._rehydrate(session_id)
+            s["memory"] = _empty_memory()
+            self._store[session_id] = s
+            self.save_state(session_id, self._state_factory())
+
+    def drop(self, session_id: str) -> None:
+        """메모리 캐시에서만 제거 (로그는 유지 — 다음 get_or_create에서 복원)."""
+        with self._lock:
+            self._store.pop(session_id, None)
+
+    # ── 감사 이력 ─────────────────────────────────────────────────────────────
+
+    def history(self, session_id: str, after: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """seq > after인 이벤트 목록 (오래된 순)."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT seq, at, body FROM events WHERE session_id=? AND seq>? ORDER BY seq LIMIT ?",
+                (session_id, after, limit),
+            ).fetchall()
+        return [{"seq": seq, "at": at, **self._codec.decode(body)} for seq, at, body in rows]
+
+    # ── 내부 ─────────────────────────────────────────────────────────────────
+
+    def _append(self, s: Dict[str, Any], session_id: str, state: Any, doc: Dict[str, Any],
+                body: Dict[str, Any]) -> None:
+        seq = s["seq"] + 1
+        now = time.time()
+        self._db.execute("BEGIN")
+        self._db.execute(
+            "INSERT INTO events (session_id, seq, at, body) VALUES (?, ?, ?, ?)",
+            (session_id, seq, now, self._codec.encode(body)),
+        )
+        if seq - s["snapshot_seq"] >= self.snapshot_every:
+            self._db.execute(
+                "INSERT INTO snapshots (session_id, seq, at, body) VALUES (?, ?, ?, ?)",
+                (session_id, seq, now, encode_state(state, self.codec_name)),
+            )
+            s["snapshot_seq"] = seq
+        self._db.execute("COMMIT")
+        s["seq"], s["doc"] = seq, doc
+
+    def _rehydrate(self, session_id: str) -> Dict[str, Any]:
+        """최신 스냅샷 + 이후 이벤트 replay. 기록이 없으면 새 state."""
+        snap = self._db.execute(
+            "SELECT seq, body FROM snapshots WHERE session_id=? ORDER BY seq DESC LIMIT 1", (session_id,),
+        ).fetchone()
+        snapshot_seq, doc = (
+            (snap[0], decode_state(snap[1], self._state_factory, self.codec_name).model_dump(mode="json"))
+            if snap else (0, None)
+        )
+        events = self._db.execute(
+            "SELECT seq, body FROM events WHERE session_id=? AND seq>? ORDER BY seq",
+            (session_id, snapshot_seq),
+        ).fetchall()
+
+        seq = snapshot_seq
+        if doc is None and not events:
+            state = self._state_factory()
+        else:
+            doc = doc if doc is not None else self._state_factory().model_dump(mode="json")
+            for seq, body in events:
+                apply_diff(doc, self._codec.decode(body)["diff"])
+            state = self._state_factory.model_validate(doc)
+        return {
+            "state": state,
+            "memory": _empty_memory(),
+            "doc": state.model_dump(mode="json"),
+            "seq": seq,
+            "snapshot_seq": snapshot_seq,
+        }
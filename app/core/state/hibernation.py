@@ -0,0 +1,247 @@
+# app/core/state/hibernation.py
+"""
+HibernatingSessionStore: 활성 세션만 메모리에 두고, 유휴 세션은 압축해 디스크(cold tier)로 내린다.
+
+대부분의 세션은 턴 사이에 유휴 상태인데 InMemorySessionStore는 TransferState 객체와 raw_history를
+계속 상주시킨다. 세션 수가 늘어도 노드 메모리가 일정하도록 hot tier 크기를 제한한다.
+
+─── 계층 ───────────────────────────────────────────────────────────────────
+  hot:   OrderedDict LRU — get_or_create·save_state가 touch (맨 뒤로 이동)
+  cold:  SQLite cold(session_id, at, body) — body는 압축된 (state, memory) blob
+           blob   = codec.encode_session(state, memory)  (STATE_CODEC, 파일 생성 시 resolve_codec으로 고정)
+           압축   = zstandard(설치돼 있으면) 또는 zlib. 첫 바이트가 압축 방식.
+
+─── 동면·복원 ──────────────────────────────────────────────────────────────
+  get_or_create·save_state 호출 시(최대 SESSION_SWEEP_SEC마다 한 번) LRU 앞쪽부터
+  SESSION_IDLE_SEC 이상 유휴인 세션을 cold로 내린다. hot이 SESSION_HOT_MAX를 넘으면
+  유휴 시간과 관계없이 가장 오래된 세션부터 내린다.
+  hot에 없는 세션은 get_or_create에서 cold를 읽어 복원하고 cold 행을 지운다.
+
+─── 턴 진행 중 고정 (pin) ──────────────────────────────────────────────────
+  pin(session_id)/unpin(session_id)은 참조 카운트. 카운트가 남은 세션은 유휴·용량과 관계없이
+  동면하지 않는다 — 턴 도중(또는 백그라운드 요약 도중) 내려가면 그 사이 memory dict에 쓴 내용이
+  cold blob에 반영되지 않고 유실되기 때문. CoreOrchestrator가 턴 시작 전에 pin하고, 턴이 끝나고
+  백그라운드 요약까지 마친 뒤 unpin한다. 모두 pin된 상태면 hot은 일시적으로 SESSION_HOT_MAX를 넘는다.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.codec import decode_session, encode_session, resolve_codec
+from app.core.config import settings
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 — 없으면 zlib
+    zstandard = None
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cold (
+    session_id TEXT PRIMARY KEY,
+    at         REAL NOT NULL,
+    body       BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_ZLIB, _ZSTD = 0, 1
+
+
+def _empty_memory() -> dict:
+    return {"raw_history": [], "summary_text": ""}
+
+
+def _compress(data: bytes) -> bytes:
+    if zstandard is not None:
+        return bytes([_ZSTD]) + zstandard.ZstdCompressor(level=3).compress(data)
+    return bytes([_ZLIB]) + zlib.compress(data, 6)
+
+
+def _decompress(blob: bytes) -> bytes:
+    if blob[0] == _ZSTD:
+        if zstandard is None:
+            raise ImportError("zstandard가 설치되지 않아 cold 세션을 읽을 수 없어요 (pip install zstandard)")
+        return zstandard.ZstdDecompressor().decompress(blob[1:])
+    return zlib.decompress(blob[1:])
+
+
+class HibernatingSessionStore:
+    """
+    세션별 (state, memory) 2계층 저장소. InMemorySessionStore와 같은 인터페이스.
+
+    사용법 (manifest.py):
+        from app.core.state.hibernation import HibernatingSessionStore
+        "sessions_factory": lambda: HibernatingSessionStore(state_factory=MyState),
+
+    Args:
+        state_factory:  새 state 생성 (BaseState 하위 클래스)
+        path:           SQLite 파일 경로 (기본 SESSION_COLD_PATH, 비어있으면 LOG_DIR/sessions_cold.db)
+        idle_sec:       이 시간 이상 유휴면 동면
+        hot_max:        hot tier 최대 세션 수
+        sweep_sec:      동면 검사 최소 간격
+    """
+
+    def __init__(
+        self,
+        state_factory: Callable,
+        path: Optional[str] = None,
+        idle_sec: Optional[float] = None,
+        hot_max: Optional[int] = None,
+        sweep_sec: Optional[float] = None,
+    ):
+        self._state_factory = state_factory
+        self.path = path or settings.SESSION_COLD_PATH or os.path.join(settings.LOG_DIR, "sessions_cold.db")
+        self.idle_sec = idle_sec if idle_sec is not None else settings.SESSION_IDLE_SEC
+        self.hot_max = hot_max or settings.SESSION_HOT_MAX
+        self.sweep_sec = sweep_sec if sweep_sec is not None else settings.SESSION_SWEEP_SEC
+        self._hot: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._pins: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._last_sweep = time.monotonic()
+        self._counters = {"hits": 0, "misses": 0, "created": 0, "hibernated": 0}
+        self._rehydrate_ms: deque = deque(maxlen=512)
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.execute(
+            "INSERT OR IGNORE INTO meta (key, value) VALUES ('codec', ?)", (resolve_codec(settings.STATE_CODEC),),
+        )
+        self.codec_name = self._db.execute("SELECT value FROM meta WHERE key='codec'").fetchone()[0]
+        if self.codec_name == "binary":
+            # 내부 코덱을 기록하지 않던 파일 — 기존 blob은 state 헤더로 판별되므로 새 기록만 고정
+            self.codec_name = resolve_codec("binary")
+            self._db.execute("UPDATE meta SET value=? WHERE key='codec'", (self.codec_name,))
+
+    # ── SessionStore 인터페이스 ───────────────────────────────────────────────
+
+    def get_or_create(self, session_id: str) -> Tuple[Any, Dict[str, Any]]:
+        with self._lock:
+            s = self._hot.get(session_id)
+            if s is not None:
+                self._counters["hits"] += 1
+            else:
+                s = self._rehydrate(session_id)
+                if s is None:
+                    self._counters["created"] += 1
+                    s = {"state": self._state_factory(), "memory": _empty_memory()}
+                self._hot[session_id] = s
+            self._touch(session_id, s)
+            return s["state"], s["memory"]
+
+    def save_state(self, session_id: str, state: Any) -> None:
+        with self._lock:
+            s = self._hot.get(session_id)
+            if s is None:
+                # 턴 도중 동면된 경우 — 전달된 state를 기준으로 다시 올린다
+                s = self._rehydrate(session_id)
+                if s is None:
+                    return
+                self._hot[session_id] = s
+            s["state"] = state
+            self._touch(session_id, s)
+
+    def reset(self, session_id: str) -> None:
+        """세션 완전 초기화 (state + memory)."""
+        with self._lock:
+            self._db.execute("DELETE FROM cold WHERE session_id=?", (session_id,))
+            s = self._hot[session_id] = {"state": self._state_factory(), "memory": _empty_memory()}
+            self._touch(session_id, s)
+
+    def drop(self, session_id: str) -> None:
+        """hot tier에서만 제거 (다른 워커로 이관한 뒤 — WorkerSupervisor)."""
+        with self._lock:
+            self._hot.pop(session_id, None)
+
+    def pin(self, session_id: str) -> None:
+        """unpin 전까지 동면 대상에서 제외 (턴 진행 중)."""
+        with self._lock:
+            self._pins[session_id] = self._pins.get(session_id, 0) + 1
+
+    def unpin(self, session_id: str) -> None:
+        with self._lock:
+            count = self._pins.get(session_id, 0) - 1
+            if count > 0:
+                self._pins[session_id] = count
+            else:
+                self._pins.pop(session_id, None)
+
+    # ── 동면·복원 ─────────────────────────────────────────────────────────────
+
+    def _touch(self, session_id: str, s: Dict[str, Any]) -> None:
+        s["touched"] = time.monotonic()
+        self._hot.move_to_end(session_id)
+        if len(self._hot) > self.hot_max or s["touched"] - self._last_sweep >= self.sweep_sec:
+            self._sweep(s["touched"], keep=session_id)
+
+    def _sweep(self, now: float, keep: Optional[str] = None) -> None:
+        """LRU 앞쪽부터 유휴 세션(또는 hot_max 초과분)을 cold로 내린다. keep(방금 touch한 세션)·pin된 세션은 제외."""
+        self._last_sweep = now
+        victims = []
+        for session_id, s in self._hot.items():
+            if session_id == keep:
+                break
+            if session_id in self._pins:
+                continue
+            over_capacity = len(self._hot) - len(victims) > self.hot_max
+            if not over_capacity and now - s["touched"] < self.idle_sec:
+                break
+            victims.append((session_id, s))
+        if not victims:
+            return
+        rows = [(sid, time.time(), self._pack(s)) for sid, s in victims]
+        self._db.execute("BEGIN")
+        self._db.executemany("INSERT OR REPLACE INTO cold (session_id, at, body) VALUES (?, ?, ?)", rows)
+        self._db.execute("COMMIT")
+        for sid, _ in victims:
+            del self._hot[sid]
+        self._counters["hibernated"] += len(victims)
+
+    def hibernate_idle(self) -> int:
+        """유휴 세션을 즉시 동면시키고 동면한 수를 반환 (운영·테스트용)."""
+        with self._lock:
+            before = self._counters["hibernated"]
+            self._sweep(time.monotonic())
+            return self._counters["hibernated"] - before
+
+    def _pack(self, s: Dict[str, Any]) -> bytes:
+        return _compress(encode_session(s["state"], s["memory"], self.codec_name))
+
+    def _rehydrate(self, session_id: str) -> Optional[Dict[str, Any]]:
+        started = time.perf_counter()
+        row = self._db.execute("SELECT body FROM cold WHERE session_id=?", (session_id,)).fetchone()
+        if row is None:
+            return None
+        state, memory = decode_session(_decompress(row[0]), self._state_factory, self.codec_name)
+        s = {"state": state, "memory": memory}
+        self._db.execute("DELETE FROM cold WHERE session_id=?", (session_id,))
+        self._counters["misses"] += 1
+        self._rehydrate_ms.append((time.perf_counter() - started) * 1000)
+        return s
+
+    # ── 메트릭 ───────────────────────────────────────────────────────────────
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            cold = self._db.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM cold").fetchone()
+            latencies = sorted(self._rehydrate_ms)
+            return {
+                **self._counters,
+                "hot": len(self._hot),
+                "pinned": len(self._pins),
+                "cold": cold[0],
+                "cold_bytes": cold[1],
+                "rehydrate_ms_avg": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+                "rehydrate_ms_p95": round(latencies[int(len(latencies) * 0.95)], 3) if latencies else 0.0,
+            }
@@ -0,0 +1,415 @@
+# app/core/state/shared_cache.py
+"""
+공유 메모리 세션 캐시: 같은 노드의 여러 워커 프로세스가 하나의 mmap 해시 테이블로 세션을 공유한다.
+
+uvicorn --workers N으로 띄우면 프로세스마다 InMemorySessionStore가 따로 생겨, 로드밸런서가
+같은 세션을 다른 워커로 보내면 state가 사라진다. 외부 저장소 없이 노드 내 모든 코어를 쓰도록
+세션 blob(codec.encode_session)을 공유 mmap 파일에 둔다.
+
+─── 파일 레이아웃 ──────────────────────────────────────────────────────────
+  header(64)  MAGIC | slots | slot_bytes | codec(16) | evicted(8) | oversize(8)
+                codec: 파일을 만든 워커가 resolve_codec으로 고정한 세션 blob 코덱 ("binary:msgpack" 등).
+                이후 여는 워커는 자기 설정·설치 상태와 무관하게 이 코덱으로 읽고 쓴다.
+                evicted·oversize: 노드 전체(모든 워커) 누적 횟수 — health()로 노출.
+  slot × N    seq(8) | flag(4) | length(4) | written_at(8) | key digest(16) | data(slot_bytes - 40)
+                flag: 0 빈 슬롯, 1 사용 중, 2 삭제됨(tombstone)
+  키는 session_id의 blake2b-128 digest. 위치는 digest % N부터 선형 탐사(PROBE_MAX칸).
+
+─── 동시성 ─────────────────────────────────────────────────────────────────
+  읽기:  슬롯별 seqlock — seq(짝수) 읽기 → 데이터를 mmap memoryview 그대로 디코딩(복사 없음)
+         → seq 재확인. 도중에 바뀌었거나 홀수(쓰는 중)면 재시도. 락을 잡지 않는다.
+  쓰기:  파일 전체 writer 락(fcntl, 프로세스 간) + 스레드 락 아래에서
+         seq를 홀수로 → 헤더·데이터 기록 → seq를 짝수로. 한 턴에 쓰기는 몇 번뿐이라 직렬화해도 충분.
+  x86-64(TSO)의 store 순서 보장을 전제로 한다.
+
+─── 용량 (overflow) ────────────────────────────────────────────────────────
+  슬롯에 두지 못한 세션은 SessionOverflow(노드 로컬 SQLite, SESSION_SHM_OVERFLOW_PATH)로 보낸다.
+  어느 워커에서든 계속 읽을 수 있고, 조용히 사라지지 않는다.
+    - blob이 슬롯보다 크면 슬롯을 지우고(옛 값을 읽지 않도록) overflow에 기록
+    - 탐사 구간에 빈 슬롯이 없으면 가장 오래 전에 쓴 슬롯을 덮어쓰기 전에 그 blob을 overflow로 옮긴다
+  읽기는 슬롯이 우선, 없으면 overflow. 세션이 다시 슬롯에 기록되면(reset 포함) overflow 행을 지운다.
+  overflow에 세션이 있으면 health()가 "degraded" —
+  SESSION_SHM_SLOTS·SESSION_SHM_SLOT_BYTES를 동시 활성 세션·배치 크기에 맞춰 늘린다.
+"""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.codec import decode_session, encode_session, resolve_codec
+from app.core.config import settings
+
+_MAGIC = b"SESSHM02"
+_FILE_HEADER = struct.Struct("<8sII16s")
+_SHARED_COUNTERS = struct.Struct("<QQ")    # evicted, oversize — _FILE_HEADER 바로 뒤
+_FILE_HEADER_SIZE = 64
+_SLOT = struct.Struct("<QIId16s")     # seq, flag, length, written_at, digest
+_EMPTY, _USED, _DELETED = 0, 1, 2
+PROBE_MAX = 16
+_READ_RETRY = 100
+
+# fcntl 레코드 락은 프로세스 단위 — 같은 프로세스의 여러 인스턴스는 경로별 스레드 락으로 직렬화
+_THREAD_LOCKS: Dict[str, threading.Lock] = {}
+_THREAD_LOCKS_GUARD = threading.Lock()
+
+
+def _digest(key: str) -> bytes:
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+def _default_path() -> str:
+    if os.path.isdir("/dev/shm"):
+        return f"/dev/shm/{settings.APP_NAME}-sessions"
+    return os.path.join(settings.LOG_DIR, "sessions.shm")
+
+
+class SharedSessionCache:
+    """
+    mmap 해시 테이블. 값은 bytes, 읽기는 decode 콜백에 memoryview를 넘긴다.
+
+    Args:
+        path:        공유 파일 경로 (기본 SESSION_SHM_PATH → /dev/shm/{APP_NAME}-sessions)
+        slots:       슬롯 수
+        slot_bytes:  슬롯 크기 (헤더 40바이트 포함)
+        codec:       파일을 새로 만들 때 기록할 코덱 (기본 STATE_CODEC). 기존 파일은 기록된 코덱을 따른다.
+
+    on_evict(digest, blob)가 설정돼 있으면 eviction으로 덮어쓰기 직전의 blob을 넘긴다 (writer 락 안).
+    """
+
+    def __init__(self, path: Optional[str] = None, slots: Optional[int] = None, slot_bytes: Optional[int] = None,
+                 codec: Optional[str] = None):
+        self.path = path or settings.SESSION_SHM_PATH or _default_path()
+        self.slots = slots or settings.SESSION_SHM_SLOTS
+        self.slot_bytes = slot_bytes or settings.SESSION_SHM_SLOT_BYTES
+        self.max_value = self.slot_bytes - _SLOT.size
+        with _THREAD_LOCKS_GUARD:
+            self._thread_lock = _THREAD_LOCKS.setdefault(os.path.abspath(self.path), threading.Lock())
+        self.counters = {"reads": 0, "writes": 0, "read_retries": 0, "evicted": 0, "oversize": 0}
+        self.on_evict: Optional[Callable[[bytes, bytes], None]] = None
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        size = _FILE_HEADER_SIZE + self.slots * self.slot_bytes
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size == 0:
+                os.ftruncate(self._fd, size)          # sparse — 쓴 페이지만 실제 메모리 사용
+                codec_name = resolve_codec(codec or settings.STATE_CODEC).encode("ascii")
+                os.pwrite(self._fd, _FILE_HEADER.pack(_MAGIC, self.slots, self.slot_bytes, codec_name), 0)
+            magic, slots, slot_bytes, codec_name = _FILE_HEADER.unpack(os.pread(self._fd, _FILE_HEADER.size, 0))
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        if (magic, slots, slot_bytes) != (_MAGIC, self.slots, self.slot_bytes):
+            raise ValueError(
+                f"shared session cache {self.path} has layout {slots}×{slot_bytes}, "
+                f"expected {self.slots}×{self.slot_bytes} (delete the file or match settings)"
+            )
+        self.codec_name = codec_name.rstrip(b"\0").decode("ascii")
+        self._mm = mmap.mmap(self._fd, size)
+        self._view = memoryview(self._mm)
+
+    def _offset(self, index: int) -> int:
+        return _FILE_HEADER_SIZE + index * self.slot_bytes
+
+    def _probe(self, digest: bytes):
+        start = int.from_bytes(digest[:8], "little") % self.slots
+        for i in range(min(PROBE_MAX, self.slots)):
+            yield (start + i) % self.slots
+
+    # ── 읽기 (seqlock) ───────────────────────────────────────────────────────
+
+    def read(self, key: str, decode: Callable[[memoryview], Any]) -> Optional[Tuple[Any, Tuple[int, int]]]:
+        """
+        key의 값을 decode(memoryview)로 읽는다.
+
+        Returns:
+            (decode 결과, version) 또는 None. version = (슬롯 번호, seq) — 변경 감지용.
+        """
+        digest = _digest(key)
+        self.counters["reads"] += 1
+        for index in self._probe(digest):
+            off = self._offset(index)
+            for _ in range(_READ_RETRY):
+                seq, flag, length, _, slot_digest = _SLOT.unpack_from(self._mm, off)
+                if seq & 1:
+                    self.counters["read_retries"] += 1
+                    continue
+                if flag == _EMPTY:
+                    return None
+                if flag != _USED or slot_digest != digest:
+                    if _SLOT.unpack_from(self._mm, off)[0] == seq:
+                        break   # 다른 키 — 다음 슬롯
+                    continue
+                data = self._view[off + _SLOT.size:off + _SLOT.size + length]
+                try:
+                    value = decode(data)
+                except Exception:
+                    value = _TORN
+                finally:
+                    data.release()
+                if _SLOT.unpack_from(self._mm, off)[0] == seq and value is not _TORN:
+                    return value, (index, seq)
+                self.counters["read_retries"] += 1
+            else:
+                return None
+        return None
+
+    def version(self, key: str) -> Optional[Tuple[int, int]]:
+        """디코딩 없이 현재 version만 조회 (로컬 사본이 최신인지 확인용)."""
+        result = self.read(key, lambda data: None)
+        return result[1] if result else None
+
+    # ── 쓰기 ─────────────────────────────────────────────────────────────────
+
+    def write(self, key: str, value: bytes) -> Optional[Tuple[int, int]]:
+        """값을 기록하고 새 version을 반환. 슬롯보다 크면 기존 값을 지우고 None."""
+        digest = _digest(key)
+        with self._thread_lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, 0)
+            try:
+                index = self._find_slot(digest)
+                if len(value) > self.max_value:
+                    self._count("oversize")
+                    if index is not None and self._slot(index)[1] == _USED and self._slot(index)[4] == digest:
+                        self._store(index, _DELETED, digest, b"")
+                    return None
+                if index is None:
+                    index = min(self._probe(digest), key=lambda i: self._slot(i)[3])
+                    _, _, length, _, victim = self._slot(index)
+                    if self.on_evict is not None:
+                        off = self._offset(index) + _SLOT.size
+                        self.on_evict(victim, bytes(self._mm[off:off + length]))
+                    self._count("evicted")
+                self.counters["writes"] += 1
+                return index, self._store(index, _USED, digest, value)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, 0)
+
+    def delete(self, key: str) -> None:
+        digest = _digest(key)
+        with self._thread_lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, 0)
+            try:
+                index = self._find_slot(digest)
+                if index is not None and self._slot(index)[1] == _USED and self._slot(index)[4] == digest:
+                    self._store(index, _DELETED, digest, b"")
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, 0)
+
+    def _count(self, name: str) -> None:
+        """(writer 락 안에서) 프로세스 카운터와 파일 헤더의 노드 전체 카운터를 함께 올린다."""
+        self.counters[name] += 1
+        evicted, oversize = _SHARED_COUNTERS.unpack_from(self._mm, _FILE_HEADER.size)
+        if name == "evicted":
+            evicted += 1
+        else:
+            oversize += 1
+        _SHARED_COUNTERS.pack_into(self._mm, _FILE_HEADER.size, evicted, oversize)
+
+    def shared_counters(self) -> Dict[str, int]:
+        """모든 워커의 누적 eviction·용량 초과 횟수."""
+        evicted, oversize = _SHARED_COUNTERS.unpack_from(self._mm, _FILE_HEADER.size)
+        return {"evicted_total": evicted, "oversize_total": oversize}
+
+    def _slot(self, index: int) -> tuple:
+        return _SLOT.unpack_from(self._mm, self._offset(index))
+
+    def _find_slot(self, digest: bytes) -> Optional[int]:
+        """(writer 락 안에서) 같은 키 슬롯, 없으면 첫 빈 슬롯/tombstone. 탐사 구간이 꽉 차면 None."""
+        free = None
+        for index in self._probe(digest):
+            _, flag, _, _, slot_digest = self._slot(index)
+            if flag == _USED and slot_digest == digest:
+                return index
+            if flag == _DELETED and free is None:
+                free = index
+            if flag == _EMPTY:
+                return free if free is not None else index
+        return free
+
+    def _store(self, index: int, flag: int, digest: bytes, value: bytes) -> int:
+        off = self._offset(index)
+        seq = _SLOT.unpack_from(self._mm, off)[0]
+        struct.pack_into("<Q", self._mm, off, seq + 1)                       # 쓰는 중 (홀수)
+        self._mm[off + _SLOT.size:off + _SLOT.size + len(value)] = value
+        _SLOT.pack_into(self._mm, off, seq + 1, flag, len(value), time.time(), digest)
+        struct.pack_into("<Q", self._mm, off, seq + 2)                       # 완료 (짝수)
+        return seq + 2
+
+    def close(self) -> None:
+        self._view.release()
+        self._mm.close()
+        os.close(self._fd)
+
+
+_TORN = object()
+
+_OVERFLOW_SCHEMA = """
+CREATE TABLE IF NOT EXISTS overflow (
+    rev    INTEGER PRIMARY KEY AUTOINCREMENT,
+    digest BLOB    NOT NULL UNIQUE,
+    body   BLOB    NOT NULL
+);
+"""
+
+
+class SessionOverflow:
+    """
+    공유 슬롯에 두지 못한 세션 blob(용량 초과·eviction)을 보관하는 노드 로컬 SQLite.
+
+    키는 SharedSessionCache와 같은 digest. rev(AUTOINCREMENT — 재사용 없음)가 version 역할을 한다.
+    여러 워커 프로세스가 같은 파일을 연다 (SQLite 파일 락).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or settings.SESSION_SHM_OVERFLOW_PATH or os.path.join(settings.LOG_DIR, "sessions_overflow.db")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_OVERFLOW_SCHEMA)
+        self._lock = threading.Lock()
+
+    def put(self, digest: bytes, body: bytes) -> int:
+        """기록하고 새 rev를 반환."""
+        with self._lock:
+            return self._db.execute(
+                "INSERT OR REPLACE INTO overflow (digest, body) VALUES (?, ?)", (digest, body),
+            ).lastrowid
+
+    def get(self, digest: bytes) -> Optional[Tuple[bytes, int]]:
+        with self._lock:
+            row = self._db.execute("SELECT body, rev FROM overflow WHERE digest=?", (digest,)).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def rev(self, digest: bytes) -> Optional[int]:
+        with self._lock:
+            row = self._db.execute("SELECT rev FROM overflow WHERE digest=?", (digest,)).fetchone()
+        return row[0] if row else None
+
+    def delete(self, digest: bytes, rev: int) -> None:
+        """rev가 그대로일 때만 지운다 — 그 사이 다른 워커가 다시 옮겨 둔 blob은 남긴다."""
+        with self._lock:
+            self._db.execute("DELETE FROM overflow WHERE digest=? AND rev=?", (digest, rev))
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM overflow").fetchone()[0]
+
+
+class SharedMemorySessionStore:
+    """
+    SharedSessionCache 위의 세션 저장소. InMemorySessionStore와 같은 인터페이스.
+
+    프로세스마다 마지막으로 읽거나 쓴 (state, memory) 객체를 version과 함께 들고 있다가,
+    get_or_create에서 공유 슬롯 version이 같으면 그대로 반환하고(디코딩 없음) 다르면
+    — 다른 워커가 썼으면 — 공유 blob을 디코딩한다. save_state는 state와 그 세션의
+    memory를 함께 공유 슬롯에 쓴다. 슬롯에 없으면 overflow를 본다 (version = ("overflow", rev)).
+    overflow 기록이 실패하면 예외를 그대로 올린다 — 세션을 조용히 로컬에만 두지 않는다.
+
+    사용법 (manifest.py):
+        from app.core.state.shared_cache import SharedMemorySessionStore
+        "sessions_factory": lambda: SharedMemorySessionStore(state_factory=MyState),
+    """
+
+    def __init__(self, state_factory: Callable, cache: Optional[SharedSessionCache] = None,
+                 local_max: Optional[int] = None, overflow: Optional[SessionOverflow] = None):
+        self._state_factory = state_factory
+        self.cache = cache or SharedSessionCache()
+        self.overflow = overflow or SessionOverflow()
+        self.cache.on_evict = self.overflow.put
+        self.codec_name = self.cache.codec_name
+        self._local: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._local_max = local_max or settings.SESSION_HOT_MAX
+        self._lock = threading.RLock()
+        self._counters = {"local_hits": 0, "shared_hits": 0, "overflow_hits": 0, "created": 0}
+
+    def _decode(self, data: memoryview) -> Tuple[Any, Dict[str, Any]]:
+        return decode_session(data, self._state_factory, self.codec_name)
+
+    def _remember(self, session_id: str, entry: Dict[str, Any]) -> None:
+        self._local[session_id] = entry
+        self._local.move_to_end(session_id)
+        while len(self._local) > self._local_max:
+            self._local.popitem(last=False)
+
+    def _version(self, session_id: str) -> Optional[tuple]:
+        version = self.cache.version(session_id)
+        if version is None:
+            rev = self.overflow.rev(_digest(session_id))
+            version = ("overflow", rev) if rev is not None else None
+        return version
+
+    def _write(self, session_id: str, state: Any, memory: Dict[str, Any]) -> tuple:
+        blob = encode_session(state, memory, self.codec_name)
+        digest = _digest(session_id)
+        spilled_rev = self.overflow.rev(digest)
+        version = self.cache.write(session_id, blob)
+        if version is None:   # 슬롯보다 큼
+            version = ("overflow", self.overflow.put(digest, blob))
+        elif spilled_rev is not None:
+            # 슬롯으로 돌아왔으면 옛 overflow 행은 필요 없다 (health가 계속 degraded로 남지 않게)
+            self.overflow.delete(digest, spilled_rev)
+        return version
+
+    def get_or_create(self, session_id: str) -> Tuple[Any, Dict[str, Any]]:
+        with self._lock:
+            local = self._local.get(session_id)
+            if local is not None and local["version"] == self._version(session_id):
+                self._counters["local_hits"] += 1
+                self._local.move_to_end(session_id)
+                return local["state"], local["memory"]
+            found = self.cache.read(session_id, self._decode)
+            spilled = None if found is not None else self.overflow.get(_digest(session_id))
+            if found is not None:
+                (state, memory), version = found
+                self._counters["shared_hits"] += 1
+            elif spilled is not None:
+                (state, memory), version = self._decode(spilled[0]), ("overflow", spilled[1])
+                self._counters["overflow_hits"] += 1
+            else:
+                state, memory, version = self._state_factory(), {"raw_history": [], "summary_text": ""}, None
+                self._counters["created"] += 1
+            self._remember(session_id, {"state": state, "memory": memory, "version": version})
+            return state, memory
+
+    def save_state(self, session_id: str, state: Any) -> None:
+        with self._lock:
+            local = self._local.get(session_id)
+            if local is None:
+                return
+            version = self._write(session_id, state, local["memory"])
+            self._remember(session_id, {"state": state, "memory": local["memory"], "version": version})
+
+    def reset(self, session_id: str) -> None:
+        """세션 완전 초기화 (state + memory)."""
+        with self._lock:
+            memory = {"raw_history": [], "summary_text": ""}
+            state = self._state_factory()
+            version = self._write(session_id, state, memory)
+            self._remember(session_id, {"state": state, "memory": memory, "version": version})
+
+    def drop(self, session_id: str) -> None:
+        """로컬 사본만 버린다 (공유 슬롯은 유지 — 다른 워커가 그대로 읽음)."""
+        with self._lock:
+            self._local.pop(session_id, None)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._counters, **self.cache.counters, "local": len(self._local), "health": self.health()}
+
+    def health(self) -> Dict[str, Any]:
+        """노드 전체 eviction·용량 초과 누적과 overflow 세션 수. overflow가 비어있지 않으면 degraded."""
+        overflow = self.overflow.count()
+        return {
+            "status": "degraded" if overflow else "ok",
+            **self.cache.shared_counters(),
+            "overflow_sessions": overflow,
+        }
@@ -51,10 +51,15 @@ class InMemorySessionStore:
             "memory": _empty_memory(),
         }
 
+    def drop(self, session_id: str) -> None:
+        """세션을 이 프로세스에서 제거 (다른 워커로 이관한 뒤 — WorkerSupervisor)."""
+        self._store.pop(session_id, None)
+
 
 class InMemoryCompletedStore:
     """
     완료된 작업 이력 인메모리 저장소. 분석·디버그·히스토리 조회용.
+    state는 add 시점의 model_dump() 사본으로 보관한다 — 프로세스 안에만 있으므로 코덱을 거치지 않는다.
 
     사용법 (manifest.py):
         from app.core.state.stores import InMemoryCompletedStore
@@ -82,4 +87,20 @@ class InMemoryCompletedStore:
             self._store[session_id] = self._store[session_id][-self._max:]
 
     def list_for_session(self, session_id: str) -> List[Dict[str, Any]]:
-        return list(reversed(self._store.get(session_id, [])))
+        return [
+            {
+                "at": row["at"],
+                "state": row["state"],
+                "summary_text": row["summary_text"],
+            }
+            for row in reversed(self._store.get(session_id, []))
+        ]
+
+    def drop(self, session_id: str) -> List[Dict[str, Any]]:
+        """세션 이력을 제거하고 원본 행을 반환 (워커 이관용 — restore와 짝)."""
+        return self._store.pop(session_id, [])
+
+    def restore(self, session_id: str, rows: List[Dict[str, Any]]) -> None:
+        """drop으로 꺼낸 행을 이어 붙인다."""
+        merged = self._store.get(session_id, []) + rows
+        self._store[session_id] = merged[-self._max:]
@@ -13,11 +13,11 @@ Orchestrator가 턴 시작 시 생성하고, DONE payload에 summary()를 삽입
 """
 
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from uuid import uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentRecord:
     """단일 에이전트 실행 기록."""
 
@@ -26,11 +26,14 @@ class AgentRecord:
     success: bool
     retries: int = 0
     error: str | None = None
+    tier: str | None = None     # cascade 정책 사용 시 결과를 낸 tier 모델명
 
 
 class TurnTracer:
     """턴 시작 시 생성. AgentRunner가 자동으로 record() 호출."""
 
+    __slots__ = ("session_id", "turn_id", "_started", "_records")
+
     def __init__(self, session_id: str):
         self.session_id = session_id
         self.turn_id = uuid4().hex[:8]
@@ -60,6 +63,7 @@ class TurnTracer:
                     "success": r.success,
                     "retries": r.retries,
                     "error": r.error,
+                    "tier": r.tier,
                 }
                 for r in self._records
             ],
@@ -2,13 +2,18 @@
 from fastapi import FastAPI
 
 from app.core.config import settings
-from app.core.orchestration import CoreOrchestrator
+from app.core.orchestration import CoreOrchestrator, WorkerSupervisor
 from app.core.api import create_agent_router
 from app.projects.transfer.manifest import load_manifest
+from app.projects.transfer.api import create_batch_router
 
 # ── 현재: 단일 서비스 ──────────────────────────────────────────────────────────
-manifest = load_manifest()
-orchestrator = CoreOrchestrator(manifest)
+# SUPERVISOR_WORKERS > 0 이면 워커 프로세스 N개에 session_id 기준으로 분배 (manifest는 워커에서 조립)
+if settings.SUPERVISOR_WORKERS > 0:
+    orchestrator = WorkerSupervisor("app.projects.transfer.manifest:load_manifest")
+else:
+    manifest = load_manifest()
+    orchestrator = CoreOrchestrator(manifest)
 
 # ── 멀티 서비스로 확장 시 아래 패턴으로 교체 (main 코드 외 변경 없음) ──────────
 #
@@ -36,3 +41,4 @@ agent_router = create_agent_router(orchestrator)
 
 app = FastAPI(title=settings.APP_NAME)
 app.include_router(agent_router)
+app.include_router(create_batch_router(orchestrator))
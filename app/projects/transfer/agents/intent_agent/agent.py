@@ -1,23 +1,104 @@
 # app/projects/transfer/agents/intent_agent/agent.py
+"""
+IntentAgent: 사용자 발화 → 시나리오(TRANSFER | GENERAL) 분류.
+
+─── 로컬 사전 분류기 (card.json "local_classifier") ────────────────────────
+  LLM 호출 전에 문자 n-gram 선형 모델(LocalTextClassifier)로 먼저 분류한다.
+    확률 ≥ threshold → LLM 없이 바로 반환 (reason="local:0.97")
+    확률 <  threshold → LLM으로 escalate
+
+  설정:
+    model_path: 가중치 파일 (.npz). 이 디렉터리 기준 상대 경로. 파일이 없으면 비활성.
+    threshold:  로컬 결과를 채택할 최소 확률 (기본 0.9)
+    shadow:     true면 로컬 결과를 사용하지 않고 항상 LLM 호출 — 로그로 일치율만 평가.
+                일치율은 턴 로그로만 알 수 있으므로 log_path가 비어있으면 DEFAULT_TURN_LOG에 기록한다.
+    log_path:   LLM 분류 턴 기록 JSONL (settings.LOG_DIR 기준). 재학습 데이터로 사용.
+                python -m app.projects.transfer.agents.intent_agent.train_local 로 학습.
+                사용자 발화 원문이 그대로 남으므로(개인정보) shadow가 아니면 기본은 비활성("").
+                데이터 수집·shadow 평가 기간에만 켠다.
+                턴당 한 줄 — hedge로 같은 턴을 두 번 실행해도 먼저 끝난 쪽만 기록한다.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
 from app.core.agents.base_agent import BaseAgent
 from app.core.agents.agent_runner import RetryableError
+from app.core.config import settings
 from app.core.context import ExecutionContext
 from app.projects.transfer.agents.intent_agent.prompt import get_system_prompt
 
+AGENT_DIR = Path(__file__).resolve().parent
+DEFAULT_TURN_LOG = "intent_turns.jsonl"   # shadow 모드 기본 턴 로그 (train_local 기본 입력과 같은 파일)
+
 
 class IntentAgent(BaseAgent):
     # 이 프로젝트에서 분류 가능한 시나리오 목록
     # 새 서비스 추가 시: 여기에 값 추가 + prompt.py 분류 기준 추가 + SCENARIO_TO_FLOW 등록
     KNOWN_SCENARIOS = {"TRANSFER", "GENERAL"}
 
+    def __init__(self, *, local_classifier: Optional[Dict[str, Any]] = None, **kwargs):
+        super().__init__(**kwargs)
+        cfg = local_classifier or {}
+        self.local_threshold = cfg.get("threshold", 0.9)
+        self.local_shadow = cfg.get("shadow", False)
+        self.local_model = self._load_local_model(cfg.get("model_path"))
+        log_path = cfg.get("log_path") or (DEFAULT_TURN_LOG if self.local_shadow else "")
+        self._turn_log = os.path.join(settings.LOG_DIR, log_path) if log_path else None
+        self._log_lock = threading.Lock()
+
     @classmethod
     def get_system_prompt(cls) -> str:
         return get_system_prompt()
 
+    def _load_local_model(self, model_path: Optional[str]):
+        if not model_path:
+            return None
+        path = AGENT_DIR / model_path
+        if not path.exists():
+            self.logger.info(f"[IntentAgent] local classifier not found ({path.name}) — LLM only")
+            return None
+        from app.core.local_classifier import LocalTextClassifier
+        return LocalTextClassifier.load(path)
+
+    def _classify_local(self, text: str) -> Optional[Tuple[str, float]]:
+        if self.local_model is None:
+            return None
+        label, prob = self.local_model.predict(text)
+        return (label, prob) if label in self.KNOWN_SCENARIOS else None
+
+    def _log_turn(self, context: ExecutionContext, llm_scenario: str, local: Optional[Tuple[str, float]]) -> None:
+        """LLM 분류 결과와 로컬 예측을 JSONL로 남긴다 (shadow 평가 + 재학습 데이터). 턴당 한 번."""
+        if not self._turn_log:
+            return
+        with self._log_lock:
+            if context.metadata.get("intent_turn_logged"):
+                return
+            context.metadata["intent_turn_logged"] = True
+        row = {
+            "text": context.user_message,
+            "label": llm_scenario,
+            "local": local[0] if local else None,
+            "local_prob": round(local[1], 4) if local else None,
+        }
+        try:
+            with self._log_lock, open(self._turn_log, "a", encoding="utf-8") as f:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        except OSError as e:
+            self.logger.warning(f"[IntentAgent] turn log write failed: {e}")
+
     def run(self, context: ExecutionContext, **kwargs) -> dict:
+        local = self._classify_local(context.user_message)
+        if local and not self.local_shadow and local[1] >= self.local_threshold:
+            return {"scenario": local[0], "reason": f"local:{local[1]:.2f}"}
+
         context_block = f"현재 이체 stage: {context.state.stage}"
         messages = context.build_messages(context_block)
         raw = self.chat(messages).strip().upper()
         if raw not in self.KNOWN_SCENARIOS:
             raise RetryableError(f"unknown_scenario: {raw}")
+        self._log_turn(context, raw, local)
         return {"scenario": raw, "reason": None}
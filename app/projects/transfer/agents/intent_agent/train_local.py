@@ -0,0 +1,53 @@
+# app/projects/transfer/agents/intent_agent/train_local.py
+"""
+IntentAgent 로컬 분류기 학습.
+
+IntentAgent가 남긴 턴 로그(JSONL: {"text", "label", "local", "local_prob"} — card.json
+local_classifier.log_path를 설정해야 기록된다)의
+LLM 라벨로 LocalTextClassifier를 학습해 card.json의 model_path에 저장한다.
+
+사용법:
+    python -m app.projects.transfer.agents.intent_agent.train_local [log.jsonl] [--out model.npz]
+
+로그에 local 예측이 함께 있으면(shadow 모드) LLM 대비 일치율도 출력한다.
+"""
+
+import argparse
+import json
+import os
+
+from app.core.config import settings
+from app.core.local_classifier import LocalTextClassifier
+from app.projects.transfer.agents.intent_agent.agent import AGENT_DIR, DEFAULT_TURN_LOG
+
+
+def _load_rows(path: str):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main() -> None:
+    card = json.loads((AGENT_DIR / "card.json").read_text(encoding="utf-8"))
+    cfg = card.get("local_classifier", {})
+
+    parser = argparse.ArgumentParser(description="IntentAgent 로컬 분류기 학습")
+    parser.add_argument("log", nargs="?", default=os.path.join(settings.LOG_DIR, cfg.get("log_path") or DEFAULT_TURN_LOG))
+    parser.add_argument("--out", default=str(AGENT_DIR / cfg.get("model_path", "local_model.npz")))
+    args = parser.parse_args()
+
+    rows = _load_rows(args.log)
+    texts = [r["text"] for r in rows]
+    labels = [r["label"] for r in rows]
+
+    shadow = [r for r in rows if r.get("local")]
+    if shadow:
+        agree = sum(r["local"] == r["label"] for r in shadow)
+        print(f"shadow agreement: {agree}/{len(shadow)} ({agree / len(shadow):.1%})")
+
+    model = LocalTextClassifier.train(texts, labels)
+    model.save(args.out)
+    print(f"trained on {len(rows)} turns, labels={model.labels} → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,8 @@
 """
 TransferExecuteAgent: 이체 실행 에이전트.
 
-실제 은행 API·결제 시스템 연동 지점.
-현재 구현은 Mock — 실서비스 연동 시 run() 내부의 mock 코드를 교체한다.
+실제 은행 API·결제 시스템 연동 지점. run()은 bank_api 클라이언트를 호출하고 그 오류를
+AgentRunner 재시도 정책의 예외로 바꾸기만 한다 — 연동 교체는 이 파일이 아니라 bank_api.py에서 한다.
 
 ─── 오류 분류 ────────────────────────────────────────────────────────────────
   RetryableError:     네트워크 타임아웃, 서비스 일시 장애 등 재시도 가능한 오류.
@@ -12,15 +12,19 @@ TransferExecuteAgent: 이체 실행 에이전트.
                       즉시 실패 처리 (FAILED 단계로 전이).
 
 ─── 연동 교체 방법 ───────────────────────────────────────────────────────────
-  1. run() 내부의 mock 코드를 실제 API 호출로 교체
-  2. 타임아웃/네트워크 오류 → RetryableError raise
-  3. 비즈니스 오류(한도 초과, 계좌 없음 등) → FatalExecutionError raise
-  4. 성공 시 {"success": True, "transaction_id": "실제 트랜잭션 ID"} 반환
+  은행 API 호출은 bank_api.get_bank_api()로 얻은 클라이언트에 위임한다 (기본: MockBankAPI).
+  실연동 시 bank_api.py에 구현을 추가해 set_bank_api()로 주입한다.
+    BankTimeoutError → RetryableError, 그 외 BankAPIError → FatalExecutionError
+
+─── idempotency_key ──────────────────────────────────────────────────────────
+  kwargs["idempotency_key"]를 은행 API에 그대로 전달한다. AgentRunner 재시도·백그라운드
+  재접수로 같은 이체가 다시 호출돼도 은행 측에서 한 번만 처리된다.
 """
 
 from app.core.agents.base_agent import BaseAgent
 from app.core.agents.agent_runner import RetryableError, FatalExecutionError
 from app.core.context import ExecutionContext
+from app.projects.transfer.bank_api import BankAPIError, BankTimeoutError, get_bank_api
 from app.projects.transfer.agents.transfer_execute_agent.prompt import get_system_prompt
 
 
@@ -29,7 +33,7 @@ class TransferExecuteAgent(BaseAgent):
     이체를 실제 실행하는 에이전트.
 
     LLM을 호출하지 않는다 (system_prompt는 미래 확장 또는 실패 메시지 생성용).
-    state.slots에서 target·amount를 읽어 API를 호출한다.
+    state.slots에서 target·amount를 읽어 은행 API를 호출한다.
     """
 
     @classmethod
@@ -47,15 +51,17 @@ class TransferExecuteAgent(BaseAgent):
             RetryableError:      재시도 가능한 오류 (타임아웃, 서비스 일시 장애)
             FatalExecutionError: 재시도 불가 오류 (계좌 오류, 한도 초과 등)
         """
-        state = context.state
+        slots = context.state.slots
         try:
-            # ── TODO: 실제 은행 API 연동으로 교체 ──────────────────────────
-            # 현재는 slots 접근 성공 여부만 확인하는 Mock 구현
-            _ = state.slots.target
-            _ = state.slots.amount
-            return {"success": True, "transaction_id": "mock-tx-001"}
-            # ────────────────────────────────────────────────────────────────
-        except Exception as e:
-            if "timeout" in str(e).lower() or "unavailable" in str(e).lower():
-                raise RetryableError(str(e))
+            result = get_bank_api().transfer(
+                target=slots.target,
+                amount=slots.amount,
+                memo=slots.memo,
+                transfer_date=slots.transfer_date,
+                idempotency_key=kwargs.get("idempotency_key"),
+            )
+        except BankTimeoutError as e:
+            raise RetryableError(str(e))
+        except BankAPIError as e:
             raise FatalExecutionError(str(e))
+        return {"success": True, **result}
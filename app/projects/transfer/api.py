@@ -0,0 +1,81 @@
+# app/projects/transfer/api.py
+"""
+이체 서비스 전용 API. create_agent_router()와 같은 /v1/agent prefix로 main.py에서 함께 등록한다.
+
+    - POST /v1/agent/batch/upload?session_id=... : CSV/TSV 본문 → 배치 이체 적재 (LLM 없음)
+    - GET  /v1/agent/slot-rules                  : 규칙 기반 슬롯 추출 적중률 (이 프로세스 기준 —
+                                                   WorkerSupervisor면 /llm 메트릭처럼 워커별로 따로 쌓인다)
+
+파싱·세션 적재는 동기 작업이라(수천 행, WorkerSupervisor면 소켓 I/O) 스레드풀에서 실행해
+이벤트 루프(다른 SSE 스트림)를 막지 않는다.
+"""
+
+import time
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.projects.transfer.batch_upload import (
+    BatchUploadParser,
+    BatchUploadTooLarge,
+    load_batch_into_state,
+    ready_message,
+)
+from app.projects.transfer.logic import slot_rule_stats
+
+
+def _load_batch(orchestrator: Any, session_id: str, tasks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """세션에 배치를 적재 — call_in_session으로 세션 소유 프로세스에서 실행."""
+    state = load_batch_into_state(tasks)
+    message = ready_message(state)
+    _, memory = orchestrator.sessions.get_or_create(session_id)
+    memory.setdefault("raw_history", []).append({"role": "assistant", "content": message})
+    orchestrator.sessions.save_state(session_id, state)
+    return {"message": message, "state_snapshot": state.model_dump()}
+
+
+def create_batch_router(orchestrator: Any) -> APIRouter:
+    router = APIRouter(prefix="/v1/agent", tags=["transfer"])
+
+    @router.post("/batch/upload")
+    async def batch_upload(request: Request, session_id: str, encoding: str = "utf-8-sig"):
+        """
+        요청 본문(text/csv 또는 text/tab-separated-values)을 스트리밍 파싱해
+        검증된 행을 세션의 새 배치로 적재한다. 기존 진행 중인 이체는 대체된다.
+
+        반환:
+          accepted / rejected  적재된 행 수 / 오류 행 수
+          errors               [{"row": 줄 번호, "errors": {slot: 메시지}}] (최대 50건)
+          rows                 적재된 전체 행 — 정규화 값 + 원문 금액(amount_text), review 표시
+                               (채팅 확인 메시지는 일부만 보여주므로 확인 전 검토용)
+          message              다음 턴 확인 안내 (valid 행이 있을 때)
+          state_snapshot       적재 후 state
+        """
+        started = time.perf_counter()
+        if int(request.headers.get("content-length") or 0) > settings.BATCH_UPLOAD_MAX_BYTES:
+            raise HTTPException(status_code=413, detail=f"body exceeds {settings.BATCH_UPLOAD_MAX_BYTES} bytes")
+        try:
+            parser = BatchUploadParser(encoding=encoding)
+        except LookupError:
+            raise HTTPException(status_code=400, detail=f"unknown encoding: {encoding}")
+        try:
+            async for chunk in request.stream():
+                await run_in_threadpool(parser.feed, chunk)
+            await run_in_threadpool(parser.close)
+        except BatchUploadTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e))
+
+        result = {"session_id": session_id, **parser.report()}
+        if parser.tasks:
+            result.update(await run_in_threadpool(orchestrator.call_in_session, session_id, _load_batch, parser.tasks))
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    @router.get("/slot-rules")
+    async def slot_rules():
+        """규칙 추출 적중률 — hit는 SlotFiller(LLM) 호출을 생략한 턴, miss는 위임한 턴."""
+        return slot_rule_stats()
+
+    return router
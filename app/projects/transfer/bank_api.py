@@ -0,0 +1,88 @@
+# app/projects/transfer/bank_api.py
+"""
+코어뱅킹 이체 API 클라이언트 인터페이스 + 로컬 대역(MockBankAPI).
+
+TransferExecuteAgent는 get_bank_api()로 얻은 클라이언트만 호출한다.
+실서비스 연동 시 BankAPI 구현을 추가하고 get_bank_api()가 그것을 반환하도록 교체한다.
+
+─── 오류 ───────────────────────────────────────────────────────────────────
+  BankTimeoutError: 타임아웃·일시 장애 (재시도 가능 → RetryableError)
+  BankAPIError:     계좌 오류·한도 초과 등 (재시도 불가 → FatalExecutionError)
+
+─── MockBankAPI ────────────────────────────────────────────────────────────
+  BANK_API_LATENCY_SEC   호출당 지연 (실연동 응답 시간 재현)
+  BANK_API_FAILURE_RATE  BankTimeoutError 발생 확률
+  같은 idempotency_key로 다시 호출하면 이체하지 않고 처음 거래 ID를 돌려준다 (실 API와 같은 계약).
+"""
+
+import random
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+
+class BankAPIError(Exception):
+    """재시도해도 해결되지 않는 이체 오류."""
+
+
+class BankTimeoutError(BankAPIError):
+    """타임아웃·일시 장애. 같은 idempotency_key로 재시도 가능."""
+
+
+class MockBankAPI:
+    def __init__(self, latency_sec: Optional[float] = None, failure_rate: Optional[float] = None):
+        self.latency_sec = latency_sec if latency_sec is not None else settings.BANK_API_LATENCY_SEC
+        self.failure_rate = failure_rate if failure_rate is not None else settings.BANK_API_FAILURE_RATE
+        self._transactions: Dict[str, str] = {}   # idempotency_key → transaction_id
+        self._lock = threading.Lock()
+        self.calls = 0          # 실제 이체 처리 건수 (idempotent 재호출 제외)
+
+    def transfer(
+        self,
+        *,
+        target: str,
+        amount: int,
+        memo: Optional[str] = None,
+        transfer_date: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, str]:
+        if idempotency_key:
+            with self._lock:
+                if idempotency_key in self._transactions:
+                    return {"transaction_id": self._transactions[idempotency_key]}
+        if self.latency_sec:
+            time.sleep(self.latency_sec)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise BankTimeoutError("bank api timeout")
+        if not target or not amount or amount < 1:
+            raise BankAPIError("invalid transfer request")
+
+        tx_id = f"mock-tx-{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            if idempotency_key:
+                # 동시 재호출 경합 시 먼저 기록된 거래를 유지
+                tx_id = self._transactions.setdefault(idempotency_key, tx_id)
+            self.calls += 1
+        return {"transaction_id": tx_id}
+
+
+_BANK_API: Optional[MockBankAPI] = None
+_LOCK = threading.Lock()
+
+
+def get_bank_api() -> MockBankAPI:
+    global _BANK_API
+    with _LOCK:
+        if _BANK_API is None:
+            _BANK_API = MockBankAPI()
+        return _BANK_API
+
+
+def set_bank_api(api: Optional[MockBankAPI]) -> None:
+    """클라이언트 교체 (테스트·실연동 구현 주입용). None이면 다음 호출 때 기본값으로 재생성."""
+    global _BANK_API
+    with _LOCK:
+        _BANK_API = api
@@ -0,0 +1,219 @@
+# app/projects/transfer/batch_upload.py
+"""
+다건 이체 파일 업로드: CSV/TSV → 검증된 태스크 목록 (LLM 호출 없음).
+
+이미 구조화된 데이터(급여 명단 등)를 채팅으로 붙여넣어 SlotFiller가 다시 파싱하게 하지 않고,
+행 단위로 바로 정규화·검증해 세션 state에 배치로 적재한다.
+
+─── 파일 형식 ──────────────────────────────────────────────────────────────
+  구분자: 첫 줄에 탭이 있으면 TSV, 아니면 CSV.
+  헤더(선택): 받는 분|이름|수신자|target, 금액|amount, 메모|memo, 이체일|날짜|transfer_date, 별칭|alias
+  헤더가 없으면 열 순서를 target, amount, memo, transfer_date로 본다.
+
+    이름,금액,메모,이체일
+    홍길동,"50,000원",급여,2026-06-25
+    김철수,3만 5천원,,내일
+
+─── 정규화·검증 ────────────────────────────────────────────────────────────
+  금액: logic.parse_korean_amount ("3만 5천원" → 35000)
+  날짜: logic.parse_date_text ("2026.6.25", "6월 25일", "내일" → YYYY-MM-DD)
+  이후 state_manager.coerce_slot_value로 SLOT_SCHEMA 검증 (대화 입력과 같은 규칙).
+
+─── 스트리밍 ───────────────────────────────────────────────────────────────
+  BatchUploadParser.feed(bytes)로 요청 본문을 청크 단위로 넣는다. 완성된 줄만 파싱하므로
+  파일 전체를 메모리에 올리지 않는다. 따옴표 안 줄바꿈은 다음 줄과 이어 붙인다.
+  본문이 max_bytes(BATCH_UPLOAD_MAX_BYTES), 데이터 행이 max_rows(BATCH_UPLOAD_MAX_ROWS)를
+  넘으면 BatchUploadTooLarge.
+
+─── 검토 ───────────────────────────────────────────────────────────────────
+  채팅 일괄 확인은 BULK_PREVIEW_LIMIT건까지만 보여주므로, report()의 rows에 적재되는 모든 행을
+  원문 금액(amount_text)과 함께 돌려준다 — 클라이언트가 확인 전에 전체 표를 보여준다.
+  단위가 섞인 금액("2천5백만원")처럼 숫자만으로 된 값이 아닌 행은 review=True.
+"""
+
+import codecs
+import csv
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.projects.transfer.logic import parse_korean_amount, parse_date_text
+from app.projects.transfer.messages import build_bulk_ready_message, build_ready_message
+from app.projects.transfer.state.models import Stage, TransferState, Slots, SLOT_SCHEMA, REQUIRED_SLOTS
+from app.projects.transfer.state.state_manager import coerce_slot_value
+
+_HEADER_ALIASES: Dict[str, str] = {
+    "target": "target", "받는 분": "target", "받는분": "target", "이름": "target", "수신자": "target",
+    "amount": "amount", "금액": "amount", "이체금액": "amount",
+    "memo": "memo", "메모": "memo",
+    "transfer_date": "transfer_date", "이체일": "transfer_date", "날짜": "transfer_date",
+    "alias": "alias", "별칭": "alias",
+}
+_DEFAULT_COLUMNS = ["target", "amount", "memo", "transfer_date"]
+
+# 응답에 담는 행 오류 최대 건수 (전체 건수는 rejected로 별도 보고)
+MAX_REPORTED_ERRORS = 50
+
+
+class BatchUploadTooLarge(ValueError):
+    """업로드 본문 크기 또는 행 수가 한도를 넘음."""
+
+
+class BatchUploadParser:
+    """
+    요청 본문 청크를 받아 행 단위로 정규화·검증한다.
+
+    Attributes:
+        tasks:    검증을 통과한 행의 슬롯 dict 목록 (파일 순서)
+        rows:     tasks와 같은 순서의 검토용 행 — {"row", **슬롯, "amount_text", "review"}
+        errors:   [{"row": 파일의 줄 번호(1부터, 헤더 포함), "errors": {slot: 오류 메시지}}] — 최대 MAX_REPORTED_ERRORS건
+        rejected: 검증 실패 행 수
+    """
+
+    def __init__(self, encoding: str = "utf-8-sig", today: Optional[date] = None,
+                 max_bytes: Optional[int] = None, max_rows: Optional[int] = None):
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._today = today or date.today()
+        self._buffer = ""
+        self._pending = ""          # 따옴표가 닫히지 않은 행
+        self._pending_line = 0      # _pending이 시작된 물리적 줄 번호
+        self._line_no = 0
+        self._delimiter: Optional[str] = None
+        self._columns: Optional[List[Optional[str]]] = None
+        self._bytes = 0
+        self._data_rows = 0
+        self.max_bytes = max_bytes or settings.BATCH_UPLOAD_MAX_BYTES
+        self.max_rows = max_rows or settings.BATCH_UPLOAD_MAX_ROWS
+        self._date_cache: Dict[str, Optional[str]] = {}   # 같은 이체일이 반복되는 명단이 대부분
+        self.tasks: List[Dict[str, Any]] = []
+        self.rows: List[Dict[str, Any]] = []
+        self.errors: List[Dict[str, Any]] = []
+        self.rejected = 0
+
+    # ── 입력 ─────────────────────────────────────────────────────────────────
+
+    def feed(self, chunk: bytes) -> None:
+        self._bytes += len(chunk)
+        if self._bytes > self.max_bytes:
+            raise BatchUploadTooLarge(f"본문이 {self.max_bytes}바이트를 넘어요")
+        self._buffer += self._decoder.decode(chunk)
+        *lines, self._buffer = self._buffer.split("\n")
+        self._parse_lines(lines)
+
+    def close(self) -> None:
+        self._buffer += self._decoder.decode(b"", final=True)
+        lines = [self._buffer] if self._buffer else []
+        self._buffer = ""
+        self._parse_lines(lines)
+        if self._pending:
+            self._parse_lines([], flush=True)
+
+    def _parse_lines(self, lines: List[str], flush: bool = False) -> None:
+        records: List[str] = []
+        starts: List[int] = []      # 레코드별 시작 줄 번호 — 따옴표 안 줄바꿈이 있어도 파일의 줄과 맞춘다
+        for line in lines:
+            line = line.rstrip("\r")
+            self._line_no += 1
+            if self._pending:
+                self._pending = f"{self._pending}\n{line}"
+            else:
+                self._pending, self._pending_line = line, self._line_no
+            if self._pending.count('"') % 2 == 0:
+                records.append(self._pending)
+                starts.append(self._pending_line)
+                self._pending = ""
+        if flush and self._pending:
+            records.append(self._pending)
+            starts.append(self._pending_line)
+            self._pending = ""
+        if not records:
+            return
+        if self._delimiter is None:
+            self._delimiter = "\t" if "\t" in records[0] else ","
+        for row, line_no in zip(csv.reader(records, delimiter=self._delimiter), starts):
+            if not any(cell.strip() for cell in row):
+                continue
+            if self._columns is None and self._read_header(row):
+                continue
+            self._data_rows += 1
+            if self._data_rows > self.max_rows:
+                raise BatchUploadTooLarge(f"행이 {self.max_rows}개를 넘어요")
+            self._add_row(row, line_no)
+
+    def _read_header(self, row: List[str]) -> bool:
+        """첫 행이 헤더면 열 매핑을 설정하고 True. 헤더가 아니면 기본 열 순서."""
+        mapped = [_HEADER_ALIASES.get(cell.strip().lower()) for cell in row]
+        if "target" in mapped and "amount" in mapped:
+            self._columns = mapped
+            return True
+        self._columns = _DEFAULT_COLUMNS
+        return False
+
+    # ── 행 처리 ──────────────────────────────────────────────────────────────
+
+    def _add_row(self, row: List[str], line_no: int) -> None:
+        raw = {
+            slot: cell.strip()
+            for slot, cell in zip(self._columns, row)
+            if slot and cell.strip()
+        }
+        task: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        for slot in REQUIRED_SLOTS:
+            if slot not in raw:
+                errors[slot] = "값이 비어있어요."
+        for slot, text in raw.items():
+            value: Any = text
+            if slot == "amount":
+                value = parse_korean_amount(text)
+            elif slot == "transfer_date":
+                if text not in self._date_cache:
+                    self._date_cache[text] = parse_date_text(text, self._today)
+                value = self._date_cache[text]
+            normalized, failed = coerce_slot_value(slot, value) if value is not None else (None, "cast")
+            if failed:
+                errors[slot] = SLOT_SCHEMA[slot].get("error_msg", f"{slot} 값이 올바르지 않아요.")
+            else:
+                task[slot] = normalized
+
+        if errors:
+            self.rejected += 1
+            if len(self.errors) < MAX_REPORTED_ERRORS:
+                self.errors.append({"row": line_no, "errors": errors})
+        else:
+            self.tasks.append(task)
+            amount_text = raw["amount"]
+            self.rows.append({
+                "row": line_no, **task, "amount_text": amount_text,
+                "review": not amount_text.replace(",", "").removesuffix("원").strip().isdigit(),
+            })
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "accepted": len(self.tasks),
+            "rejected": self.rejected,
+            "errors": self.errors,
+            "rows": self.rows,
+        }
+
+
+def load_batch_into_state(tasks: List[Dict[str, Any]]) -> TransferState:
+    """
+    검증된 태스크로 새 배치 state를 만든다 (READY — 다음 턴의 확인 한 번으로 진행).
+
+    BATCH_CONFIRM_MIN_TASKS건 이상이면 일괄 확인(bulk_tasks), 그보다 적으면
+    첫 태스크를 현재 슬롯에 두고 나머지를 task_queue에 넣어 한 건씩 확인한다.
+    """
+    state = TransferState(stage=Stage.READY, slots=Slots(**tasks[0]))
+    state.meta["batch_total"] = len(tasks)
+    state.meta["batch_progress"] = 0
+    if len(tasks) >= settings.BATCH_CONFIRM_MIN_TASKS:
+        state.meta["bulk_tasks"] = tasks
+    else:
+        state.task_queue = tasks[1:]
+    return state
+
+
+def ready_message(state: TransferState) -> str:
+    bulk = state.meta.get("bulk_tasks")
+    return build_bulk_ready_message(bulk) if bulk else build_ready_message(state)
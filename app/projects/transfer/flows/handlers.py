@@ -13,34 +13,73 @@
 ─── TransferFlowHandler 실행 순서 ────────────────────────────────────────────
   1. SlotFillerAgent (또는 코드 레벨 분류)
      READY + 확인/취소 키워드 → 코드로 직접 delta 생성 (LLM 불필요)
+     READY·FILLING 짧은 입력  → 규칙 추출 (금액·날짜·메모·이름, logic.extract_slot_ops)
+     항목이 많은 다건 목록     → 청크별 SlotFillerAgent 병렬 호출 후 tasks 병합 (_extract_slots)
      그 외                    → SlotFillerAgent LLM 호출
   2. StateManager.apply(delta) → 슬롯 검증·단계 전이
   3. 단계별 분기:
      UNSUPPORTED → 안내 메시지 + 세션 리셋
      CANCELLED + 대기 큐 → 다음 태스크 로드 (배치 스킵)
      CONFIRMED   → TransferExecuteAgent 실행
+                   (일괄 확인 배치면 전체 태스크를 병렬 실행 — _execute_bulk)
+                   EXECUTION_MODE=async면 백그라운드 접수 후 SUBMITTED (결과는 세션 이벤트 채널로)
      EXECUTED/FAILED/CANCELLED → 완료 메시지 + 세션 리셋
      READY       → 결정론적 확인 메시지 (LLM 없음)
      FILLING/INIT → InteractionAgent 호출
+
+─── 일괄 확인 배치 ───────────────────────────────────────────────────────────
+  SlotFiller가 반환한 tasks 중 슬롯이 모두 유효한 태스크가 BATCH_CONFIRM_MIN_TASKS건 이상이면
+  한 건씩 확인하지 않고 meta["bulk_tasks"]로 묶어 한 번에 확인받는다.
+  확인 후 BATCH_EXECUTE_CONCURRENCY 크기 풀에서 병렬 실행하며, 건별로 TASK_PROGRESS를 보내고
+  한 건의 실패가 다른 건에 영향을 주지 않는다. 슬롯이 불완전한 태스크는 task_queue에 남겨
+  일괄 실행 후 기존 방식대로 한 건씩 채운다.
+
+─── 비동기 실행 (EXECUTION_MODE=async) ───────────────────────────────────────
+  이체 실행을 app.core.execution BackgroundExecutor에 접수하고 턴은 곧바로 SUBMITTED로 끝낸다.
+  idempotency key = "{session_id}:{meta.execution_id}:{배치 내 번호}" — 같은 건을 다시 접수하거나
+  재시도해도 한 번만 실행된다 (은행 API에도 같은 key 전달).
+  완료 시 건별 TASK_PROGRESS(status: done|failed)와 EXECUTION_DONE을 세션 이벤트 채널에 발행한다.
 """
 
-from typing import Any, Dict, Generator
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Generator, List
 
 from app.core.context import ExecutionContext
 from app.core.events import EventType
 from app.core.orchestration import BaseFlowHandler
 from app.core.agents.agent_runner import RetryableError, FatalExecutionError
+from app.core.config import settings
+from app.core.execution import Job, get_channel, get_executor
+from app.core.execution.executor import SUCCEEDED
+from app.core.logging import setup_logger
 from app.projects.transfer.state.models import Stage, TransferState, Slots, REQUIRED_SLOTS
-from app.projects.transfer.logic import is_confirm, is_cancel, parse_slot_edit_confirm
+from app.projects.transfer.state.state_manager import coerce_slot_value
+from app.projects.transfer.logic import (
+    is_confirm,
+    is_cancel,
+    parse_slot_edit_confirm,
+    extract_slot_ops,
+    chunk_batch_items,
+    partition_batch_items,
+    parse_korean_amount,
+    parse_date_text,
+)
 from app.projects.transfer.messages import (
     UNSUPPORTED_MESSAGE,
     TERMINAL_MESSAGES,
+    BULK_PREVIEW_LIMIT,
     build_ready_message,
+    build_bulk_ready_message,
     build_slots_card,
     batch_partial_complete,
     batch_all_complete,
+    batch_failed_summary,
+    batch_all_submitted,
 )
 
+logger = setup_logger("Transfer.Flow")
+
 # ── UI 정책 ─────────────────────────────────────────────────────────────────────
 # action → 프론트엔드에 표시할 버튼 목록. 버튼 문구 변경 시 여기만 수정.
 # InteractionAgent는 action만 반환하고, 버튼 결정은 이 dict에서 일괄 관리.
@@ -85,6 +124,42 @@ def _load_next_task(state: TransferState) -> bool | None:
     return len(state.missing_required) == 0
 
 
+def _coerce_task(task: dict) -> dict | None:
+    """
+    일괄 확인 대상이면 SLOT_SCHEMA로 정규화한 태스크, 아니면 None.
+
+    LLM은 금액·날짜를 문자열("50000", "5만원", "2026-6-1")로 줄 때가 있어, 배치 업로드와 같은
+    파서로 먼저 해석한 뒤 coerce_slot_value(대화 입력과 같은 규칙)로 검증한다.
+    """
+    normalized: Dict[str, Any] = {}
+    for slot, value in task.items():
+        if value is None:
+            continue
+        if isinstance(value, str) and slot == "amount":
+            value = parse_korean_amount(value)
+        elif isinstance(value, str) and slot == "transfer_date":
+            value = parse_date_text(value)
+        if value is None:
+            return None
+        value, failed = coerce_slot_value(slot, value)
+        if failed:
+            return None
+        normalized[slot] = value
+    if any(normalized.get(s) is None for s in REQUIRED_SLOTS):
+        return None
+    return normalized
+
+
+def _split_bulk_tasks(tasks: List[dict]) -> tuple[List[dict], List[dict]]:
+    """(일괄 확인할 정규화된 태스크, 한 건씩 처리할 태스크). 유효 태스크가 기준 미만이면 전부 한 건씩."""
+    tasks = [{k: v for k, v in t.items() if k in Slots.model_fields} for t in tasks]
+    coerced = [_coerce_task(t) for t in tasks]
+    ready = [c for c in coerced if c is not None]
+    if len(ready) < settings.BATCH_CONFIRM_MIN_TASKS:
+        return [], tasks
+    return ready, [t for t, c in zip(tasks, coerced) if c is None]
+
+
 # ── Flow Handlers ─────────────────────────────────────────────────────────────
 
 class DefaultFlowHandler(BaseFlowHandler):
@@ -112,6 +187,254 @@ class TransferFlowHandler(BaseFlowHandler):
         payload = _apply_ui_policy(payload)
         return self._build_done_payload(ctx, payload)
 
+    def _extract_slots(self, ctx: ExecutionContext) -> dict:
+        """
+        INIT·FILLING 슬롯 추출.
+
+        "이름 금액" 항목이 SLOT_CHUNK_MIN_ITEMS개 이상인 다건 목록은 SLOT_CHUNK_SIZE개씩 나눠 병렬 추출하고
+        tasks를 원래 순서로 병합한다. 항목이 아닌 공통 지시 줄(금액·메모 일괄 지정)은 모든 청크에 함께 보낸다.
+        재시도는 실패한 청크만 다시 호출하며(태스크 수가 항목 수와 다른 응답도 실패), 그래도 실패한
+        청크가 있으면 항목 누락을 막기 위해 전체 발화로 한 번 더 추출한다.
+        """
+        chunks = chunk_batch_items(ctx.user_message, settings.SLOT_CHUNK_MIN_ITEMS, settings.SLOT_CHUNK_SIZE)
+        if not chunks:
+            return self.runner.run("slot", ctx)
+
+        workers = max(1, min(settings.SLOT_CHUNK_CONCURRENCY, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="slot-chunk") as pool:
+            results = list(pool.map(lambda chunk: self._extract_chunk(ctx, chunk), chunks))
+        if any(r is None for r in results):
+            logger.warning(f"[chunk] {results.count(None)}/{len(chunks)} chunks failed — full extraction")
+            return self.runner.run("slot", ctx)
+        return {"operations": [], "tasks": [t for tasks in results for t in tasks]}
+
+    def _extract_chunk(self, ctx: ExecutionContext, chunk: str) -> List[dict] | None:
+        """
+        청크 하나의 tasks. 추출한 태스크 수가 청크의 항목 수와 다르면(누락·병합) 파싱 실패처럼
+        SLOT_CHUNK_RETRY회 재시도하고, 그래도 맞지 않으면 항목을 하나씩 따로 추출한다. 소진 시 None.
+        """
+        items, context = partition_batch_items(chunk)
+        tasks = self._extract_items(ctx, chunk, len(items))
+        if tasks is not None or len(items) <= 1:
+            return tasks
+        logger.warning(f"[chunk] falling back to per-item extraction ({len(items)} items)")
+        per_item: List[dict] = []
+        for item in items:
+            tasks = self._extract_items(ctx, "\n".join(context + [item]), 1)
+            if tasks is None:
+                return None
+            per_item.extend(tasks)
+        return per_item
+
+    def _extract_items(self, ctx: ExecutionContext, text: str, expected: int) -> List[dict] | None:
+        """text에서 태스크 expected건. 오류·파싱 실패·건수 불일치는 SLOT_CHUNK_RETRY회 재시도, 소진 시 None."""
+        # 청크는 독립된 새 요청으로 추출 — 현재 슬롯·히스토리가 다른 청크 항목과 섞이지 않도록
+        chunk_ctx = ExecutionContext(
+            session_id=ctx.session_id,
+            user_message=text,
+            state=TransferState(),
+            memory={"raw_history": [], "summary_text": "", "summary_struct": {}},
+            tracer=ctx.tracer,
+        )
+        for _ in range(1 + settings.SLOT_CHUNK_RETRY):
+            try:
+                result = self.runner.run("slot", chunk_ctx)
+            except (RetryableError, FatalExecutionError) as e:
+                logger.warning(f"[chunk] slot extraction failed: {e}")
+                continue
+            if (result.get("_meta") or {}).get("parse_error"):
+                continue
+            tasks = result.get("tasks")
+            if not tasks:
+                # 항목이 하나뿐이면 SlotFiller가 operations로 반환 → 태스크로 변환
+                task = {
+                    o["slot"]: o.get("value")
+                    for o in result.get("operations", [])
+                    if o.get("op") == "set" and o.get("slot")
+                }
+                tasks = [task] if task else []
+            if len(tasks) == expected:
+                return tasks
+            logger.warning(f"[chunk] extracted {len(tasks)}/{expected} items")
+        return None
+
+    @staticmethod
+    def _task_context(ctx: ExecutionContext, task: dict) -> ExecutionContext:
+        """태스크 슬롯을 담은 state 사본 컨텍스트 (배치 건별 실행용)."""
+        return ExecutionContext(
+            session_id=ctx.session_id,
+            user_message=ctx.user_message,
+            state=ctx.state.model_copy(update={"slots": Slots(**task)}),
+            memory=ctx.memory,
+            tracer=ctx.tracer,
+        )
+
+    @staticmethod
+    def _idempotency_key(ctx: ExecutionContext, index: int) -> str:
+        """배치 내 번호(1-based)별 실행 키. execution_id는 세션 리셋 전까지 유지된다."""
+        execution_id = ctx.state.meta.setdefault("execution_id", uuid.uuid4().hex)
+        return f"{ctx.session_id}:{execution_id}:{index}"
+
+    def _submit_execution(self, ctx: ExecutionContext, task: dict, index: int, total: int) -> Job:
+        """실행을 백그라운드에 접수한다. 완료 시 세션 이벤트 채널로 결과를 발행한다."""
+        key = self._idempotency_key(ctx, index)
+        item_ctx = self._task_context(ctx, task)
+        session_id = ctx.session_id
+
+        def on_done(job: Job) -> None:
+            ok = job.status == SUCCEEDED
+            channel = get_channel()
+            channel.publish(session_id, {"event": EventType.TASK_PROGRESS, "payload": {
+                "index": index, "total": total, "slots": task,
+                "status": "done" if ok else "failed", "job_id": job.id,
+            }})
+            channel.publish(session_id, {"event": EventType.EXECUTION_DONE, "payload": {
+                k: v for k, v in job.to_dict().items() if k != "session_id"
+            }})
+            if ok and self.completed:
+                self.completed.add(
+                    session_id, item_ctx.state.model_copy(update={"stage": Stage.EXECUTED}), item_ctx.memory,
+                )
+
+        job, _ = get_executor().submit(
+            key, session_id,
+            lambda: self.runner.run("execute", item_ctx, idempotency_key=key),
+            on_done=on_done,
+            data={"slots": task, "index": index, "total": total},
+        )
+        return job
+
+    def _execute_current(self, ctx: ExecutionContext, index: int) -> Generator[Dict[str, Any], None, None]:
+        """현재 슬롯 이체를 턴 안에서 실행한다 (EXECUTION_MODE=sync)."""
+        try:
+            self.runner.run("execute", ctx, idempotency_key=self._idempotency_key(ctx, index))
+            ctx.state.stage = Stage.EXECUTED
+            ctx.state.meta["batch_executed"] = ctx.state.meta.get("batch_executed", 0) + 1
+            ctx.state.meta.setdefault("batch_receipts", []).append(
+                build_slots_card(ctx.state.slots)
+            )
+            yield {"event": EventType.AGENT_DONE, "payload": {
+                "agent": "execute", "label": "이체 실행 완료", "success": True,
+            }}
+            if self.completed:
+                self.completed.add(ctx.session_id, ctx.state, ctx.memory)
+
+        except (RetryableError, FatalExecutionError):
+            ctx.state.stage = Stage.FAILED
+            yield {"event": EventType.AGENT_DONE, "payload": {
+                "agent": "execute", "label": "이체 실행 실패", "success": False,
+            }}
+
+    def _execute_task(self, ctx: ExecutionContext, task: dict, key: str) -> bool:
+        """일괄 실행의 한 건. 태스크 슬롯을 담은 state 사본으로 TransferExecuteAgent를 실행한다."""
+        try:
+            self.runner.run("execute", self._task_context(ctx, task), idempotency_key=key)
+            return True
+        except (RetryableError, FatalExecutionError):
+            return False
+        except Exception as e:
+            # 건별 실패 격리 — 예상치 못한 오류도 해당 건만 실패 처리
+            logger.warning(f"[bulk] execute failed for {task.get('target')}: {type(e).__name__}: {e}")
+            return False
+
+    def _execute_bulk(self, ctx: ExecutionContext) -> Generator[Dict[str, Any], None, None]:
+        """
+        일괄 확인된 태스크를 병렬 실행한다.
+
+        완료 순서대로 건별 TASK_PROGRESS(status: done|failed)를 보내고,
+        성공 건은 batch_receipts, 실패 건은 batch_failed에 모은다.
+        하나라도 성공하면 EXECUTED, 전부 실패하면 FAILED.
+        한 건씩 처리할 태스크가 task_queue에 남아 있으면 이어서 READY/FILLING으로 진행한다.
+        """
+        tasks = ctx.state.meta.pop("bulk_tasks")
+        batch_total    = ctx.state.meta.get("batch_total", len(tasks))
+        batch_progress = ctx.state.meta.get("batch_progress", 0)
+
+        if settings.EXECUTION_MODE == "async":
+            yield from self._submit_bulk(ctx, tasks, batch_progress, batch_total)
+            return
+
+        yield {"event": EventType.AGENT_START, "payload": {
+            "agent": "execute", "label": f"이체 일괄 실행 중 ({len(tasks)}건)",
+        }}
+        results: List[bool] = [False] * len(tasks)
+        workers = max(1, min(settings.BATCH_EXECUTE_CONCURRENCY, len(tasks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transfer-bulk") as pool:
+            futures = {
+                pool.submit(self._execute_task, ctx, task, self._idempotency_key(ctx, batch_progress + i + 1)): i
+                for i, task in enumerate(tasks)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                yield {"event": EventType.TASK_PROGRESS, "payload": {
+                    "index": batch_progress + i + 1,
+                    "total": batch_total,
+                    "slots": tasks[i],
+                    "status": "done" if results[i] else "failed",
+                }}
+
+        executed = [t for t, ok in zip(tasks, results) if ok]
+        failed   = [t for t, ok in zip(tasks, results) if not ok]
+        ctx.state.meta["batch_executed"] = ctx.state.meta.get("batch_executed", 0) + len(executed)
+        ctx.state.meta.setdefault("batch_receipts", []).extend(
+            build_slots_card(Slots(**t)) for t in executed
+        )
+        if failed:
+            ctx.state.meta.setdefault("batch_failed", []).extend(
+                build_slots_card(Slots(**t)) for t in failed
+            )
+        yield {"event": EventType.AGENT_DONE, "payload": {
+            "agent": "execute",
+            "label": "이체 일괄 실행 완료",
+            "success": not failed,
+            "executed": len(executed),
+            "failed": len(failed),
+        }}
+        if self.completed:
+            for t in executed:
+                self.completed.add(
+                    ctx.session_id,
+                    ctx.state.model_copy(update={"slots": Slots(**t), "stage": Stage.EXECUTED}),
+                    ctx.memory,
+                )
+
+        ctx.state.stage = Stage.EXECUTED if executed else Stage.FAILED
+        self._after_bulk(ctx, batch_progress + len(tasks))
+
+    def _submit_bulk(
+        self, ctx: ExecutionContext, tasks: List[dict], batch_progress: int, batch_total: int,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """일괄 확인 태스크를 전부 백그라운드에 접수한다 (건별 결과는 세션 이벤트 채널로)."""
+        yield {"event": EventType.AGENT_START, "payload": {
+            "agent": "execute", "label": f"이체 일괄 접수 중 ({len(tasks)}건)",
+        }}
+        jobs = []
+        for i, task in enumerate(tasks):
+            index = batch_progress + i + 1
+            job = self._submit_execution(ctx, task, index, batch_total)
+            jobs.append(job.id)
+            yield {"event": EventType.TASK_PROGRESS, "payload": {
+                "index": index, "total": batch_total, "slots": task,
+                "status": "submitted", "job_id": job.id,
+            }}
+        ctx.state.meta["batch_submitted"] = ctx.state.meta.get("batch_submitted", 0) + len(tasks)
+        ctx.state.meta.setdefault("batch_receipts", []).extend(build_slots_card(Slots(**t)) for t in tasks)
+        ctx.state.meta.setdefault("pending_jobs", []).extend(jobs)
+        yield {"event": EventType.AGENT_DONE, "payload": {
+            "agent": "execute", "label": "이체 일괄 접수 완료", "success": True, "submitted": len(tasks),
+        }}
+        ctx.state.stage = Stage.SUBMITTED
+        self._after_bulk(ctx, batch_progress + len(tasks))
+
+    def _after_bulk(self, ctx: ExecutionContext, batch_progress: int) -> None:
+        """일괄 처리 후: 한 건씩 처리할 태스크가 남아 있으면 이어서 READY/FILLING."""
+        ctx.state.meta["batch_progress"] = batch_progress
+        is_complete = _load_next_task(ctx.state)
+        if is_complete is not None:
+            ctx.state.stage = Stage.READY if is_complete else Stage.FILLING
+        self.sessions.save_state(ctx.session_id, ctx.state)
+
     def run(self, ctx: ExecutionContext) -> Generator[Dict[str, Any], None, None]:
 
         # ── 1. Slot 추출 ─────────────────────────────────────────────────────
@@ -125,9 +448,15 @@ class TransferFlowHandler(BaseFlowHandler):
                 delta = {"operations": [{"op": "confirm"}]}
             elif is_cancel(ctx.user_message):
                 delta = {"operations": [{"op": "cancel_flow"}]}
+            elif ctx.state.meta.get("bulk_tasks"):
+                # 일괄 확인 대기 중에는 개별 슬롯 편집 미지원 → InteractionAgent가 확인/취소 유도
+                delta = {"operations": []}
             else:
                 # 프론트엔드 슬롯 편집 + 확인 패턴 → 코드 레벨 파싱 (LLM 불필요)
                 delta = parse_slot_edit_confirm(ctx.user_message)
+                if delta is None:
+                    # "메모 생일", "내일", "3만원으로" 등 → 규칙 추출
+                    delta = extract_slot_ops(ctx.user_message, ctx.state.missing_required)
                 if delta is None:
                     # 코드 파싱 실패 → SlotFiller LLM 호출 (메모·날짜 자유 입력 등)
                     delta = self.runner.run("slot", ctx)
@@ -143,8 +472,13 @@ class TransferFlowHandler(BaseFlowHandler):
             # InteractionAgent가 "취소할 이체가 없어요"로 자연스럽게 응대
             delta = {"operations": [{"op": "cancel_flow"}]}
         else:
-            # 일반 슬롯 추출 — LLM 호출
-            delta = self.runner.run("slot", ctx)
+            # FILLING 짧은 입력("5만원", "홍길동", "다음주 금요일")은 규칙 추출,
+            # 규칙으로 확정할 수 없으면 일반 슬롯 추출 — LLM 호출
+            delta = None
+            if ctx.state.stage == Stage.FILLING:
+                delta = extract_slot_ops(ctx.user_message, ctx.state.missing_required)
+            if delta is None:
+                delta = self._extract_slots(ctx)
 
         # 다건 이체 감지: INIT·FILLING 단계에서만 처리.
         # READY 이후에는 이미 배치가 진행 중이므로 새 감지를 무시 → 배치 리셋 방지.
@@ -152,14 +486,22 @@ class TransferFlowHandler(BaseFlowHandler):
             tasks = delta["tasks"]
             ctx.state.meta["batch_total"]    = len(tasks)
             ctx.state.meta["batch_progress"] = 0
+            bulk, tasks = _split_bulk_tasks(tasks)
+            if bulk:
+                # 일괄 확인: 첫 태스크는 READY 전이용으로 현재 슬롯에도 적용
+                ctx.state.meta["bulk_tasks"] = bulk
+                first = bulk[0]
+            else:
+                ctx.state.meta.pop("bulk_tasks", None)
+                first, tasks = tasks[0], tasks[1:]
             # 첫 번째 태스크를 현재 슬롯에 적용, 나머지는 task_queue에 저장
             delta = {
                 "operations": [
                     {"op": "set", "slot": k, "value": v}
-                    for k, v in tasks[0].items() if v is not None
+                    for k, v in first.items() if v is not None
                 ]
             }
-            ctx.state.task_queue = tasks[1:]
+            ctx.state.task_queue = tasks
 
         # READY + 빈 delta → off-topic 플래그 (3e에서 InteractionAgent 폴백에 사용)
         ready_empty_delta = (
@@ -190,13 +532,17 @@ class TransferFlowHandler(BaseFlowHandler):
         # 단건 취소 후 남은 태스크가 있으면 바로 다음 이체로 이동 (배치 플로우 계속)
         if ctx.state.stage == Stage.CANCELLED and ctx.state.task_queue:
             batch_progress = ctx.state.meta.get("batch_progress", 0)
+            bulk = ctx.state.meta.pop("bulk_tasks", None)   # 일괄 확인 취소 → 묶음 전체 건너뜀
             is_complete = _load_next_task(ctx.state)
-            ctx.state.meta["batch_progress"] = batch_progress + 1
+            ctx.state.meta["batch_progress"] = batch_progress + (len(bulk) if bulk else 1)
             ctx.state.meta["last_cancelled"] = True   # 확인 메시지에 "취소됐어요. 다음으로..." 접두 표시용
             ctx.state.stage = Stage.READY if is_complete else Stage.FILLING
             self.sessions.save_state(ctx.session_id, ctx.state)
 
         # ── 3c. CONFIRMED — 이체 실행 ─────────────────────────────────────────
+        if ctx.state.stage == Stage.CONFIRMED and ctx.state.meta.get("bulk_tasks"):
+            yield from self._execute_bulk(ctx)
+
         if ctx.state.stage == Stage.CONFIRMED:
             batch_total    = ctx.state.meta.get("batch_total",    1)
             batch_progress = ctx.state.meta.get("batch_progress", 0)
@@ -207,28 +553,24 @@ class TransferFlowHandler(BaseFlowHandler):
                 "total": batch_total,
                 "slots": ctx.state.slots.model_dump(),
             }}
-            yield {"event": EventType.AGENT_START, "payload": {"agent": "execute", "label": "이체 실행 중"}}
-            try:
-                self.runner.run("execute", ctx)
-                ctx.state.stage = Stage.EXECUTED
-                ctx.state.meta["batch_executed"] = ctx.state.meta.get("batch_executed", 0) + 1
-                ctx.state.meta.setdefault("batch_receipts", []).append(
-                    build_slots_card(ctx.state.slots)
-                )
+            index = batch_progress + 1
+            if settings.EXECUTION_MODE == "async":
+                # 백그라운드 접수 → 즉시 pending receipt. 결과는 세션 이벤트 채널로 전달
+                yield {"event": EventType.AGENT_START, "payload": {"agent": "execute", "label": "이체 접수 중"}}
+                job = self._submit_execution(ctx, ctx.state.slots.model_dump(), index, batch_total)
+                ctx.state.stage = Stage.SUBMITTED
+                ctx.state.meta["batch_submitted"] = ctx.state.meta.get("batch_submitted", 0) + 1
+                ctx.state.meta.setdefault("batch_receipts", []).append(build_slots_card(ctx.state.slots))
+                ctx.state.meta.setdefault("pending_jobs", []).append(job.id)
                 yield {"event": EventType.AGENT_DONE, "payload": {
-                    "agent": "execute", "label": "이체 실행 완료", "success": True,
-                }}
-                if self.completed:
-                    self.completed.add(ctx.session_id, ctx.state, ctx.memory)
-
-            except (RetryableError, FatalExecutionError):
-                ctx.state.stage = Stage.FAILED
-                yield {"event": EventType.AGENT_DONE, "payload": {
-                    "agent": "execute", "label": "이체 실행 실패", "success": False,
+                    "agent": "execute", "label": "이체 접수 완료", "success": True, "job_id": job.id,
                 }}
+            else:
+                yield {"event": EventType.AGENT_START, "payload": {"agent": "execute", "label": "이체 실행 중"}}
+                yield from self._execute_current(ctx, index)
 
-            # 이체 성공 시 다음 배치 태스크 로드
-            if ctx.state.stage == Stage.EXECUTED:
+            # 이체 성공(또는 접수) 시 다음 배치 태스크 로드
+            if ctx.state.stage in (Stage.EXECUTED, Stage.SUBMITTED):
                 is_complete = _load_next_task(ctx.state)
                 new_progress = batch_progress + 1
                 if is_complete is None:
@@ -244,25 +586,37 @@ class TransferFlowHandler(BaseFlowHandler):
 
         # ── 3d. Terminal — 완료·실패·취소 메시지 후 세션 리셋 ─────────────────
         if ctx.state.stage in TERMINAL_MESSAGES:
-            total_executed = ctx.state.meta.get("batch_executed", 0)
+            total_executed  = ctx.state.meta.get("batch_executed", 0)
+            total_submitted = ctx.state.meta.get("batch_submitted", 0)
+            batch_failed    = ctx.state.meta.get("batch_failed", [])
             # 배치 일부만 완료하고 취소한 경우 특수 메시지
-            if ctx.state.stage == Stage.CANCELLED and total_executed > 0:
-                message = batch_partial_complete(total_executed)
+            if ctx.state.stage == Stage.CANCELLED and total_executed + total_submitted > 0:
+                message = batch_partial_complete(total_executed + total_submitted)
+            elif batch_failed:
+                message = batch_failed_summary(total_executed, len(batch_failed))
+            elif ctx.state.stage == Stage.SUBMITTED and total_submitted > 1:
+                message = batch_all_submitted(total_submitted)
             elif total_executed > 1:
                 message = batch_all_complete(total_executed)
             else:
                 message = TERMINAL_MESSAGES[ctx.state.stage]
 
             payload = {"message": message, "action": "DONE"}
+            if ctx.state.meta.get("pending_jobs"):
+                # 비동기 접수 — 영수증은 pending 상태, 결과는 GET /v1/agent/events로 전달
+                payload["receipt_status"] = "PENDING"
+                payload["pending_jobs"] = ctx.state.meta["pending_jobs"]
             # 영수증: 배치일 때 전체 영수증, 단건일 때 기존 호환
-            if ctx.state.stage in (Stage.EXECUTED, Stage.FAILED):
+            if ctx.state.stage in (Stage.EXECUTED, Stage.FAILED, Stage.SUBMITTED):
                 batch_receipts = ctx.state.meta.get("batch_receipts", [])
                 if len(batch_receipts) > 1:
                     payload["receipts"] = batch_receipts
                 elif batch_receipts:
                     payload["receipt"] = batch_receipts[0]
-                else:
+                elif not batch_failed:
                     payload["receipt"] = build_slots_card(ctx.state.slots)
+                if batch_failed:
+                    payload["failed_receipts"] = batch_failed
             self._update_memory(ctx, message)
             if self.completed and ctx.state.stage in (Stage.FAILED, Stage.CANCELLED):
                 self.completed.add(ctx.session_id, ctx.state, ctx.memory)
@@ -277,14 +631,24 @@ class TransferFlowHandler(BaseFlowHandler):
                 yield from self._stream_agent_turn(ctx, "interaction", "응답 생성 중",
                                                    done_transform=_apply_ui_policy)
                 return
-            # 슬롯 변경 반영 → 결정론적 확인 메시지 + 카드
-            message = build_ready_message(ctx.state)
+            bulk = ctx.state.meta.get("bulk_tasks")
             ctx.state.meta.pop("last_cancelled", None)
-            payload = {
-                "action": "CONFIRM",
-                "message": message,
-                "slots_card": build_slots_card(ctx.state.slots),
-            }
+            if bulk:
+                # 일괄 확인 → 전체 목록 메시지 + 건별 카드
+                message = build_bulk_ready_message(bulk)
+                payload = {
+                    "action": "CONFIRM",
+                    "message": message,
+                    "batch_cards": [build_slots_card(Slots(**t)) for t in bulk[:BULK_PREVIEW_LIMIT]],
+                }
+            else:
+                # 슬롯 변경 반영 → 결정론적 확인 메시지 + 카드
+                message = build_ready_message(ctx.state)
+                payload = {
+                    "action": "CONFIRM",
+                    "message": message,
+                    "slots_card": build_slots_card(ctx.state.slots),
+                }
             self._update_memory(ctx, message)
             yield {"event": EventType.DONE, "payload": self._yield_done(ctx, payload)}
             return
@@ -7,6 +7,8 @@ LLM에 의존하지 않는 코드 레벨 분류 로직.
 """
 
 import re
+import threading
+from datetime import date, timedelta
 
 # ── 확인 의사 ─────────────────────────────────────────────────────────────────
 # READY 단계에서 사용자가 확인 버튼을 누르거나 유사 표현을 사용하는 경우.
@@ -110,3 +112,238 @@ def _parse_amount_from_display(text: str) -> int | None:
         return int(text)
     except ValueError:
         return None
+
+
+# ── 규칙 기반 슬롯 추출 (FILLING·READY) ─────────────────────────────────────────
+# 자주 들어오는 짧은 입력을 SlotFiller LLM 없이 operations delta로 변환한다:
+#   "5만원", "3만 5천원", "50,000원으로"        → amount
+#   "내일", "다음주 금요일", "6월 19일"          → transfer_date
+#   "메모 생일"                                   → memo (나머지 전체)
+#   "엄마한테", "홍길동" (target만 남았을 때)    → target
+# 발화 전체가 규칙으로 소비되어야 하며, 남는 텍스트·같은 슬롯 중복·해석 불가 표현이 있으면
+# None을 반환해 SlotFiller에 위임한다 (모호하면 LLM).
+
+# 금액 단위: 천·백·십은 한 자리 묶음 안에서, 만·억은 그 앞 묶음 전체에 곱한다 ("2천5백만" = 2500 × 만)
+_SMALL_UNITS = {"천": 1_000, "백": 100, "십": 10}
+_LARGE_UNITS = {"억": 100_000_000, "만": 10_000}
+_AMOUNT_PART_RE = re.compile(r"\d+(?:\.\d+)?|[억만천백십]")
+
+_AMOUNT_TOKEN_RE = re.compile(
+    r"^(?:금액\s*)?"
+    r"((?:\d[\d,]*(?:\.\d+)?\s*[억만천백십]{1,2}\s*)*(?:\d[\d,]*)?)\s*(원)?"
+    r"(?:으로|이요|요)?(?=\s|,|$)"
+)
+_MEMO_RE = re.compile(r"^메모\s*[:：]?\s*(\S.*)$")
+_TARGET_TOKEN_RE = re.compile(r"^([가-힣A-Za-z]{1,10})(?:한테|에게|께)(?=\s|,|$)")
+_BARE_NAME_RE = re.compile(r"^[가-힣]{2,5}$")
+# 이름으로 보기 어려운 어미 (질문·서술) — "뭐라고", "몰라요" 등은 LLM에 위임
+_NON_NAME_ENDING_RE = re.compile(r"(요|까|다|야|지|죠|니|냐|고|게|데|나|네)$")
+# 어미 규칙에 걸리지 않는 짧은 대답·감탄사 — 이름으로 보지 않는다
+_NON_NAME_WORDS = {
+    "몰라", "괜찮아", "괜찮", "아니", "글쎄", "그래", "그냥", "됐어", "싫어", "좋아", "알았어",
+    "잠깐", "잠깐만", "아직", "다시", "그거", "이거", "저거", "누구", "뭐더라", "음음", "어어",
+    "아아", "헐", "흠", "으음", "에이", "아이고", "어머", "진짜", "정말", "역시", "맞아",
+}
+
+_WEEKDAYS = {"월": 0, "화": 1, "수": 2, "목": 3, "금": 4, "토": 5, "일": 6}
+_RELATIVE_DAYS = {"오늘": 0, "내일": 1, "모레": 2, "내일모레": 2, "글피": 3}
+_DATE_TOKEN_RE = re.compile(
+    r"^(?:"
+    r"(?P<iso>\d{4}-\d{1,2}-\d{1,2})"
+    r"|(?P<md>(?P<month>\d{1,2})\s*월\s*(?P<day>\d{1,2})\s*일)"
+    r"|(?P<week>이번\s*주|다음\s*주|다다음\s*주)\s*(?P<wd>[월화수목금토일])요일"
+    r"|(?P<rel>내일모레|오늘|내일|모레|글피)"
+    r")(?:에|로|으로)?(?=\s|,|$)"
+)
+
+_RULE_COUNTERS = {"hit": 0, "miss": 0}
+_RULE_LOCK = threading.Lock()
+
+
+def parse_korean_amount(text: str) -> int | None:
+    """
+    한국어 금액 표현 → 원 단위 정수. 실패 시 None.
+      "50,000원" → 50000, "3만 5천원" → 35000, "1.5만" → 15000,
+      "2천5백만원" → 25000000, "1만2천3백원" → 12300, "5백원" → 500, "천만원" → 10000000
+    왼쪽부터 읽으며 천·백·십은 현재 묶음에 더하고, 만·억은 현재 묶음에 곱해 합계로 넘긴다.
+    단위 순서가 어긋나거나("5천3천", "만억") 해석하지 못한 글자가 남으면 None.
+    """
+    text = text.replace(",", "").replace("원", "")
+    if re.search(r"\d\s+\d", text):
+        return None   # 띄어 쓴 숫자 ("3 5") — 금액 하나로 보지 않는다
+    text = re.sub(r"\s+", "", text)
+    if not text:
+        return None
+    parts = _AMOUNT_PART_RE.findall(text)
+    if "".join(parts) != text:
+        return None
+
+    total = group = 0.0
+    number = None                 # 단위를 기다리는 숫자
+    small_floor = large_floor = float("inf")
+    for part in parts:
+        if part in _SMALL_UNITS:
+            unit = _SMALL_UNITS[part]
+            if unit >= small_floor:
+                return None
+            group += (number if number is not None else 1) * unit
+            small_floor, number = unit, None
+        elif part in _LARGE_UNITS:
+            unit = _LARGE_UNITS[part]
+            if unit >= large_floor:
+                return None
+            if number is not None:
+                group += number
+            total += (group or 1) * unit
+            large_floor, small_floor, group, number = unit, float("inf"), 0.0, None
+        else:
+            if number is not None:
+                return None
+            number = float(part)
+    if number is not None:
+        if number != int(number):
+            return None   # 단위 없는 소수 ("1.5")
+        group += number
+    total += group
+    return int(round(total)) if total > 0 else None
+
+
+def _parse_date_token(m: re.Match, today: date) -> str | None:
+    if m.group("iso"):
+        try:
+            return date.fromisoformat("-".join(f"{int(p):02d}" for p in m.group("iso").split("-"))).isoformat()
+        except ValueError:
+            return None
+    if m.group("md"):
+        month, day = int(m.group("month")), int(m.group("day"))
+        # 연도 미지정 → 오늘 기준 가장 가까운 미래 (SlotFiller 프롬프트와 같은 규칙)
+        for year in (today.year, today.year + 1):
+            try:
+                d = date(year, month, day)
+            except ValueError:
+                return None
+            if d >= today:
+                return d.isoformat()
+        return None
+    if m.group("week"):
+        weeks = {"이번주": 0, "다음주": 1, "다다음주": 2}[re.sub(r"\s", "", m.group("week"))]
+        monday = today - timedelta(days=today.weekday()) + timedelta(weeks=weeks)
+        return (monday + timedelta(days=_WEEKDAYS[m.group("wd")])).isoformat()
+    return (today + timedelta(days=_RELATIVE_DAYS[m.group("rel")])).isoformat()
+
+
+def parse_date_text(text: str, today: date | None = None) -> str | None:
+    """
+    날짜 표현 전체 → "YYYY-MM-DD". 실패 시 None.
+      "2026-06-19", "2026.6.19", "2026/06/19", "6월 19일", "내일", "다음주 금요일"
+    """
+    text = re.sub(r"^(\d{4})[./](\d{1,2})[./](\d{1,2})\.?$", r"\1-\2-\3", text.strip())
+    m = _DATE_TOKEN_RE.match(text)
+    if not m or m.end() != len(text):
+        return None
+    return _parse_date_token(m, today or date.today())
+
+
+def extract_slot_ops(message: str, missing_required: list[str] | None = None,
+                     today: date | None = None) -> dict | None:
+    """
+    FILLING·READY 발화를 규칙으로 슬롯 delta로 변환.
+
+    Args:
+        missing_required: 현재 비어있는 필수 슬롯. 조사 없는 단독 이름은
+                          target만 비어있을 때만 target으로 인정한다.
+        today:            상대 날짜 기준일 (기본: 오늘)
+
+    Returns:
+        {"operations": [...]} 또는 None (규칙으로 확정할 수 없음 → SlotFiller 위임).
+    """
+    ops = _extract(message.strip(), missing_required or [], today or date.today())
+    with _RULE_LOCK:
+        _RULE_COUNTERS["hit" if ops else "miss"] += 1
+    return {"operations": ops} if ops else None
+
+
+def _extract(text: str, missing_required: list[str], today: date) -> list[dict] | None:
+    if not text or is_confirm(text) or is_cancel(text):
+        return None
+
+    if (_BARE_NAME_RE.match(text) and missing_required == ["target"]
+            and not _NON_NAME_ENDING_RE.search(text) and text not in _RELATIVE_DAYS
+            and text not in _NON_NAME_WORDS):
+        return [{"op": "set", "slot": "target", "value": text}]
+
+    values: dict = {}
+    rest = text
+    while rest:
+        rest = rest.lstrip(" ,")
+        if not rest:
+            break
+        if m := _MEMO_RE.match(rest):
+            slot, value, rest = "memo", m.group(1).strip(), ""
+        elif m := _DATE_TOKEN_RE.match(rest):
+            slot, value, rest = "transfer_date", _parse_date_token(m, today), rest[m.end():]
+        elif (m := _AMOUNT_TOKEN_RE.match(rest)) and re.search(r"\d", m.group(1)):
+            # 단위·"원" 없는 숫자만 있는 경우는 금액이 비어있을 때만 인정
+            if not m.group(2) and not re.search(r"[억천백만]", m.group(1)) and "amount" not in missing_required:
+                return None
+            slot, value, rest = "amount", parse_korean_amount(m.group(1)), rest[m.end():]
+        elif m := _TARGET_TOKEN_RE.match(rest):
+            slot, value, rest = "target", m.group(1), rest[m.end():]
+        else:
+            return None
+        if value is None or slot in values:
+            return None   # 해석 실패 또는 같은 슬롯 중복 (다건 이체 가능성) → LLM
+        values[slot] = value
+
+    return [{"op": "set", "slot": s, "value": v} for s, v in values.items()] or None
+
+
+def slot_rule_stats() -> dict:
+    """규칙 추출 적중률 (hit: LLM 생략, miss: SlotFiller 위임)."""
+    with _RULE_LOCK:
+        hit, miss = _RULE_COUNTERS["hit"], _RULE_COUNTERS["miss"]
+    total = hit + miss
+    return {"hit": hit, "miss": miss, "hit_rate": round(hit / total, 3) if total else 0.0}
+
+
+# ── 다건 입력 청크 분할 ─────────────────────────────────────────────────────────
+# "이름 금액" 줄을 수십 개 붙여넣은 입력은 한 프롬프트로 보내면 출력 길이·지연·파싱 실패 위험이
+# 항목 수에 비례해 커진다. 줄(없으면 쉼표·"그리고" 절) 단위로 항목을 나눠 청크로 묶는다.
+# 숫자 사이 쉼표("50,000원")는 구분자로 보지 않는다.
+# "이름 금액" 형태가 아닌 줄("아래 사람들한테 각각 1만원씩, 메모는 회비")은 모든 항목에 걸리는
+# 공통 지시일 수 있으므로 항목으로 세지 않고 모든 청크 앞에 붙인다.
+
+_CLAUSE_SPLIT_RE = re.compile(r"(?<!\d),|,(?!\d)|[;，]|\s+그리고\s+")
+_LIST_BULLET_CHARS = " \t-•*·"
+_BATCH_ITEM_RE = re.compile(
+    r"^[가-힣A-Za-z]{1,10}(?:님)?(?:한테|에게|께)?\s*[:：]?\s*"
+    r"(?:\d[\d,]*(?:\.\d+)?\s*(?:[억만천백십원]|$|\s)|[만천백]\s*원)"
+)
+
+
+def split_batch_items(message: str) -> list[str]:
+    """발화를 항목 단위로 분할. 여러 줄이면 줄 단위, 한 줄이면 절 단위."""
+    items = [line.strip(_LIST_BULLET_CHARS) for line in message.splitlines()]
+    items = [i for i in items if i]
+    if len(items) <= 1:
+        items = [c.strip() for c in _CLAUSE_SPLIT_RE.split(message) if c.strip()]
+    return items
+
+
+def partition_batch_items(message: str) -> tuple[list[str], list[str]]:
+    """("이름 금액" 항목, 항목이 아닌 공통 지시 줄) — 둘 다 원래 순서."""
+    items, context = [], []
+    for item in split_batch_items(message):
+        (items if _BATCH_ITEM_RE.match(item) else context).append(item)
+    return items, context
+
+
+def chunk_batch_items(message: str, min_items: int, size: int) -> list[str]:
+    """
+    "이름 금액" 항목이 min_items개 이상이면 size개씩 묶은 청크 텍스트 목록(원래 순서), 아니면 빈 리스트.
+    항목이 아닌 줄(공통 금액·메모 지시 등)은 모든 청크 앞에 그대로 붙인다.
+    """
+    items, context = partition_batch_items(message)
+    if len(items) < min_items:
+        return []
+    return ["\n".join(context + items[i:i + size]) for i in range(0, len(items), size)]
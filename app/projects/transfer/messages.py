@@ -22,6 +22,7 @@ TERMINAL_MESSAGES: Dict[Stage, str] = {
     Stage.EXECUTED:  "이체가 완료됐어요. 다른 도움이 필요하신가요?",
     Stage.FAILED:    "이체에 실패했어요. 잠시 후 다시 시도해 주세요.",
     Stage.CANCELLED: "이체가 취소됐어요. 다른 도움이 필요하신가요?",
+    Stage.SUBMITTED: "이체 요청을 접수했어요. 처리가 끝나면 결과를 알려드릴게요.",
 }
 
 # ── 다건 완료 메시지 ──────────────────────────────────────────────────────────
@@ -36,6 +37,21 @@ def batch_all_complete(executed_count: int) -> str:
     return f"{executed_count}건 이체가 모두 완료됐어요. 다른 도움이 필요하신가요?"
 
 
+def batch_all_submitted(submitted_count: int) -> str:
+    """비동기 실행 — 모든 이체 접수 시."""
+    return f"{submitted_count}건 이체를 모두 접수했어요. 처리가 끝나면 결과를 알려드릴게요."
+
+
+def batch_failed_summary(executed_count: int, failed_count: int) -> str:
+    """일괄 실행 중 일부(또는 전부) 실패 시."""
+    if executed_count == 0:
+        return f"{failed_count}건 이체에 모두 실패했어요. 잠시 후 다시 시도해 주세요."
+    return (
+        f"{executed_count}건 이체가 완료됐고 {failed_count}건은 실패했어요. "
+        "실패한 건은 잠시 후 다시 시도해 주세요."
+    )
+
+
 # ── READY 단계 확인 메시지 빌더 ───────────────────────────────────────────────
 
 def format_amount(amount: int | None) -> str:
@@ -92,6 +108,26 @@ def build_ready_message(state) -> str:
     return line
 
 
+# 일괄 확인 메시지·카드에 개별 표시하는 최대 건수 (파일 업로드 등 대량 배치)
+BULK_PREVIEW_LIMIT = 20
+
+
+def build_bulk_ready_message(tasks: List[Dict]) -> str:
+    """일괄 확인 메시지: 합계와 목록(최대 BULK_PREVIEW_LIMIT건)을 한 번에 보여준다."""
+    total_amount = sum(t["amount"] for t in tasks)
+    lines = [f"총 {len(tasks)}건, {format_amount(total_amount)}을(를) 한 번에 이체할까요?"]
+    for i, t in enumerate(tasks[:BULK_PREVIEW_LIMIT], 1):
+        line = f"{i}. {t['target']}에게 {format_amount(t['amount'])}"
+        if t.get("memo"):
+            line += f" (메모: {t['memo']})"
+        if t.get("transfer_date"):
+            line += f" (이체일: {t['transfer_date']})"
+        lines.append(line)
+    if len(tasks) > BULK_PREVIEW_LIMIT:
+        lines.append(f"... 외 {len(tasks) - BULK_PREVIEW_LIMIT}건")
+    return "\n".join(lines)
+
+
 # ── 슬롯 카드 빌더 ─────────────────────────────────────────────────────────
 # 프론트에서 카드 UI로 렌더링. READY 확인 카드, EXECUTED 영수증에 공통 사용.
 
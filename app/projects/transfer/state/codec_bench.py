@@ -0,0 +1,78 @@
+# app/projects/transfer/state/codec_bench.py
+"""
+state 코덱 벤치마크: 실제 배치 이체 형태의 TransferState로 인코딩·디코딩 속도와 크기를 비교한다.
+
+    python -m app.projects.transfer.state.codec_bench [반복 횟수]
+
+  baseline    기존 방식 — json.dumps(model_dump()) / model_validate(json.loads())
+  json·orjson·msgpack·binary  app.core.codec.encode_state / decode_state
+  (설치되지 않은 선택 의존성 코덱은 건너뛴다)
+"""
+
+import json
+import sys
+import time
+from typing import Callable, Dict, List
+
+from app.core.codec import decode_state, encode_state
+from app.projects.transfer.state.models import Slots, Stage, TransferState
+
+_NAMES = ["홍길동", "김철수", "이영희", "박민수", "엄마", "아빠", "최지우", "정하늘"]
+
+
+def sample_states() -> Dict[str, TransferState]:
+    """단건 FILLING · 일괄 확인 대기(20건) · 한 건씩 처리 중인 배치(task_queue 10건)."""
+    tasks = [
+        {"target": _NAMES[i % len(_NAMES)], "amount": 10000 * (i + 1), "memo": "회비" if i % 3 else None,
+         "transfer_date": "2026-11-25" if i % 2 else None}
+        for i in range(20)
+    ]
+    single = TransferState(stage=Stage.FILLING, slots=Slots(target="홍길동"), missing_required=["amount"],
+                           filling_turns=1)
+    single.meta["slot_errors"] = {"amount": "금액을 다시 알려주세요."}
+
+    bulk = TransferState(stage=Stage.READY, slots=Slots(**tasks[0]))
+    bulk.meta.update(batch_total=20, batch_progress=0, bulk_tasks=tasks,
+                     meta_counts={"slot_meta": 2}, slot_meta=[{"parse_error": False}] * 2)
+
+    queued = TransferState(stage=Stage.READY, slots=Slots(**tasks[0]), task_queue=tasks[1:11])
+    queued.meta.update(batch_total=11, batch_progress=3, batch_executed=3,
+                       batch_receipts=[Slots(**t).model_dump() for t in tasks[:3]])
+    return {"single": single, "bulk_20": bulk, "queue_10": queued}
+
+
+def _time(fn: Callable[[], object], n: int) -> float:
+    started = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - started) / n * 1e6
+
+
+def bench(n: int = 2000) -> List[Dict[str, object]]:
+    rows = []
+    for label, state in sample_states().items():
+        raw = json.dumps(state.model_dump(mode="json"), ensure_ascii=False).encode("utf-8")
+        rows.append({
+            "state": label, "codec": "baseline", "bytes": len(raw),
+            "encode_us": _time(lambda: json.dumps(state.model_dump(mode="json"), ensure_ascii=False).encode(), n),
+            "decode_us": _time(lambda: TransferState.model_validate(json.loads(raw)), n),
+        })
+        for codec in ("json", "orjson", "msgpack", "binary"):
+            try:
+                data = encode_state(state, codec)
+            except ImportError:
+                continue
+            assert decode_state(data, TransferState, codec).model_dump() == state.model_dump()
+            rows.append({
+                "state": label, "codec": codec, "bytes": len(data),
+                "encode_us": _time(lambda: encode_state(state, codec), n),
+                "decode_us": _time(lambda: decode_state(data, TransferState, codec), n),
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{'state':<10} {'codec':<9} {'bytes':>6} {'encode µs':>10} {'decode µs':>10}")
+    for row in bench(n):
+        print(f"{row['state']:<10} {row['codec']:<9} {row['bytes']:>6} {row['encode_us']:>10.1f} {row['decode_us']:>10.1f}")
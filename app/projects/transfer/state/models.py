@@ -5,6 +5,7 @@
 ─── 상태 머신 흐름 ──────────────────────────────────────────────────────────
   INIT → FILLING → READY → CONFIRMED → EXECUTED
                                     ↘ FAILED
+                                    ↘ SUBMITTED (EXECUTION_MODE=async)
                ↘ CANCELLED
                ↘ UNSUPPORTED (반복 실패 초과)
 
@@ -15,6 +16,7 @@
   EXECUTED:    이체 성공. 세션 리셋 후 다음 이체를 받을 준비.
   FAILED:      이체 API 오류. 실패 안내 후 세션 리셋.
   CANCELLED:   사용자 취소. 세션 리셋.
+  SUBMITTED:   비동기 실행 접수 완료. 결과는 세션 이벤트 채널로 전달되고 세션은 리셋.
   UNSUPPORTED: filling_turns >= MAX_FILL_TURNS. 반복 실패로 처리 불가 안내.
 
 ─── 배치 이체 흐름 ──────────────────────────────────────────────────────────
@@ -30,6 +32,11 @@
     batch_progress: 지금까지 처리한 건수 (완료+취소)
     batch_executed: 성공한 건수
     last_cancelled: 직전 태스크가 취소됐는지 (확인 메시지 접두 제어용)
+    bulk_tasks:     일괄 확인 대기 중인 태스크 목록 (handlers.py _execute_bulk로 병렬 실행)
+    batch_failed:   일괄 실행 중 실패한 건의 슬롯 카드 목록
+    batch_submitted: 비동기 실행으로 접수한 건수
+    pending_jobs:   비동기 실행 Job ID 목록 (DONE payload로 전달)
+    execution_id:   idempotency key 접두 (세션 리셋 전까지 유지)
 """
 
 from datetime import date as _date
@@ -54,6 +61,7 @@ class Stage(str, Enum):
     EXECUTED    = "EXECUTED"
     FAILED      = "FAILED"
     CANCELLED   = "CANCELLED"
+    SUBMITTED   = "SUBMITTED"
     UNSUPPORTED = "UNSUPPORTED"
 
 
@@ -62,6 +70,7 @@ TERMINAL_STAGES = {
     Stage.EXECUTED,
     Stage.FAILED,
     Stage.CANCELLED,
+    Stage.SUBMITTED,
     Stage.UNSUPPORTED,
 }
 
@@ -1,6 +1,6 @@
 # app/projects/transfer/state/state_manager.py
 import re
-from datetime import datetime
+from datetime import date
 from typing import Any, Dict, Optional
 
 from app.core.state import BaseStateManager
@@ -13,6 +13,8 @@ from app.projects.transfer.state.models import (
     MAX_FILL_TURNS,
 )
 
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 
 def _normalize_format(value: Any, format_spec: Optional[str]) -> Any:
     if format_spec is None:
@@ -21,9 +23,9 @@ def _normalize_format(value: Any, format_spec: Optional[str]) -> Any:
         if value is None:
             return None
         s = str(value).strip()
-        if re.match(r"^\d{4}-\d{2}-\d{2}$", s):
+        if _ISO_DATE_RE.match(s):
             try:
-                datetime.strptime(s, "%Y-%m-%d")
+                date.fromisoformat(s)
                 return s
             except ValueError:
                 pass
@@ -31,15 +33,36 @@ def _normalize_format(value: Any, format_spec: Optional[str]) -> Any:
     return value
 
 
+def coerce_slot_value(slot: str, value: Any) -> tuple[Any, Optional[str]]:
+    """
+    SLOT_SCHEMA 기준 캐스팅 → 포맷 정규화 → 비즈니스 룰 검증.
+
+    Returns:
+        (정규화된 값, None) 또는 (None, 실패 단계 "cast" | "format" | "validation")
+    """
+    schema = SLOT_SCHEMA[slot]
+    casted = TransferStateManager._cast(value, schema["type"])
+    if casted is None:
+        return None, "cast"
+    normalized = _normalize_format(casted, schema.get("format"))
+    if normalized is None:
+        return None, "format"
+    validator = schema.get("validate")
+    if validator and not validator(normalized):
+        return None, "validation"
+    return normalized, None
+
+
 class TransferStateManager(BaseStateManager):
     def __init__(self, state: TransferState):
         super().__init__(state)
         self.state: TransferState = state
 
     def apply(self, delta: Dict[str, Any]) -> TransferState:
+        stage_before = self.state.stage
         if "_meta" in delta:
             meta = delta["_meta"]
-            self.state.meta.setdefault("slot_meta", []).append(meta)
+            self._record_meta("slot_meta", meta)
             if meta.get("parse_error") and self.state.stage in (Stage.INIT, Stage.FILLING, Stage.READY):
                 # SlotFiller가 LLM 응답을 JSON으로 파싱하지 못함.
                 # → InteractionAgent가 "이해하지 못했어요" 안내를 하도록 slot_errors에 신호.
@@ -56,6 +79,7 @@ class TransferStateManager(BaseStateManager):
             self._apply_op(op)
         self._validate_required()
         self._transition()
+        self._journal_delta(delta, stage_before)
         return self.state
 
     def _apply_op(self, op: Dict[str, Any]) -> None:
@@ -76,33 +100,16 @@ class TransferStateManager(BaseStateManager):
 
         slot = op.get("slot")
         if slot not in SLOT_SCHEMA:
-            self.state.meta.setdefault("invalid_ops", []).append(op)
+            self._record_meta("invalid_ops", op)
             return
 
-        schema = SLOT_SCHEMA[slot]
-        slot_type = schema["type"]
-        format_spec = schema.get("format")
-        validator = schema.get("validate")
-        error_msg = schema.get("error_msg", f"{slot} 값이 올바르지 않아요.")
+        error_msg = SLOT_SCHEMA[slot].get("error_msg", f"{slot} 값이 올바르지 않아요.")
 
         if op_type == "set":
-            # 1. 타입 캐스팅
-            casted = self._cast(op.get("value"), slot_type)
-            if casted is None:
-                self.state.meta.setdefault("cast_fail_ops", []).append(op)
-                self._set_slot_error(slot, error_msg)
-                return
-
-            # 2. 포맷 정규화 (날짜 등)
-            normalized = _normalize_format(casted, format_spec)
-            if normalized is None:
-                self.state.meta.setdefault("format_fail_ops", []).append(op)
-                self._set_slot_error(slot, error_msg)
-                return
-
-            # 3. 비즈니스 룰 검증
-            if validator and not validator(normalized):
-                self.state.meta.setdefault("validation_fail_ops", []).append(op)
+            # 타입 캐스팅 → 포맷 정규화(날짜 등) → 비즈니스 룰 검증
+            normalized, failed = coerce_slot_value(slot, op.get("value"))
+            if failed:
+                self._record_meta(f"{failed}_fail_ops", op)
                 self._set_slot_error(slot, error_msg)
                 return
 
@@ -1,14 +1,26 @@
 # app/projects/transfer/state/stores.py
 """
 이체 서비스 세션/이력 스토어.
-범용 구현은 app.core.state.stores에 있으며, 이체 State 팩토리만 주입한다.
+범용 구현은 app.core.state.stores·event_log·hibernation·shared_cache에 있으며, 이체 State 팩토리만 주입한다.
 """
+from app.core.config import settings
+from app.core.state.event_log import EventSourcedSessionStore
+from app.core.state.hibernation import HibernatingSessionStore
+from app.core.state.shared_cache import SharedMemorySessionStore
 from app.core.state.stores import InMemorySessionStore, InMemoryCompletedStore
 from app.projects.transfer.state.models import TransferState
 
 
-def SessionStore() -> InMemorySessionStore:
-    """TransferState를 기본값으로 사용하는 세션 스토어."""
+def SessionStore() -> (
+    InMemorySessionStore | EventSourcedSessionStore | HibernatingSessionStore | SharedMemorySessionStore
+):
+    """TransferState를 기본값으로 사용하는 세션 스토어 (SESSION_STORE로 구현 선택)."""
+    if settings.SESSION_STORE == "eventlog":
+        return EventSourcedSessionStore(state_factory=TransferState)
+    if settings.SESSION_STORE == "hibernate":
+        return HibernatingSessionStore(state_factory=TransferState)
+    if settings.SESSION_STORE == "shared":
+        return SharedMemorySessionStore(state_factory=TransferState)
     return InMemorySessionStore(state_factory=TransferState)
 
 
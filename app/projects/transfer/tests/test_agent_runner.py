@@ -0,0 +1,84 @@
+# app/projects/transfer/tests/test_agent_runner.py
+"""AgentRunner 실행 정책 테스트 (LLM 없음 — 가짜 에이전트)."""
+
+import json
+import time
+
+from app.core.agents import AgentRunner
+from app.core.agents.hedging import HedgePolicy
+from app.core.agents.shadow import ShadowEvaluator, report
+from app.core.context import ExecutionContext
+from app.projects.transfer.state.models import TransferState
+
+
+class _FakeAgent:
+    def __init__(self, result, model="fake"):
+        self.result = result
+        self.model = model
+
+    def run(self, context, **kwargs):
+        return dict(self.result)
+
+
+def _ctx() -> ExecutionContext:
+    return ExecutionContext(
+        session_id="s", user_message="엄마한테 5만원", state=TransferState(),
+        memory={"raw_history": [], "summary_text": "", "summary_struct": {}},
+    )
+
+
+def test_shadow_mirrors_call_and_logs_comparison(tmp_path):
+    log = tmp_path / "shadow.jsonl"
+    shadow = ShadowEvaluator(
+        _FakeAgent({"scenario": "TRANSFER", "reason": "x"}, model="nano"),
+        sample_rate=1.0, compare=["scenario"], log_path=str(log),
+    )
+    runner = AgentRunner(
+        agents={"intent": _FakeAgent({"scenario": "TRANSFER", "reason": None})},
+        shadow_by_name={"intent": shadow},
+    )
+    assert runner.run("intent", _ctx()) == {"scenario": "TRANSFER", "reason": None}
+    shadow.shutdown()
+
+    rows = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+    assert len(rows) == 1 and rows[0]["match"] is True and rows[0]["model"] == "nano"
+    assert report(rows)["intent@nano"]["match_rate"] == 1.0
+
+
+def test_cascade_escalates_on_parse_error_and_counts_tiers():
+    runner = AgentRunner(
+        agents={"slot": _FakeAgent({"operations": [{"op": "set"}]}, model="big")},
+        validator_map={"slot_ops": lambda r: isinstance(r.get("operations"), list)},
+        policy_by_name={"slot": {"validate": "slot_ops"}},
+        cascade_by_name={"slot": [
+            {"agent": _FakeAgent({"operations": [], "_meta": {"parse_error": True}}), "tier": "nano"},
+        ]},
+    )
+    assert runner.run("slot", _ctx()) == {"operations": [{"op": "set"}]}
+    stats = runner.tier_stats()["slot"]
+    assert stats["nano"]["escalations"] == 1
+    assert (stats["big"]["calls"], stats["big"]["escalations"]) == (1, 0)
+
+
+def test_hedge_takes_first_finisher_within_budget():
+    class _Slow(_FakeAgent):
+        def run(self, context, **kwargs):
+            time.sleep(0.5)
+            return super().run(context, **kwargs)
+
+    hedge = HedgePolicy(_FakeAgent({"scenario": "GENERAL"}), budget=1.0, default_delay_ms=20)
+    runner = AgentRunner(agents={"intent": _Slow({"scenario": "TRANSFER"})}, hedge_by_name={"intent": hedge})
+
+    started = time.monotonic()
+    assert runner.run("intent", _ctx()) == {"scenario": "GENERAL"}
+    assert time.monotonic() - started < 0.4
+    assert hedge.stats() == {"calls": 1, "hedges": 1, "hedge_wins": 1}
+
+
+def test_hedge_window_ignores_runs_without_llm_calls():
+    """로컬 분류기처럼 LLM 없이 끝난 실행(llm_calls == 0)은 hedge 지연 관측에 넣지 않는다."""
+    hedge = HedgePolicy(budget=0.0, min_samples=1, default_delay_ms=2000)
+    hedge.call(lambda agent: ({"scenario": "TRANSFER"}, {"llm_calls": 0}), None)
+    assert hedge.delay_sec() == 2.0
+    hedge.call(lambda agent: ({"scenario": "TRANSFER"}, {"llm_calls": 1}), None)
+    assert hedge.delay_sec() < 2.0
@@ -46,3 +46,79 @@ def test_orchestrate_chat_stream_endpoint_exists(client: TestClient):
         )
     assert resp.status_code == 200
     assert "text/event-stream" in resp.headers.get("content-type", "")
+
+
+def test_orchestrate_chat_stream_encodes_frames(client: TestClient):
+    """SSE 프레임: 토큰 fast path와 구조화 payload 모두 event/data 형식으로 인코딩."""
+    import json
+    from app.core.events import EventType
+    from app.main import orchestrator
+    def fake_stream(sid, msg):
+        yield {"event": EventType.LLM_TOKEN, "payload": "안"}
+        yield {"event": EventType.DONE, "payload": {"message": "완료", "ui_hint": {}}}
+    with patch.object(orchestrator, "handle_stream", side_effect=fake_stream):
+        resp = client.post(
+            "/v1/agent/chat/stream",
+            json={"session_id": "test-stream-frames", "message": "hi"},
+        )
+    frames = [f for f in resp.text.replace("\r\n", "\n").split("\n\n") if f.startswith("event:")]
+    assert frames[0] == 'event: LLM_TOKEN\ndata: "안"'
+    name, data = frames[1].split("\n", 1)
+    assert name == "event: DONE"
+    assert json.loads(data[len("data: "):]) == {"message": "완료", "ui_hint": {}}
+
+
+def test_batch_upload_loads_valid_rows_and_reports_errors(client: TestClient):
+    """POST /v1/agent/batch/upload: CSV 행 검증 후 세션에 일괄 확인 배치로 적재 (LLM 없음)."""
+    from app.main import orchestrator
+    body = (
+        "이름,금액,메모,이체일\n"
+        '홍길동,"50,000원",급여,2026.6.25\n'
+        "김철수,3만 5천원,,\n"
+        "박영희,0원,,\n"
+        "이민수,1만원,보너스,\n"
+        ",2만원,,\n"
+    ).encode("utf-8")
+    resp = client.post("/v1/agent/batch/upload", params={"session_id": "upload-session"}, content=body)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["accepted"] == 3 and data["rejected"] == 2
+    assert [e["row"] for e in data["errors"]] == [4, 6]
+    state, _ = orchestrator.sessions.get_or_create("upload-session")
+    assert state.stage == "READY" and state.meta["batch_total"] == 3
+    assert state.meta["bulk_tasks"][0] == {
+        "target": "홍길동", "amount": 50000, "memo": "급여", "transfer_date": "2026-06-25",
+    }
+
+
+def test_batch_upload_parses_compound_amounts_and_enforces_row_cap(client: TestClient, monkeypatch):
+    """단위가 섞인 금액은 정확히 환산되고 review로 표시, 행 한도를 넘으면 413."""
+    from app.core.config import settings
+    body = "이름,금액\n홍길동,2천5백만원\n김철수,30000\n".encode("utf-8")
+    resp = client.post("/v1/agent/batch/upload", params={"session_id": "upload-compound"}, content=body)
+    assert resp.status_code == 200
+    rows = resp.json()["rows"]
+    assert [(r["row"], r["amount"], r["amount_text"], r["review"]) for r in rows] == [
+        (2, 25_000_000, "2천5백만원", True), (3, 30000, "30000", False),
+    ]
+
+    monkeypatch.setattr(settings, "BATCH_UPLOAD_MAX_ROWS", 1)
+    resp = client.post("/v1/agent/batch/upload", params={"session_id": "upload-capped"}, content=body)
+    assert resp.status_code == 413
+
+
+def test_batch_upload_accepts_10k_rows_and_reports_physical_lines(client: TestClient):
+    """기본 한도로 1만 행 명단을 받고, 따옴표 안 줄바꿈이 있어도 오류 행은 파일의 줄 번호."""
+    body = "이름,금액\n" + "".join(f"수신자{i},{1000 + i}\n" for i in range(10_000))
+    resp = client.post("/v1/agent/batch/upload", params={"session_id": "upload-10k"}, content=body.encode("utf-8"))
+    assert resp.status_code == 200
+    assert resp.json()["accepted"] == 10_000
+
+    body = '이름,금액,메모\n홍길동,10000,"첫 줄\n둘째 줄"\n김철수,0원,\n'
+    resp = client.post("/v1/agent/batch/upload", params={"session_id": "upload-lines"}, content=body.encode("utf-8"))
+    assert [e["row"] for e in resp.json()["errors"]] == [4]
+
+
+def test_slot_rules_endpoint_reports_hit_rate(client: TestClient):
+    data = client.get("/v1/agent/slot-rules").json()
+    assert set(data) == {"hit", "miss", "hit_rate"} and 0.0 <= data["hit_rate"] <= 1.0
@@ -66,3 +66,268 @@ def test_default_flow_handler_yields_done():
     )
     events = list(handler.run(ctx))
     assert any(e.get("event") == EventType.DONE for e in events)
+
+
+def test_filling_rule_extraction_skips_slot_llm():
+    from app.projects.transfer.state.state_manager import TransferStateManager
+    from app.projects.transfer.state.models import Slots, Stage
+
+    runner = _mock_runner()
+    called = []
+    run = runner.run
+    runner.run = lambda name, ctx, **kw: called.append(name) or run(name, ctx, **kw)
+    handler = TransferFlowHandler(
+        runner=runner,
+        sessions=_mock_sessions(),
+        memory_manager=_mock_memory_manager(),
+        state_manager_factory=TransferStateManager,
+        completed=None,
+    )
+    state = TransferState(stage=Stage.FILLING, slots=Slots(target="엄마"), missing_required=["amount"])
+    ctx = ExecutionContext(
+        session_id="test-session",
+        user_message="3만 5천원",
+        state=state,
+        memory={"raw_history": [], "summary_text": "", "summary_struct": {}},
+    )
+    events = list(handler.run(ctx))
+    assert "slot" not in called
+    assert ctx.state.stage == Stage.READY and ctx.state.slots.amount == 35000
+    assert events[-1]["payload"]["action"] == "CONFIRM"
+
+
+def test_extract_slot_ops_falls_back_when_ambiguous():
+    from datetime import date
+    from app.projects.transfer.logic import extract_slot_ops
+
+    today = date(2026, 2, 18)
+    ops = extract_slot_ops("5만원 다음주 월요일 메모 생일", ["amount"], today=today)["operations"]
+    assert ops == [
+        {"op": "set", "slot": "amount", "value": 50000},
+        {"op": "set", "slot": "transfer_date", "value": "2026-02-23"},
+        {"op": "set", "slot": "memo", "value": "생일"},
+    ]
+    assert extract_slot_ops("용걸이 1만원, 엄마 2만원", ["target", "amount"], today=today) is None
+    assert extract_slot_ops("홍길동", ["target", "amount"], today=today) is None
+    assert extract_slot_ops("뭐라고요", ["target"], today=today) is None
+    assert extract_slot_ops("몰라", ["target"], today=today) is None
+    assert extract_slot_ops("괜찮아", ["target"], today=today) is None
+
+
+def test_parse_korean_amount_compound_units():
+    from app.projects.transfer.logic import extract_slot_ops, parse_korean_amount
+
+    cases = {
+        "2천5백만원": 25_000_000, "1만2천3백원": 12_300, "5백원": 500, "3만 5천원": 35_000,
+        "1억 2천만원": 120_000_000, "천만원": 10_000_000, "1.5만": 15_000, "50,000원": 50_000,
+    }
+    assert {text: parse_korean_amount(text) for text in cases} == cases
+    # 단위 순서가 어긋나거나 해석 못 한 글자가 남으면 None
+    for text in ("5천3천", "만억", "3 5", "12abc", "1.5"):
+        assert parse_korean_amount(text) is None, text
+    assert extract_slot_ops("2천5백만원", ["amount"]) == {
+        "operations": [{"op": "set", "slot": "amount", "value": 25_000_000}]
+    }
+
+
+def test_bulk_batch_single_confirm_parallel_execute():
+    from app.core.agents.agent_runner import FatalExecutionError
+    from app.projects.transfer.state.state_manager import TransferStateManager
+    from app.projects.transfer.state.models import Stage
+
+    tasks = [{"target": f"직원{i}", "amount": 10000 * (i + 1)} for i in range(4)]
+
+    class BulkRunner:
+        def run(self, agent_name, ctx, **kwargs):
+            if agent_name == "slot":
+                return {"tasks": tasks, "operations": []}
+            if agent_name == "execute":
+                if ctx.state.slots.target == "직원2":
+                    raise FatalExecutionError("limit exceeded")
+                return {"success": True}
+            return {}
+
+    handler = TransferFlowHandler(
+        runner=BulkRunner(),
+        sessions=_mock_sessions(),
+        memory_manager=_mock_memory_manager(),
+        state_manager_factory=TransferStateManager,
+        completed=None,
+    )
+    memory = {"raw_history": [], "summary_text": "", "summary_struct": {}}
+    ctx = ExecutionContext(session_id="s", user_message="급여 이체", state=TransferState(), memory=memory)
+    events = list(handler.run(ctx))
+    done = events[-1]["payload"]
+    assert ctx.state.stage == Stage.READY and len(done["batch_cards"]) == 4
+
+    ctx = ExecutionContext(session_id="s", user_message="확인", state=ctx.state, memory=memory)
+    events = list(handler.run(ctx))
+    progress = [e["payload"] for e in events if e["event"] == EventType.TASK_PROGRESS]
+    assert sorted(p["index"] for p in progress) == [1, 2, 3, 4]
+    assert [p["status"] for p in sorted(progress, key=lambda p: p["index"])] == ["done", "done", "failed", "done"]
+    done = events[-1]["payload"]
+    assert len(done["receipts"]) == 3 and len(done["failed_receipts"]) == 1
+    assert ctx.state.stage == Stage.INIT
+
+
+def test_bulk_batch_accepts_string_amounts_and_dates():
+    """LLM이 금액·날짜를 문자열로 줘도 정규화해 일괄 확인에 포함한다."""
+    from app.projects.transfer.flows.handlers import _split_bulk_tasks
+
+    ready, rest = _split_bulk_tasks([
+        {"target": "홍길동", "amount": "50000"},
+        {"target": "김철수", "amount": "5만원", "transfer_date": "2026-6-1"},
+        {"target": "박영희", "amount": "2천5백만원"},
+        {"target": "이민수", "amount": "많이"},
+    ])
+    assert ready == [
+        {"target": "홍길동", "amount": 50000},
+        {"target": "김철수", "amount": 50000, "transfer_date": "2026-06-01"},
+        {"target": "박영희", "amount": 25_000_000},
+    ]
+    assert rest == [{"target": "이민수", "amount": "많이"}]
+
+
+def test_large_batch_input_extracted_in_chunks():
+    import threading
+    from app.projects.transfer.state.state_manager import TransferStateManager
+
+    lines = [f"직원{i} {i + 1}만원" for i in range(12)]
+    calls, lock = [], threading.Lock()
+
+    class ChunkRunner:
+        def run(self, agent_name, ctx, **kwargs):
+            with lock:
+                calls.append(ctx.user_message)
+                first_try = calls.count(ctx.user_message) == 1
+            if "직원5" in ctx.user_message and first_try:
+                return {"operations": [], "_meta": {"parse_error": True}}
+            tasks = []
+            for line in ctx.user_message.splitlines():
+                name, amount = line.split()
+                tasks.append({"target": name, "amount": int(amount[:-2]) * 10000})
+            return {"tasks": tasks, "operations": []}
+
+    handler = TransferFlowHandler(
+        runner=ChunkRunner(),
+        sessions=_mock_sessions(),
+        memory_manager=_mock_memory_manager(),
+        state_manager_factory=TransferStateManager,
+        completed=None,
+    )
+    ctx = ExecutionContext(session_id="s", user_message="\n".join(lines), state=TransferState(),
+                           memory={"raw_history": [], "summary_text": "", "summary_struct": {}})
+    list(handler.run(ctx))
+    assert len(calls) == 4   # 5 + 5 + 2 청크, 파싱 실패한 두 번째 청크만 재시도
+    bulk = ctx.state.meta["bulk_tasks"]
+    assert [t["target"] for t in bulk] == [f"직원{i}" for i in range(12)]
+
+
+def test_chunk_extraction_falls_back_per_item_when_tasks_go_missing():
+    """여러 항목 청크에 태스크 하나만(operations) 돌아오면 재시도 후 항목별로 추출해 누락이 없다."""
+    from app.projects.transfer.state.state_manager import TransferStateManager
+
+    lines = [f"직원{i} {i + 1}만원" for i in range(8)]
+
+    class LossyRunner:
+        def run(self, agent_name, ctx, **kwargs):
+            name, amount = ctx.user_message.splitlines()[0].split()
+            return {"operations": [
+                {"op": "set", "slot": "target", "value": name},
+                {"op": "set", "slot": "amount", "value": int(amount[:-2]) * 10000},
+            ]}
+
+    handler = TransferFlowHandler(
+        runner=LossyRunner(),
+        sessions=_mock_sessions(),
+        memory_manager=_mock_memory_manager(),
+        state_manager_factory=TransferStateManager,
+        completed=None,
+    )
+    ctx = ExecutionContext(session_id="s", user_message="\n".join(lines), state=TransferState(),
+                           memory={"raw_history": [], "summary_text": "", "summary_struct": {}})
+    list(handler.run(ctx))
+    assert [t["target"] for t in ctx.state.meta["bulk_tasks"]] == [f"직원{i}" for i in range(8)]
+
+
+def test_batch_chunks_carry_shared_instruction_lines():
+    """"이름 금액" 형태가 아닌 공통 지시 줄은 항목 수에서 빠지고 모든 청크 앞에 붙는다."""
+    from app.projects.transfer.logic import chunk_batch_items
+
+    header = "아래 사람들한테 메모는 회비로 보내줘"
+    lines = [f"직원{i} {i + 1}만원" for i in range(7)]
+    assert chunk_batch_items("\n".join([header] + lines), min_items=8, size=5) == []
+    chunks = chunk_batch_items("\n".join([header] + lines + ["막내 1만원"]), min_items=8, size=5)
+    assert len(chunks) == 2 and all(c.splitlines()[0] == header for c in chunks)
+    # 이름만 나열하고 금액은 머리줄에만 있으면 청크로 나누지 않는다 (전체 발화로 추출)
+    names = "각각 1만원씩 보내줘. 메모는 회비\n" + "\n".join(["홍길동", "김철수", "이영희"] * 3)
+    assert chunk_batch_items(names, min_items=8, size=5) == []
+
+
+def test_async_execution_returns_pending_receipt_and_publishes_result(monkeypatch):
+    import time
+    from app.core.config import settings
+    from app.core.execution import get_channel, get_executor
+    from app.projects.transfer.agents.transfer_execute_agent import TransferExecuteAgent
+    from app.projects.transfer.bank_api import MockBankAPI, set_bank_api
+    from app.projects.transfer.state.state_manager import TransferStateManager
+    from app.projects.transfer.state.models import Slots, Stage
+
+    bank = MockBankAPI(latency_sec=0.3)
+    set_bank_api(bank)
+    monkeypatch.setattr(settings, "EXECUTION_MODE", "async")
+    agent = TransferExecuteAgent(system_prompt="")
+
+    class ExecRunner:
+        def run(self, agent_name, ctx, **kwargs):
+            return agent.run(ctx, **kwargs)
+
+    handler = TransferFlowHandler(
+        runner=ExecRunner(),
+        sessions=_mock_sessions(),
+        memory_manager=_mock_memory_manager(),
+        state_manager_factory=TransferStateManager,
+        completed=None,
+    )
+    state = TransferState(stage=Stage.READY, slots=Slots(target="엄마", amount=50000))
+    ctx = ExecutionContext(session_id="async-s", user_message="확인", state=state,
+                           memory={"raw_history": [], "summary_text": "", "summary_struct": {}})
+    try:
+        started = time.monotonic()
+        events = list(handler.run(ctx))
+        assert time.monotonic() - started < bank.latency_sec
+        done = events[-1]["payload"]
+        assert done["receipt_status"] == "PENDING" and len(done["pending_jobs"]) == 1
+
+        results = []
+        deadline = time.monotonic() + 5
+        while not results and time.monotonic() < deadline:
+            results = [e for e in get_channel().wait("async-s", 0, timeout=1)
+                       if e["event"] == EventType.EXECUTION_DONE]
+        assert results[0]["payload"]["status"] == "SUCCEEDED"
+        assert results[0]["payload"]["result"]["transaction_id"].startswith("mock-tx-")
+
+        # 같은 idempotency key로 재접수 → 기존 작업 반환, 은행 API 중복 호출 없음
+        job = get_executor().get(done["pending_jobs"][0])
+        again, created = get_executor().submit(job.key, "async-s", lambda: None)
+        assert again is job and not created and bank.calls == 1
+    finally:
+        set_bank_api(None)
+
+
+def test_event_channel_wait_async_wakes_on_publish_from_worker_thread():
+    """SSE 구독(wait_async)은 이벤트 루프에서 대기하고, 작업 스레드의 publish로 깨어난다."""
+    import asyncio
+    import threading
+    from app.core.execution import SessionEventChannel
+
+    channel = SessionEventChannel()
+
+    async def subscribe():
+        assert await channel.wait_async("ch-s", 0, timeout=0.05) == []
+        threading.Timer(0.05, channel.publish, ("ch-s", {"event": "X", "payload": {}})).start()
+        return await channel.wait_async("ch-s", 0, timeout=5)
+
+    events = asyncio.run(subscribe())
+    assert [e["seq"] for e in events] == [1]
+    assert not channel._waiters
@@ -0,0 +1,47 @@
+# app/projects/transfer/tests/test_intent_local.py
+"""IntentAgent 로컬 사전 분류기 테스트 (LLM 호출 없음)."""
+
+from app.core.context import ExecutionContext
+from app.core.local_classifier import LocalTextClassifier
+from app.projects.transfer.agents.intent_agent.agent import IntentAgent
+from app.projects.transfer.state.models import TransferState
+
+_TEXTS = [
+    "엄마한테 5만원 보내줘", "홍길동에게 이체해줘", "송금하고 싶어", "아빠한테 10만원 송금",
+    "오늘 날씨 어때", "안녕하세요", "고마워", "뭐 할 수 있어",
+]
+_LABELS = ["TRANSFER"] * 4 + ["GENERAL"] * 4
+
+
+def _ctx(text: str) -> ExecutionContext:
+    return ExecutionContext(
+        session_id="s", user_message=text, state=TransferState(),
+        memory={"raw_history": [], "summary_text": "", "summary_struct": {}},
+    )
+
+
+def _agent(tmp_path, **cfg) -> IntentAgent:
+    path = tmp_path / "local_model.npz"
+    LocalTextClassifier.train(_TEXTS, _LABELS).save(path)
+    return IntentAgent(system_prompt="", local_classifier={"model_path": str(path), **cfg})
+
+
+def test_confident_local_prediction_skips_llm(tmp_path):
+    agent = _agent(tmp_path, threshold=0.6)
+    agent.chat = lambda *a, **k: (_ for _ in ()).throw(AssertionError("LLM called"))
+    result = agent.run(_ctx("동생한테 3만원 보내줘"))
+    assert result["scenario"] == "TRANSFER"
+    assert result["reason"].startswith("local:")
+
+
+def test_shadow_mode_always_calls_llm(tmp_path, monkeypatch):
+    import json
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "LOG_DIR", str(tmp_path))
+    agent = _agent(tmp_path, threshold=0.0, shadow=True)
+    agent.chat = lambda *a, **k: "GENERAL"
+    assert agent.run(_ctx("동생한테 3만원 보내줘")) == {"scenario": "GENERAL", "reason": None}
+    # log_path 없이도 shadow 평가용 턴 로그가 LOG_DIR에 남는다
+    row = json.loads((tmp_path / "intent_turns.jsonl").read_text(encoding="utf-8"))
+    assert row["label"] == "GENERAL" and row["local"] == "TRANSFER"
@@ -0,0 +1,213 @@
+# app/projects/transfer/tests/test_llm_clients.py
+"""LLM 클라이언트 계층(라우팅 등) 테스트 — 실제 프로바이더 호출 없음."""
+
+import pytest
+
+from app.core.llm import LLMResponse, create_llm_client
+from app.core.llm.circuit_breaker import CircuitBreakerClient, get_breaker
+
+
+class _FakeClient:
+    def __init__(self, reply=None, error=None):
+        self.reply, self.error, self.calls = reply, error, []
+
+    def chat(self, *, model, **kwargs):
+        self.calls.append(model)
+        if self.error:
+            raise self.error
+        return LLMResponse(content=self.reply)
+
+    def chat_stream(self, *, model, **kwargs):
+        self.calls.append(model)
+        if self.error:
+            raise self.error
+        yield from self.reply
+
+
+def _chat(client, **kwargs):
+    return client.chat(model="default", temperature=0, system_prompt="", messages=[], **kwargs)
+
+
+def test_router_fails_over_and_maps_models():
+    down = _FakeClient(error=ConnectionError("down"))
+    up = _FakeClient(reply="ok")
+    router = create_llm_client("router", backends=[
+        {"provider": "p1", "model": "m-down", "client": CircuitBreakerClient(down, "p1"), "weight": 1000},
+        {"provider": "p2", "client": CircuitBreakerClient(up, "p2"), "weight": 0.001},
+    ])
+    for _ in range(5):
+        assert _chat(router).content == "ok"
+    assert up.calls == ["default"] * 5   # backend model 미지정 → 요청 model 사용
+    assert router.stats("default")["p1:m-down"]["state"] == "OPEN"
+    # breaker OPEN → 더 이상 down 백엔드를 호출하지 않는다
+    _chat(router)
+    assert len(down.calls) == 5
+
+
+def test_circuit_breaker_opens_fast_fails_and_recovers():
+    from app.core.llm.circuit_breaker import CircuitOpenError, recent_transitions
+
+    breaker = get_breaker("p3", "m")
+    breaker.open_sec = 0.0
+    client = CircuitBreakerClient(_FakeClient(error=TimeoutError("slow")), "p3")
+    for _ in range(breaker.min_calls):
+        with pytest.raises(TimeoutError):
+            client.chat(model="m")
+    assert breaker.state == "OPEN"
+
+    breaker.open_sec = 60.0
+    with pytest.raises(CircuitOpenError):
+        client.chat(model="m")
+
+    breaker.open_sec = 0.0
+    client.client = _FakeClient(reply="ok")
+    assert client.chat(model="m").content == "ok"   # HALF_OPEN 시험 호출 성공 → CLOSED
+    assert [t["to"] for t in recent_transitions() if t["key"] == "p3:m"] == ["OPEN", "HALF_OPEN", "CLOSED"]
+
+
+def test_rate_limiter_serves_priority_first_and_sheds_when_full():
+    import threading
+    import time
+    from app.core.llm.rate_limiter import RateLimitedError, RateLimiter
+
+    limiter = RateLimiter("t:m", rpm=600, max_wait_sec=1.0, max_queue=2)   # 10 req/s
+    limiter._buckets[0][0].tokens = 0.0
+    order = []
+
+    def worker(prio):
+        limiter.acquire(1, prio)
+        order.append(prio)
+
+    threads = [threading.Thread(target=worker, args=(3,)), threading.Thread(target=worker, args=(0,))]
+    threads[0].start()
+    time.sleep(0.02)
+    threads[1].start()
+    time.sleep(0.02)
+    with pytest.raises(RateLimitedError):   # 대기열 포화 → 즉시 거절
+        limiter.acquire(1, 0)
+    for t in threads:
+        t.join()
+    assert order == [0, 3]
+
+
+def test_scheduler_interleaves_sessions_and_runs_background_last():
+    import threading
+    import time
+    from app.core.llm.scheduler import LLMScheduler
+
+    sched = LLMScheduler(max_concurrency=1, background_max=1)
+    order, gate = [], threading.Event()
+
+    def settle(key, value):
+        # 스레드가 슬롯을 잡거나 대기열에 들어갈 때까지 — 도착 순서를 sleep 대신 상태로 맞춘다
+        while sched.snapshot()[key] != value:
+            time.sleep(0.001)
+
+    def hold():
+        with sched.slot(1, "blocker", 1):
+            gate.wait()
+
+    def work(label, prio, session):
+        with sched.slot(prio, session, 10):
+            order.append(label)
+
+    threads = [threading.Thread(target=hold)]
+    threads[0].start()
+    settle("running", 1)
+    for queued, args in enumerate([("summary", 3, None), ("a1", 1, "A"), ("a2", 1, "A"),
+                                   ("a3", 1, "A"), ("b1", 1, "B")], start=1):
+        t = threading.Thread(target=work, args=args)
+        t.start()
+        threads.append(t)
+        settle("queued", queued)
+    gate.set()
+    for t in threads:
+        t.join()
+    assert order == ["a1", "b1", "a2", "a3", "summary"]
+
+
+def test_identical_deterministic_calls_share_one_upstream_call():
+    import threading
+    import time
+    from app.core.llm.coalescing import CoalescingClient
+
+    class _Slow(_FakeClient):
+        def chat(self, **kwargs):
+            time.sleep(0.1)
+            return super().chat(**kwargs)
+
+        def chat_stream(self, **kwargs):
+            time.sleep(0.1)
+            yield from super().chat_stream(**kwargs)
+
+    upstream = _Slow(reply="확인")
+    client = CoalescingClient(upstream, "p4")
+    msgs = [{"role": "user", "content": "확인"}]
+    results = []
+
+    def call(stream):
+        kw = dict(model="m", temperature=0, system_prompt="s", messages=msgs)
+        results.append("".join(client.chat_stream(**kw)) if stream else client.chat(**kw).content)
+
+    for stream in (False, True):
+        threads = [threading.Thread(target=call, args=(stream,)) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert results == ["확인"] * 8
+    assert len(upstream.calls) == 2
+    # temperature > 0 은 공유하지 않는다
+    client.chat(model="m", temperature=0.7, system_prompt="s", messages=msgs)
+    assert len(upstream.calls) == 3
+
+
+def test_hedge_bypasses_coalescing_with_primary():
+    """temperature 0 hedge는 primary의 진행 중 호출에 합류하지 않고 업스트림을 따로 호출한다."""
+    import time
+    from app.core.agents.hedging import HedgePolicy
+    from app.core.llm.coalescing import CoalescingClient
+
+    class _FirstSlow(_FakeClient):
+        def chat(self, **kwargs):
+            if not self.calls:
+                self.calls.append("slow")
+                time.sleep(1.0)
+                return LLMResponse(content=self.reply)
+            return super().chat(**kwargs)
+
+    upstream = _FirstSlow(reply="TRANSFER")
+    client = CoalescingClient(upstream, "p5")
+
+    class _Agent:
+        def run(self):
+            return client.chat(model="m", temperature=0, system_prompt="s",
+                               messages=[{"role": "user", "content": "보내줘"}]).content
+
+    hedge = HedgePolicy(budget=1.0, default_delay_ms=50)
+    started = time.monotonic()
+    assert hedge.call(lambda agent: agent.run(), _Agent()) == "TRANSFER"
+    assert time.monotonic() - started < 0.5
+    assert len(upstream.calls) == 2
+    assert hedge.stats()["hedge_wins"] == 1
+
+
+def test_background_summary_resaves_session(monkeypatch):
+    """요약은 턴의 save_state 뒤에 끝나므로 on_summarized로 세션을 다시 저장한다."""
+    import threading
+    from app.core.config import settings
+    from app.core.memory import MemoryManager
+
+    monkeypatch.setattr(settings, "MEMORY_SUMMARY_IN_BACKGROUND", True)
+    manager = MemoryManager(enable_summary=True, summarize_threshold=2, keep_recent_turns=1)
+    release = threading.Event()
+    monkeypatch.setattr(manager, "_call_llm", lambda messages, prev: release.wait(5) and "엄마에게 3만원 보냄")
+    memory, saved = {"raw_history": [], "summary_text": ""}, []
+
+    manager.update(memory, "엄마한테 3만원", "보낼까요?")
+    manager.update(memory, "응", "완료했어요", on_summarized=lambda: saved.append(memory["summary_text"]))
+    future = manager.pending(memory)
+    assert future is not None and not saved
+    release.set()
+    future.result(timeout=5)
+    assert saved == ["엄마에게 3만원 보냄"] and len(memory["raw_history"]) == 2
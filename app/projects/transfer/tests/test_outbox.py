@@ -0,0 +1,97 @@
+# app/projects/transfer/tests/test_outbox.py
+"""HookOutbox 기록·전달·종료 테스트 (SQLite 임시 파일)."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from app.core.context import ExecutionContext
+from app.core.execution import HookOutbox
+from app.projects.transfer.state.models import TransferState
+
+
+def _ctx() -> ExecutionContext:
+    return ExecutionContext(
+        session_id="s", user_message="엄마한테 5만원", state=TransferState(),
+        memory={"raw_history": [], "summary_text": "", "summary_struct": {}},
+    )
+
+
+def test_hook_outbox_retries_then_dead_letters(tmp_path):
+    calls = {"flaky": 0, "broken": 0}
+    seen = []
+
+    def flaky(ctx, data):
+        calls["flaky"] += 1
+        if calls["flaky"] == 1:
+            raise RuntimeError("push timeout")
+        seen.append((ctx.session_id, ctx.state.stage, ctx.memory["summary_text"], data, ctx.metadata["attempt"]))
+
+    def broken(ctx, data):
+        calls["broken"] += 1
+        raise RuntimeError("down")
+
+    outbox = HookOutbox(
+        {"flaky": flaky, "broken": broken}, state_model=TransferState,
+        path=str(tmp_path / "outbox.db"), max_attempts=2, backoff_sec=0, poll_sec=0.01,
+    )
+    outbox.enqueue("flaky", _ctx(), {"amount": 50000})
+    outbox.enqueue("broken", _ctx(), {})
+
+    deadline = time.time() + 5
+    while time.time() < deadline and outbox.stats() != {"pending": 0, "inflight": 0, "dead": 1}:
+        time.sleep(0.01)
+    [dead] = outbox.dead_letters()
+    outbox.close()
+
+    assert seen == [("s", "INIT", "", {"amount": 50000}, 2)]
+    assert calls["broken"] == 2
+    assert dead["hook_type"] == "broken" and dead["attempts"] == 2 and "down" in dead["last_error"]
+
+
+def test_hook_outbox_enqueue_raises_when_commit_fails(tmp_path):
+    outbox = HookOutbox({"noop": lambda ctx, data: None}, path=str(tmp_path / "outbox.db"), poll_sec=0.01)
+    with outbox._db_lock:
+        outbox._db.execute("DROP TABLE outbox")
+    with pytest.raises(sqlite3.OperationalError):
+        outbox.enqueue("noop", _ctx(), {})
+    outbox.close()
+
+
+def test_hook_outbox_claims_each_hook_type_fairly(tmp_path):
+    """먼저 쌓인 한 타입의 레코드가 많아도 다른 타입은 자기 한도만큼 함께 전달된다."""
+    gate, started = threading.Event(), []
+
+    def slow(ctx, data):
+        started.append("slow")
+        gate.wait(5)
+
+    def fast(ctx, data):
+        started.append("fast")
+
+    outbox = HookOutbox({"slow": slow, "fast": fast}, path=str(tmp_path / "outbox.db"),
+                        workers=4, limits={"slow": 1}, poll_sec=0.01)
+    try:
+        for _ in range(40):
+            outbox.enqueue("slow", _ctx(), {})
+        outbox.enqueue("fast", _ctx(), {})
+        deadline = time.time() + 5
+        while time.time() < deadline and "fast" not in started:
+            time.sleep(0.01)
+        assert "fast" in started and started.count("slow") == 1
+    finally:
+        gate.set()
+        outbox.close()
+
+
+def test_hook_outbox_close_stops_writer_and_closes_db(tmp_path):
+    outbox = HookOutbox({"noop": lambda ctx, data: None}, path=str(tmp_path / "outbox.db"), poll_sec=0.01)
+    outbox.enqueue("noop", _ctx(), {})
+    outbox.close()
+    assert not outbox._writer.is_alive() and not outbox._dispatcher.is_alive()
+    with pytest.raises(sqlite3.ProgrammingError):
+        outbox._db.execute("SELECT 1")
+    with pytest.raises(RuntimeError):
+        outbox.enqueue("noop", _ctx(), {})
@@ -0,0 +1,144 @@
+# app/projects/transfer/tests/test_service_router.py
+"""SuperOrchestrator 서비스 라우터 단위 테스트 (LLM 없음)."""
+
+import pytest
+
+from app.core.orchestration import KeywordServiceRouter
+
+
+def _keyword_router():
+    return KeywordServiceRouter(
+        rules={
+            "transfer": ["이체", "송금", "보내"],
+            "balance":  {"잔액": 2.0, "조회": 1.0, "이체내역": 1.0},
+            "card":     ["카드", "발급"],
+        },
+        default="transfer",
+    )
+
+
+def test_keyword_router_prefers_longest_match():
+    """'이체내역' 안의 '이체'는 별도 매치로 인정하지 않는다."""
+    assert _keyword_router().route("이체내역 보여줘", {}) == "balance"
+    # 부분적으로 겹치는 매치도 위치가 아니라 길이로 결정
+    router = KeywordServiceRouter(rules={"transfer": ["이체"], "card": ["체크카드 발급"]}, default="transfer")
+    assert router.route("이체크카드 발급해줘", {}) == "card"
+    # 같은 위치에서 끝나는 짧은 키워드도 찾는다 — 긴 쪽("zab")이 겹쳐 탈락하면 "ab"가 채택된다
+    router = KeywordServiceRouter(rules={"a": ["wxyz"], "b": ["zab"], "c": ["ab"]}, default="b")
+    assert {kw for _, kw, _ in router._automaton.find("wxyzab")} == {"wxyz", "zab", "ab"}
+    assert router.route("wxyzab", {"current_service": None}) == "a"
+    router = KeywordServiceRouter(rules={"c": ["ab"], "a": ["wxyz"], "b": ["zab"]}, default="b")
+    assert router.route("wxyzab", {}) == "c"
+
+
+def test_keyword_router_weighted_score_and_tie_order():
+    router = _keyword_router()
+    assert router.route("잔액 조회해줘", {}) == "balance"
+    # 동점 → rules에 먼저 등록된 서비스
+    assert router.route("카드로 보내줘", {}) == "transfer"
+
+
+def test_keyword_router_session_affinity():
+    router = _keyword_router()
+    assert router.route("카드로 보내줘", {"current_service": "card"}) == "card"
+    # 키워드 없는 후속 발화는 진행 중 서비스에 머문다
+    assert router.route("5만원", {"current_service": "balance"}) == "balance"
+    assert router.route("5만원", {"current_service": None}) == "transfer"
+
+
+def test_semantic_router_routes_and_falls_back():
+    from app.core.orchestration import SemanticServiceRouter
+
+    router = SemanticServiceRouter(
+        exemplars={
+            "transfer": ["엄마한테 5만원 보내줘", "홍길동에게 이체해줘", "송금하고 싶어"],
+            "balance":  ["잔액 얼마야", "통장에 돈 얼마 남았어", "내 잔액 알려줘"],
+        },
+        default="transfer",
+        fallback=KeywordServiceRouter(rules={"card": ["카드"]}, default="transfer"),
+    )
+    assert router.route("아빠한테 3만원 보내줘", {}) == "transfer"
+    assert router.route_batch(["잔액 좀 알려줄래", "카드 만들래"], [{}, {}]) == ["balance", "card"]
+
+
+def test_worker_supervisor_keeps_sessions_across_rebalance(tmp_path):
+    """워커 추가·재기동·제거 후에도 세션은 해시 링의 새 소유 워커에 state 그대로 남는다."""
+    from app.core.api.router_factory import _session_snapshot
+    from app.core.orchestration import HashRing, WorkerSupervisor
+    from app.projects.transfer.api import _load_batch
+
+    ring = HashRing(["w0", "w1"])
+    sids = [f"sup-{i}" for i in range(40)]
+    before = {sid: ring.owner(sid) for sid in sids}
+    ring.add("w2")
+    # 일관 해싱: 옮겨간 세션은 모두 새 워커로
+    assert all(ring.owner(sid) in (before[sid], "w2") for sid in sids)
+
+    supervisor = WorkerSupervisor("app.projects.transfer.manifest:load_manifest", workers=2,
+                                  socket_dir=str(tmp_path))
+    try:
+        for i, sid in enumerate(sids):
+            supervisor.call_in_session(sid, _load_batch, [{"target": "홍길동", "amount": 1000 + i}])
+        supervisor.add_worker()
+        supervisor.recycle("w0")
+        supervisor.remove_worker("w1")
+
+        for i, sid in enumerate(sids):
+            assert supervisor.call_in_session(sid, _session_snapshot)["state"]["slots"]["amount"] == 1000 + i
+        metrics = supervisor.worker_metrics()
+        assert [w["id"] for w in metrics["workers"]] == ["w0", "w2"]
+        assert sum(w["sessions"] for w in metrics["workers"]) == len(sids)
+        assert metrics["recycled"] == 1
+    finally:
+        supervisor.close()
+
+
+def test_worker_supervisor_refuses_async_execution_mode(monkeypatch, tmp_path):
+    """async 실행 결과는 워커 채널에만 발행되므로 /events로 전달할 수 없다 — 시작 시 거절."""
+    from app.core.config import settings
+    from app.core.orchestration import WorkerSupervisor
+
+    monkeypatch.setattr(settings, "EXECUTION_MODE", "async")
+    with pytest.raises(ValueError, match="EXECUTION_MODE=async"):
+        WorkerSupervisor("app.projects.transfer.manifest:load_manifest", workers=1, socket_dir=str(tmp_path))
+
+
+def test_worker_recycle_while_stream_open_keeps_event_loop_free(tmp_path):
+    """스트림이 열린 채 워커가 drain 대기 중이어도 엔드포인트는 루프를 막지 않고 재기동 뒤 응답한다."""
+    import asyncio
+    import threading
+    import time
+
+    from app.core.api.router_factory import create_agent_router
+    from app.core.orchestration import WorkerSupervisor
+
+    supervisor = WorkerSupervisor("app.projects.transfer.manifest:load_manifest", workers=1,
+                                  socket_dir=str(tmp_path))
+    router = create_agent_router(supervisor)
+    list_completed = next(r.endpoint for r in router.routes if r.path == "/v1/agent/completed")
+    stream = supervisor.handle_stream("open-stream", "안녕")
+    try:
+        next(stream)  # 진행 중 요청 1건 — recycle의 drain이 이 스트림을 기다린다
+        recycler = threading.Thread(target=supervisor.recycle, args=("w0",), daemon=True)
+        recycler.start()
+        deadline = time.monotonic() + 30
+        while "w0" not in supervisor._paused and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "w0" in supervisor._paused
+
+        async def scenario():
+            call = asyncio.ensure_future(list_completed(session_id="open-stream"))
+            started = time.monotonic()
+            await asyncio.sleep(0.1)
+            assert time.monotonic() - started < 1.0  # 루프가 _acquire 대기에 막히지 않았다
+            assert not call.done()
+            await asyncio.get_running_loop().run_in_executor(None, stream.close)
+            return await asyncio.wait_for(call, timeout=30)
+
+        assert asyncio.run(scenario())["completed"] == []
+        recycler.join(timeout=30)
+        assert not recycler.is_alive()
+        assert supervisor.worker_metrics()["recycled"] == 1
+    finally:
+        stream.close()
+        supervisor.close()
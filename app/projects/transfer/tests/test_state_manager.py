@@ -0,0 +1,238 @@
+# app/projects/transfer/tests/test_state_manager.py
+"""TransferStateManager 단위 테스트 (LLM 없음)."""
+
+import pytest
+
+from app.core.codec import CodecError, decode_state, encode_state, register_upgrade
+from app.core.state import (
+    BaseState,
+    EventSourcedSessionStore,
+    HibernatingSessionStore,
+    SessionOverflow,
+    SharedMemorySessionStore,
+    SharedSessionCache,
+)
+from app.projects.transfer.state.models import Stage, TransferState
+from app.projects.transfer.state.state_manager import TransferStateManager
+
+
+def test_meta_diagnostics_are_bounded():
+    """긴 FILLING 세션에서도 진단 로그는 최근 N건만 유지되고 횟수는 누적된다."""
+    state = TransferState()
+    limit = TransferStateManager.META_LOG_MAX
+    for _ in range(limit * 4):
+        state = TransferStateManager(state).apply({
+            "operations": [{"op": "set", "slot": "amount", "value": "abc"}],
+            "_meta": {"parse_error": True},
+        })
+
+    assert len(state.meta["cast_fail_ops"]) == limit
+    assert len(state.meta["slot_meta"]) == limit
+    assert state.meta["meta_counts"]["cast_fail_ops"] == limit * 4
+    assert state.meta["meta_counts"]["slot_meta"] == limit * 4
+
+
+def test_set_slots_transitions_to_ready():
+    state = TransferStateManager(TransferState()).apply({"operations": [
+        {"op": "set", "slot": "target", "value": "홍길동"},
+        {"op": "set", "slot": "amount", "value": 50000},
+    ]})
+    assert state.stage == Stage.READY
+    assert state.missing_required == []
+
+
+def test_event_log_store_rehydrates_from_snapshot_and_tail(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    store = EventSourcedSessionStore(state_factory=TransferState, path=path, snapshot_every=2)
+    state, _ = store.get_or_create("s1")
+    for ops in (
+        [{"op": "set", "slot": "target", "value": "홍길동"}],
+        [{"op": "set", "slot": "amount", "value": 50000}],
+        [{"op": "set", "slot": "memo", "value": "생일"}],
+    ):
+        state = TransferStateManager(state).apply({"operations": ops})
+        store.save_state("s1", state)
+    store.save_state("s1", state)   # 변화 없음 → 이벤트 없음
+
+    events = store.history("s1")
+    assert [e["seq"] for e in events] == [1, 2, 3]
+    assert events[1]["journal"] == [{
+        "ops": [{"op": "set", "slot": "amount", "value": 50000}],
+        "stage": ["FILLING", "READY"],
+    }]
+
+    # journal은 소비하는 저장소가 켠 state에만 쌓인다
+    plain = TransferStateManager(TransferState()).apply({"operations": [{"op": "set", "slot": "target", "value": "엄마"}]})
+    assert plain.drain_journal() == [] and plain._journal is None
+
+    restored, memory = EventSourcedSessionStore(state_factory=TransferState, path=path).get_or_create("s1")
+    assert restored.model_dump() == state.model_dump()
+    assert restored.stage == Stage.READY and memory["raw_history"] == []
+
+
+def test_state_codecs_round_trip_and_upgrade_old_versions():
+    state = TransferState(stage=Stage.READY, task_queue=[{"target": "엄마", "amount": 1000}] * 3)
+    state.slots.target, state.slots.amount = "홍길동", 50000
+    for codec in ("json", "orjson", "binary"):
+        assert decode_state(encode_state(state, codec), TransferState, codec).model_dump() == state.model_dump()
+
+    class NoteV1(BaseState):
+        note: str = ""
+
+    class NoteV2(BaseState):
+        SCHEMA_VERSION = 2
+        text: str = ""
+        pinned: bool = False
+
+    old = encode_state(NoteV1(note="월세"), "binary")
+    with pytest.raises(CodecError):
+        decode_state(old, NoteV2, "binary")   # 레이아웃이 바뀌었는데 이전 버전 정보 없음
+
+    register_upgrade(
+        NoteV2, 1, lambda doc: {**doc, "text": doc.pop("note")},
+        layout=["scenario", "stage", "meta", "task_queue", "note"],
+    )
+    assert decode_state(old, NoteV2, "binary").text == "월세"
+    assert decode_state(encode_state(NoteV1(note="월세"), "json"), NoteV2, "json").text == "월세"
+
+
+def test_hibernating_store_spills_idle_sessions_and_rehydrates(tmp_path):
+    store = HibernatingSessionStore(
+        state_factory=TransferState, path=str(tmp_path / "cold.db"), idle_sec=0, hot_max=100, sweep_sec=3600,
+    )
+    state, memory = store.get_or_create("s1")
+    state = TransferStateManager(state).apply({"operations": [{"op": "set", "slot": "target", "value": "엄마"}]})
+    memory["raw_history"].append({"role": "user", "content": "엄마한테 보내줘"})
+    store.save_state("s1", state)
+
+    assert store.hibernate_idle() == 1
+    assert store.metrics()["hot"] == 0 and store.metrics()["cold"] == 1
+
+    restored, restored_memory = store.get_or_create("s1")
+    assert restored.slots.target == "엄마" and restored.stage == Stage.FILLING
+    assert restored_memory["raw_history"] == [{"role": "user", "content": "엄마한테 보내줘"}]
+    m = store.metrics()
+    assert (m["hot"], m["cold"], m["misses"], m["hibernated"]) == (1, 0, 1, 1)
+
+
+def test_hibernating_store_caps_hot_tier(tmp_path):
+    store = HibernatingSessionStore(
+        state_factory=TransferState, path=str(tmp_path / "cold.db"), idle_sec=3600, hot_max=2, sweep_sec=3600,
+    )
+    for i in range(5):
+        store.get_or_create(f"s{i}")
+    assert store.metrics()["hot"] == 2 and store.metrics()["cold"] == 3
+
+
+def test_hibernating_store_never_evicts_pinned_sessions(tmp_path):
+    """턴 진행 중(pin)인 세션은 유휴·용량 초과여도 동면하지 않아 memory 쓰기가 유실되지 않는다."""
+    store = HibernatingSessionStore(
+        state_factory=TransferState, path=str(tmp_path / "cold.db"), idle_sec=0, hot_max=1, sweep_sec=3600,
+    )
+    store.pin("busy")
+    _, memory = store.get_or_create("busy")
+    store.get_or_create("other")                       # 용량 초과 → busy가 LRU 맨 앞이지만 유지
+    memory["raw_history"].append({"role": "user", "content": "턴 도중 기록"})
+    assert store.hibernate_idle() == 1                 # other만 동면
+    assert store.metrics()["pinned"] == 1
+
+    store.unpin("busy")
+    assert store.hibernate_idle() == 1
+    assert store.get_or_create("busy")[1]["raw_history"][0]["content"] == "턴 도중 기록"
+
+
+def test_shared_memory_store_is_visible_across_workers(tmp_path):
+    """같은 파일을 연 두 저장소(워커 두 개에 해당)가 세션을 주고받는다."""
+    path, overflow = str(tmp_path / "sessions.shm"), str(tmp_path / "overflow.db")
+    worker_a = SharedMemorySessionStore(TransferState, cache=SharedSessionCache(path, slots=64, slot_bytes=1024),
+                                        overflow=SessionOverflow(overflow))
+    worker_b = SharedMemorySessionStore(TransferState, cache=SharedSessionCache(path, slots=64, slot_bytes=1024),
+                                        overflow=SessionOverflow(overflow))
+
+    state, memory = worker_a.get_or_create("s1")
+    memory["raw_history"].append({"role": "user", "content": "엄마한테 3만원"})
+    worker_a.save_state("s1", TransferStateManager(state).apply({"operations": [
+        {"op": "set", "slot": "target", "value": "엄마"}, {"op": "set", "slot": "amount", "value": 30000},
+    ]}))
+
+    state_b, memory_b = worker_b.get_or_create("s1")
+    assert state_b.stage == Stage.READY and memory_b["raw_history"][0]["content"] == "엄마한테 3만원"
+    worker_b.save_state("s1", TransferStateManager(state_b).apply({"operations": [{"op": "cancel_flow"}]}))
+
+    assert worker_a.get_or_create("s1")[0].stage == Stage.CANCELLED
+    assert worker_a.get_or_create("s1")[0].stage == Stage.CANCELLED   # 변경 없음 → 로컬 사본
+    assert worker_a.metrics()["local_hits"] == 1
+
+    # 슬롯보다 큰 세션은 슬롯을 지우고 overflow로 — 다른 워커도 최신 값을 읽는다
+    big, _ = worker_b.get_or_create("s1")
+    big.task_queue = [{"target": f"수신자{i}", "amount": i + 1} for i in range(200)]
+    worker_b.save_state("s1", big)
+    assert len(worker_a.get_or_create("s1")[0].task_queue) == 200
+    assert worker_b.metrics()["oversize"] == 1 and worker_a.metrics()["overflow_hits"] == 1
+    assert worker_a.health() == {
+        "status": "degraded", "evicted_total": 0, "oversize_total": 1, "overflow_sessions": 1,
+    }
+
+    # 다시 슬롯에 들어가면 overflow 행은 지워지고 health가 돌아온다
+    worker_b.reset("s1")
+    assert worker_a.get_or_create("s1")[0].task_queue == []
+    assert worker_a.health()["status"] == "ok" and worker_a.health()["overflow_sessions"] == 0
+
+
+def test_shared_memory_store_spills_evicted_sessions_to_overflow(tmp_path):
+    """탐사 구간이 꽉 차 덮어쓴 세션도 overflow에서 그대로 읽힌다."""
+    path, overflow = str(tmp_path / "sessions.shm"), str(tmp_path / "overflow.db")
+    writer = SharedMemorySessionStore(TransferState, cache=SharedSessionCache(path, slots=2, slot_bytes=1024),
+                                      overflow=SessionOverflow(overflow))
+    reader = SharedMemorySessionStore(TransferState, cache=SharedSessionCache(path, slots=2, slot_bytes=1024),
+                                      overflow=SessionOverflow(overflow))
+    for i in range(3):
+        state, _ = writer.get_or_create(f"s{i}")
+        writer.save_state(f"s{i}", TransferStateManager(state).apply({"operations": [
+            {"op": "set", "slot": "amount", "value": 1000 + i},
+        ]}))
+    assert writer.health()["evicted_total"] == 1
+    assert [reader.get_or_create(f"s{i}")[0].slots.amount for i in range(3)] == [1000, 1001, 1002]
+
+    # 밀려난 세션을 다시 쓰면 슬롯으로 돌아오고 그 overflow 행은 지워진다 (다른 세션 하나가 대신 밀려남)
+    state, _ = reader.get_or_create("s0")
+    reader.save_state("s0", TransferStateManager(state).apply({"operations": [
+        {"op": "set", "slot": "amount", "value": 2000},
+    ]}))
+    assert writer.health()["evicted_total"] == 2 and writer.health()["overflow_sessions"] == 1
+    assert [writer.get_or_create(f"s{i}")[0].slots.amount for i in range(3)] == [2000, 1001, 1002]
+
+
+def test_stores_pin_binary_inner_codec(tmp_path, monkeypatch):
+    """binary의 내부 코덱은 파일 생성 시 고정 — 나중에 더 빠른 코덱이 설치돼도 기존 파일을 그대로 읽는다."""
+    from app.core import codec as codec_mod
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "STATE_CODEC", "binary")
+    log_path, cold_path = str(tmp_path / "sessions.db"), str(tmp_path / "cold.db")
+    log = EventSourcedSessionStore(state_factory=TransferState, path=log_path, snapshot_every=100)
+    cold = HibernatingSessionStore(state_factory=TransferState, path=cold_path, idle_sec=0, sweep_sec=3600)
+    assert log.codec_name.startswith("binary:") and cold.codec_name == log.codec_name
+
+    for store in (log, cold):
+        state, memory = store.get_or_create("s1")
+        memory["raw_history"].append({"role": "user", "content": "엄마한테"})
+        store.save_state("s1", TransferStateManager(state).apply({"operations": [
+            {"op": "set", "slot": "target", "value": "엄마"},
+        ]}))
+    cold.hibernate_idle()
+
+    class _NewlyInstalled:
+        name = "msgpack"
+
+        def encode(self, obj):
+            raise AssertionError("pinned stores must not use the dynamic binary codec")
+
+        decode = encode
+
+    monkeypatch.setitem(codec_mod._CODECS, "binary", _NewlyInstalled())
+    reopened = EventSourcedSessionStore(state_factory=TransferState, path=log_path)
+    assert reopened.get_or_create("s1")[0].slots.target == "엄마"
+    assert reopened.history("s1")[0]["diff"]
+    state, memory = cold.get_or_create("s1")
+    assert state.slots.target == "엄마" and memory["raw_history"][0]["content"] == "엄마한테"
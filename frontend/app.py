@@ -117,36 +117,22 @@ STAGE_KO = {
     "EXECUTED":    ("이체 완료",     "#43A047"),
     "FAILED":      ("이체 실패",     "#E53935"),
     "CANCELLED":   ("취소됨",        "#757575"),
+    "SUBMITTED":   ("접수됨",        "#00897B"),
     "UNSUPPORTED": ("처리 불가",     "#E53935"),
 }
 
 # ─── 금액 파싱/포맷 헬퍼 ─────────────────────────────────────────────────────
-import re as _re
-
-def _parse_korean_amount(text: str) -> int | None:
-    """한국어 금액 표현을 정수로 변환. 실패 시 None."""
-    text = text.strip().replace(",", "").replace("원", "").strip()
-    if not text:
-        return None
-    try:
-        return int(text)
-    except ValueError:
-        pass
-    total = 0
-    remaining = text
-    for unit, val in [("억", 100_000_000), ("천만", 10_000_000),
-                      ("백만", 1_000_000), ("만", 10_000), ("천", 1_000)]:
-        m = _re.search(rf"(\d+(?:\.\d+)?)\s*{unit}", remaining)
-        if m:
-            total += int(float(m.group(1)) * val)
-            remaining = remaining[:m.start()] + remaining[m.end():]
-    remaining = remaining.strip()
-    if remaining:
-        try:
-            total += int(remaining)
-        except ValueError:
-            pass
-    return total if total > 0 else None
+# 금액 해석은 백엔드 규칙(app/projects/transfer/logic.py)을 그대로 쓴다 — 두 벌이면 결과가 어긋난다.
+# logic.py는 표준 라이브러리만 쓰지만 패키지 __init__이 매니페스트(LLM 의존성)를 끌어오므로
+# 모듈 파일만 로드한다.
+import importlib.util as _importlib_util
+
+_logic_spec = _importlib_util.spec_from_file_location(
+    "transfer_logic", Path(__file__).resolve().parents[1] / "app" / "projects" / "transfer" / "logic.py",
+)
+_transfer_logic = _importlib_util.module_from_spec(_logic_spec)
+_logic_spec.loader.exec_module(_transfer_logic)
+_parse_korean_amount = _transfer_logic.parse_korean_amount
 
 
 def _format_display_amount(amount: int) -> str:
@@ -544,8 +530,12 @@ def _rebuild_batch_tasks(final_state: dict, prev_batch_tasks: list) -> list:
         prev_slots = prev_batch_tasks[i]["slots"] if i < len(prev_batch_tasks) else {}
         done_tasks.append({"slots": prev_slots, "status": "done"})
 
-    # 현재 태스크 (확인 대기)
-    current_task = [{"slots": slots, "status": "pending"}] if slots else []
+    # 현재 태스크 (확인 대기) — 일괄 확인이면 묶음 전체
+    bulk_tasks = meta.get("bulk_tasks")
+    if bulk_tasks:
+        current_task = [{"slots": t, "status": "pending"} for t in bulk_tasks]
+    else:
+        current_task = [{"slots": slots, "status": "pending"}] if slots else []
 
     # 대기 중인 태스크
     queued_tasks = [{"slots": t, "status": "pending"} for t in task_queue]
@@ -717,11 +707,16 @@ with chat_col:
                     with task_progress_ph:
                         render_task_progress(data)
 
-                    # 첫 번째 pending 태스크를 executing으로 전환
-                    for task in batch_tasks:
-                        if task.get("status") == "pending":
-                            task["status"] = "executing"
-                            break
+                    # 일괄 실행: 건별 결과(status)를 해당 태스크에 반영
+                    # 순차 실행: 첫 번째 pending 태스크를 executing으로 전환
+                    idx = data.get("index", 0) - 1
+                    if data.get("status") and 0 <= idx < len(batch_tasks):
+                        batch_tasks[idx]["status"] = data["status"]
+                    else:
+                        for task in batch_tasks:
+                            if task.get("status") == "pending":
+                                task["status"] = "executing"
+                                break
                     with batch_queue_ph:
                         render_batch_queue(batch_tasks)
 
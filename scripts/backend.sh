@@ -25,6 +25,8 @@ echo -e "  Reload   : ${YELLOW}$RELOAD${RESET}   Log: ${YELLOW}$LOG_LEVEL${RESET
 echo ""
 
 # ── 실행 ──────────────────────────────────────────────────────────────────────
+# uvicorn은 단일 프로세스. 멀티 코어는 SUPERVISOR_WORKERS=N 으로 워커 프로세스를 띄운다
+# (session_id 일관 해싱 라우팅 — app/core/orchestration/supervisor.py)
 RELOAD_FLAG=""
 [ "$RELOAD" = "true" ] && RELOAD_FLAG="--reload"
 